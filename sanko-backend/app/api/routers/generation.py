@@ -10,7 +10,7 @@ Supports:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, AsyncGenerator
 from uuid import UUID, uuid4
@@ -431,11 +431,14 @@ async def get_result(session_id: str):
     if not state.generated_presentation:
         raise HTTPException(status_code=500, detail="No presentation found")
     
-    return {
-        "session_id": session_id,
-        "presentation": state.generated_presentation.model_dump(),
-        "qa_report": state.qa_report.model_dump() if state.qa_report else None,
-    }
+    # Splice the pre-serialized models rather than having FastAPI walk the
+    # slide HTML through jsonable_encoder
+    body = b'{"session_id":%s,"presentation":%s,"qa_report":%s}' % (
+        json.dumps(session_id).encode(),
+        state.generated_presentation.to_json_bytes(),
+        state.qa_report.to_json_bytes() if state.qa_report else b"null",
+    )
+    return Response(content=body, media_type="application/json")
 
 
 # =============================================================================
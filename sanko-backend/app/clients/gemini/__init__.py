@@ -2,11 +2,12 @@
 
 from app.clients.gemini.client import GeminiInteractionsClient
 from app.clients.gemini.llm import GeminiLLM
-from app.clients.gemini.helpers import extract_token_usage, build_part
+from app.clients.gemini.helpers import extract_token_usage, build_part, get_shared_client
 
 __all__ = [
     "GeminiInteractionsClient",
     "GeminiLLM",
     "extract_token_usage",
     "build_part",
+    "get_shared_client",
 ]
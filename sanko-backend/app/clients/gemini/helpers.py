@@ -5,7 +5,9 @@ Token extraction, part building, and other utilities for Gemini API.
 Extracted from interactions.py for better modularity.
 """
 
+import functools
 from typing import Dict, Any
+from google import genai
 from google.genai import types
 
 from app.core.logging import get_logger
@@ -13,6 +15,17 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def get_shared_client(api_key: str) -> genai.Client:
+    """
+    Get the process-wide genai.Client for an API key.
+    
+    Tools that use the same key share one client (and its HTTPS connection
+    pool) instead of each opening their own.
+    """
+    return genai.Client(api_key=api_key)
+
+
 def extract_token_usage(response) -> Dict[str, int]:
     """
     Extract token usage from API response.
@@ -60,6 +60,25 @@ class RenderServiceClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    async def render_latex_batch(self, latex: List[str]) -> List[Dict[str, Any]]:
+        """
+        Render several LaTeX strings in one request via /render/batch.
+        
+        Args:
+            latex: LaTeX strings (with or without $/$$ delimiters), display mode
+            
+        Returns:
+            One dict per input, in order, shaped like render_latex()'s result
+        """
+        # /render/batch typesets its input as-is, so strip delimiters the
+        # way /render/latex does
+        result = await self.batch_render(latex=[_strip_math_delimiters(tex) for tex in latex])
+        items = (result.get("results") or {}).get("latex") if result.get("success") else None
+        if not items or len(items) != len(latex):
+            error = result.get("error", "Malformed batch response")
+            return [{"success": False, "error": error} for _ in latex]
+        return items
+    
     async def render_mermaid(self, diagram: str) -> Dict[str, Any]:
         """
         Render Mermaid diagram to SVG.
@@ -160,6 +179,16 @@ class RenderServiceClient:
         await self._client.aclose()
 
 
+def _strip_math_delimiters(latex: str) -> str:
+    """Remove surrounding $$...$$ or $...$ from a LaTeX string."""
+    tex = latex.strip()
+    if len(tex) >= 4 and tex.startswith("$$") and tex.endswith("$$"):
+        return tex[2:-2]
+    if len(tex) >= 2 and tex.startswith("$") and tex.endswith("$"):
+        return tex[1:-1]
+    return tex
+
+
 # Convenience function
 async def get_render_client() -> RenderServiceClient:
     """Get a configured render service client."""
@@ -0,0 +1,96 @@
+"""
+In-Process Caching Helpers
+
+Small building blocks shared by the agent tools to avoid repeating
+expensive network and model calls:
+- TTLCache: LRU cache whose entries expire after a fixed lifetime
+- SingleFlight: coalesces concurrent calls for the same key into one
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after ttl seconds.
+    
+    Instances are usually held at module or class level so every tool
+    instance (and every session) shares the same entries.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent identical async calls.
+    
+    The first caller for a key starts the work; callers arriving while it
+    is still running await the same task instead of repeating it. The
+    lookup and registration happen without an await in between, so no
+    lock is needed on a single event loop.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() for key, or join the call already in flight.
+        
+        Args:
+            key: Identity of the call (e.g. normalized query tuple)
+            fn: Zero-argument coroutine factory doing the real work
+        
+        Returns:
+            The shared result (exceptions are shared too)
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget(k, t))
+        # Shield so one caller's cancellation doesn't cancel the others
+        return await asyncio.shield(task)
+    
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+    
+    def __len__(self) -> int:
+        return len(self._inflight)
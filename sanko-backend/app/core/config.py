@@ -5,7 +5,7 @@ Loads environment variables and provides typed configuration settings.
 """
 
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 import os
 from dotenv import load_dotenv
 
@@ -29,9 +29,38 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = True
+    # Uvicorn worker processes outside debug mode (WORKERS). Sessions live in
+    # process memory, so more than 1 needs sticky routing per session.
+    workers: int = 1
     
     # Render Service
     render_service_url: str = "http://localhost:3001"
+    # Max concurrent slide render batches per flow (RENDER_CONCURRENCY)
+    render_concurrency: int = min(os.cpu_count() or 1, 8)
+    
+    # Largest image the vision tools will download (Gemini's inline limit)
+    max_image_bytes: int = 20 * 1024 * 1024
+    
+    # On-disk caches (rendered SVGs etc.); empty keeps caches in memory only
+    cache_dir: str = ".cache"
+    # Rendered SVGs on disk: older entries are dropped, then the oldest
+    # until the directory fits the size cap (checked at startup and
+    # periodically on write)
+    render_cache_max_bytes: int = 256 * 1024 * 1024
+    render_cache_max_age_s: float = 30 * 24 * 3600
+    
+    # Max concurrent Gemini requests per synthesized file (page chunks)
+    gemini_concurrency: int = 8
+    # How PDFs reach Gemini: extracted "text", raw PDF for "vision", or
+    # "auto" (text for born-digital PDFs, vision for scanned ones)
+    pdf_handling: Literal["text", "vision", "auto"] = "auto"
+    
+    # Synthesis: >0 parses uploaded files in a process pool of this size
+    # (CPU-bound PDF parsing), 0 keeps the default thread executor
+    synthesis_workers: int = 0
+    # Upper bound on one file's synthesis when driven from sync code (the
+    # process pool); 0 waits indefinitely
+    synthesis_timeout_s: float = 900.0
     
     # Optional Firebase (for JWT verification)
     firebase_project_id: Optional[str] = None
@@ -0,0 +1,104 @@
+"""
+Background Event Loop Thread
+
+A persistent asyncio loop running in a daemon thread, for sync entry
+points (CrewAI tool _run methods) that need to drive async code. Work is
+handed over with run_coroutine_threadsafe, so it doesn't matter whether
+the caller is already inside a running loop, and async clients created on
+the background loop (httpx pools etc.) survive across calls.
+
+Usage:
+    from app.core.loop_thread import get_tool_loop
+    result = get_tool_loop().run(some_coroutine(), timeout=30)
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Any, Coroutine, Optional
+
+
+class LoopThread:
+    """
+    Event loop in a daemon thread, started lazily on first use.
+    
+    Stopped (and joined) automatically at interpreter exit; a stopped
+    LoopThread starts a fresh loop if used again.
+    """
+    
+    def __init__(self, name: str, default_timeout: Optional[float] = None):
+        self.name = name
+        self.default_timeout = default_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running background loop (started on first access)."""
+        loop = self._loop
+        if loop is None:
+            loop = self._start()
+        return loop
+    
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._serve, args=(loop,), name=self.name, daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                atexit.register(self.stop)
+            return self._loop
+    
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+    
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Schedule a coroutine on the background loop without waiting."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the background loop and block for its result."""
+        return self.submit(coro).result(timeout or self.default_timeout)
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the loop and join its thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+        atexit.unregister(self.stop)
+    
+    @staticmethod
+    async def _shutdown() -> None:
+        """Cancel work still pending on the loop, then stop it."""
+        current = asyncio.current_task()
+        pending = [t for t in asyncio.all_tasks() if t is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        asyncio.get_running_loop().stop()
+
+
+# Upper bound on how long a sync tool _run waits for its coroutine
+TOOL_CALL_TIMEOUT_S = 120.0
+
+# Shared by the agent tool wrappers, so their async clients live on one loop
+_tool_loop = LoopThread("agent-tools-loop", default_timeout=TOOL_CALL_TIMEOUT_S)
+
+
+def get_tool_loop() -> LoopThread:
+    """Get the background loop shared by the agent tools."""
+    return _tool_loop
@@ -135,7 +135,7 @@ def create_generation_task(
         f"Slide {s.order}: {s.title} (template: {s.template_type})"
         f"\n  - Has equation SVG: {bool(s.equation_svg)}"
         f"\n  - Has diagram SVG: {bool(s.diagram_svg)}"
-        f"\n  - Citations: {len(s.citations)}"
+        f"\n  - Citations: {len(s.citation_ids)}"
         f"\n  - Image: {bool(s.image_url)}"
         for s in refined_content.slides
     ])
@@ -100,11 +100,13 @@ For each slide with image_query:
 
 Return a RefinedContent object with:
 - presentation_title, target_audience, theme_id, citation_style
+- citation_pool: Dict[str, CitationMetadata], each citation once, keyed by
+  its DOI (or arXiv id / URL when there is no DOI)
 - slides: List of RefinedSlide, each with:
   - order, title, content_type, bullet_points
   - equation_svg, equation_latex (if applicable)
   - diagram_svg, diagram_mermaid (if applicable)
-  - citations: List[CitationMetadata]
+  - citation_ids: List[str] (keys into citation_pool)
   - formatted_citations: List[str]
   - image_url, image_alt, image_caption
   - template_type
@@ -0,0 +1,160 @@
+"""
+Planner Micro-Batching
+
+Coalesces Planner requests from concurrent sessions into small batches.
+Prompts submitted within a short window (or until the batch is full) are
+dispatched together through a single Crew via kickoff_for_each_async, so
+agent/crew construction is shared and the LLM calls go out concurrently
+instead of one blocking kickoff per session.
+
+Each session's prompt still runs as its own task - prompts are never
+merged into one LLM request, so session data can't leak across decks.
+
+Usage:
+    from app.crew.flows.planner_batcher import planner_batcher
+    text = await planner_batcher.submit(prompt)
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# Runs a batch of prompts and returns one raw result string per prompt
+BatchRunner = Callable[[List[str]], Awaitable[List[str]]]
+
+
+async def kickoff_planner_batch(prompts: List[str]) -> List[str]:
+    """
+    Run a batch of planner prompts through one Planner crew.
+    
+    Args:
+        prompts: Fully-built planner prompts, one per session
+    
+    Returns:
+        Raw agent output for each prompt, in the same order
+    """
+    from crewai import Crew, Task
+    from app.crew.agents.planner import create_planner_agent
+    
+    planner = create_planner_agent()
+    task = Task(
+        description="{planner_prompt}",
+        expected_output="PlannedContent JSON with full bullet points for each slide",
+        agent=planner,
+    )
+    crew = Crew(agents=[planner], tasks=[task])
+    
+    outputs = await crew.kickoff_for_each_async(
+        inputs=[{"planner_prompt": prompt} for prompt in prompts]
+    )
+    return [str(output) for output in outputs]
+
+
+class PlannerBatcher:
+    """
+    Dynamic micro-batcher for Planner LLM calls.
+    
+    A background task drains an asyncio.Queue of (prompt, future) pairs,
+    flushing when max_batch_size prompts are waiting or batch_wait_timeout_s
+    has passed since the first one arrived. Batches are dispatched without
+    blocking the drain loop, so the next batch can fill while one runs.
+    """
+    
+    def __init__(
+        self,
+        runner: Optional[BatchRunner] = None,
+        max_batch_size: int = 8,
+        batch_wait_timeout_s: float = 0.05,
+    ):
+        self._runner = runner or kickoff_planner_batch
+        self.max_batch_size = max_batch_size
+        self.batch_wait_timeout_s = batch_wait_timeout_s
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Set[asyncio.Task] = set()
+    
+    async def submit(self, prompt: str) -> str:
+        """
+        Queue a planner prompt and wait for its result.
+        
+        Args:
+            prompt: Planner prompt for one session
+        
+        Returns:
+            Raw agent output for this prompt
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((prompt, future))
+        return await future
+    
+    def _ensure_worker(self) -> None:
+        """Start (or restart) the drain task on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._drain())
+    
+    async def _drain(self) -> None:
+        """Collect queued prompts into batches and dispatch them."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.batch_wait_timeout_s
+            
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            task = self._loop.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Run one batch and resolve each caller's future."""
+        logger.info(f"Planner batch dispatch: {len(batch)} prompt(s)")
+        
+        try:
+            results = await self._runner([prompt for prompt, _ in batch])
+            if len(results) != len(batch):
+                # Zipping a short result list would leave callers waiting forever
+                raise RuntimeError(f"Planner runner returned {len(results)} result(s) for {len(batch)} prompt(s)")
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f"Planner batch failed: {e}")
+                self._resolve(batch[0][1], e)
+                return
+            # One bad prompt or provider error must not fail every session
+            # in the batch: rerun each prompt alone so only its own caller
+            # sees its failure
+            logger.warning(f"Planner batch of {len(batch)} failed, retrying prompts individually: {e}")
+            await asyncio.gather(*(self._dispatch([item]) for item in batch))
+            return
+        
+        for (_, future), result in zip(batch, results):
+            self._resolve(future, result)
+    
+    @staticmethod
+    def _resolve(future: asyncio.Future, outcome) -> None:
+        """Set a caller's result, or its exception if outcome is one."""
+        if future.done():
+            return
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
+
+# Shared batcher used by SlideGenerationFlow._run_planner
+planner_batcher = PlannerBatcher()
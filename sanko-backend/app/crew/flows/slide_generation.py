@@ -21,13 +21,22 @@ Architecture:
 from crewai.flow.flow import Flow, listen, router, start
 from crewai import Crew, Task
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List, Callable
+import jinja2
+import numpy as np
+from google.genai import types
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from uuid import UUID, uuid4
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
 from enum import Enum
 import asyncio
+import concurrent.futures
+import hashlib
+import io
 import json
 import os
+import re
 
 from app.models.schemas import (
     OrderForm,
@@ -40,28 +49,21 @@ from app.models.schemas import (
     RefinedSlide,
     GeneratedPresentation,
     GeneratedSlide,
-    QAResult,
     QAReport,
     CitationMetadata,
     GatheredInfo,
     ClarificationMessage,
     KnowledgeBase,
 )
-from app.crew.agents.clarifier import create_clarifier_agent
-from app.crew.agents.planner import create_planner_agent
-from app.crew.agents.refiner import create_refiner_agent
-from app.crew.agents.generator import create_generator_agent
-from app.crew.agents.visual_qa import create_visual_qa_agent
-from app.crew.agents.helper import (
-    create_helper_agent,
-    FailureContext,
-    HelperDecision,
-    RetryBudget,
-    build_guardrail_prompt,
-)
-from app.crew.tools.render_service_tool import get_render_tool
+# Agent factories and the render tool are imported where they're used, so
+# synthesis/outline-only workers don't load every agent and client module
+from app.crew.agents.helper import RetryBudget
+from app.clients.gemini.helpers import get_shared_client
 from app.crew.tools.synthesis_tool import SynthesisTool
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.crew.flows.planner_batcher import planner_batcher
+from app.crew.qa.results import QAResultsSoA
 from app.crew.flows.metrics import (
     MetricsCollector,
     TokenUsage,
@@ -70,6 +72,298 @@ from app.crew.flows.metrics import (
 
 logger = get_logger(__name__)
 
+# Optional RE2 engine: linear-time matching and multi-pattern sets.
+# None of the clarifier patterns use backreferences or lookarounds, so
+# they compile identically under both engines.
+try:
+    import re2
+    _regex = re2
+except ImportError:  # pragma: no cover - depends on environment
+    re2 = None
+    _regex = re
+
+# Optional orjson for parsing agent JSON (its JSONDecodeError subclasses
+# json.JSONDecodeError, so except clauses work with either parser)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    _json_loads = json.loads
+
+
+class _FirstMatchTable:
+    """
+    Ordered (pattern, value) table that returns the value of the first
+    pattern (in table order) found anywhere in the text.
+    
+    With RE2 available, all patterns are scanned in a single pass via
+    re2.Set; otherwise each compiled pattern is tried in turn.
+    """
+    
+    def __init__(self, table: List[tuple]):
+        self._values = [value for _, value in table]
+        self._patterns = [_regex.compile(pattern) for pattern, _ in table]
+        self._set = None
+        if re2 is not None:
+            self._set = re2.Set.SearchSet()
+            for pattern, _ in table:
+                self._set.Add(pattern)
+            self._set.Compile()
+    
+    def first(self, text: str) -> Optional[Any]:
+        """Return the value for the first matching pattern, or None."""
+        if self._set is not None:
+            hits = self._set.Match(text)
+            return self._values[min(hits)] if hits else None
+        for pattern, value in zip(self._patterns, self._values):
+            if pattern.search(text):
+                return value
+        return None
+
+
+# =============================================================================
+# Clarifier Heuristic Patterns (compiled once, reused every turn)
+# =============================================================================
+
+# Agent response asks the user to confirm the gathered summary
+_CONFIRM_REQ_RE = _regex.compile(
+    r"(?i)does this look correct"
+    r"|is this correct"
+    r"|does this (?:look|seem) (?:right|good)"
+    r"|can you confirm"
+    r"|please confirm"
+    r"|ready to finalize"
+    r"|if (?:this|everything) looks (?:good|correct)"
+    r"|let me (?:know|confirm)"
+)
+
+# User message confirms the summary
+_USER_CONFIRM_RE = _regex.compile(
+    r"^yes\b"
+    r"|^yeah\b"
+    r"|^yep\b"
+    r"|^correct\b"
+    r"|looks? (?:good|great|correct|right)"
+    r"|that(?:'s| is) (?:correct|right|good)"
+    r"|^perfect\b"
+    r"|go ahead"
+    r"|finalize"
+    r"|sounds? (?:good|great|correct)"
+    r"|^lgtm\b"
+)
+
+# User message delegates a decision to the agent
+_DECIDE_RE = _regex.compile(
+    r"decide.*(?:yourself|for me|it yourself)"
+    r"|you (?:can |should )?(?:choose|pick|decide)"
+    r"|(?:pick|choose).*(?:yourself|for me)"
+    r"|up to you"
+    r"|your (?:choice|decision|call)"
+)
+
+# (pattern, audience) - first listed match wins
+_AUDIENCE_TABLE = _FirstMatchTable([
+    (r"(?:university |college )?students", "university students"),
+    (r"fellow students?", "fellow students"),
+    (r"professors?|faculty|academics?", "academics/professors"),
+    (r"executives?|management|c-suite", "executives"),
+    (r"(?:business )?professionals?", "business professionals"),
+    (r"engineers?|developers?|technical", "technical professionals"),
+    (r"general (?:public|audience)", "general public"),
+    (r"clients?|customers?", "clients"),
+    (r"investors?|stakeholders?", "investors/stakeholders"),
+])
+
+# Explicit audience statements ("presenting to ...", "for ...")
+_AUDIENCE_EXPLICIT_RE = _regex.compile(r"(target audience|presenting to|for)\s*(?:is\s*|:?\s*)([^,.]+)")
+
+# Slide count - group 1 is the number; tried in order
+_SLIDE_COUNT_RES = [
+    _regex.compile(r"(\d+)\s*slides?"),
+    _regex.compile(r"around\s*(\d+)"),
+    _regex.compile(r"about\s*(\d+)\s*slides?"),
+    _regex.compile(r"(\d+)\s*-\s*\d+\s*slides?"),  # Range like "8-10 slides"
+]
+
+# (pattern, citation style) - first listed match wins
+_CITATION_TABLE = _FirstMatchTable([
+    (r"\bapa\b", "apa"),
+    (r"\bieee\b", "ieee"),
+    (r"\bharvard\b", "harvard"),
+    (r"\bchicago\b", "chicago"),
+    (r"\bmla\b", "apa"),  # Default to APA for MLA requests
+])
+
+# (pattern, theme) - first listed match wins
+_THEME_TABLE = _FirstMatchTable([
+    (r"\bdark\s*(?:mode|theme)?\b", "dark"),
+    (r"\bminimal(?:ist)?\b", "minimal"),
+    (r"\bmodern\b", "modern"),
+    (r"\bacademic\b", "academic"),
+    (r"\bprofessional\b", "modern"),
+    (r"\bclean\b", "minimal"),
+])
+
+# Topic/title phrases - group 1 is the topic; tried in order
+_TOPIC_RES = [
+    _regex.compile(r"(?:presentation |talk |slides? )?(?:about|on|regarding|covering)\s+[\"']?([^\"'\n.]+)[\"']?"),
+    _regex.compile(r"topic\s*(?:is|:)\s*[\"']?([^\"'\n.]+)[\"']?"),
+    _regex.compile(r"title\s*(?:is|should be|:)\s*[\"']?([^\"'\n.]+)[\"']?"),
+]
+
+# Focus-area phrases - group 1 is the focus item
+_FOCUS_RES = [
+    _regex.compile(r"(?:focus on|emphasize|cover|include)\s+([^,.]+)"),
+    _regex.compile(r"(?:specifically|mainly|primarily)\s+([^,.]+)"),
+]
+
+# Phrase tables for substring heuristics in _extract_info_from_message
+_REFERENCE_WORDS = ("reference", "citation")
+_REFS_LAST_WORDS = ("last slide", "end", "at the end", "final slide")
+_REFS_DISTRIBUTED_WORDS = ("each slide", "distributed", "on relevant")
+_DETAILED_WORDS = ("detailed", "thorough", "in-depth", "comprehensive")
+_CONCISE_WORDS = ("concise", "brief", "short", "bullet", "minimal text")
+_VISUAL_WORDS = ("visual", "images", "diagrams", "graphics")
+_ACADEMIC_WORDS = ("academic", "scholarly", "formal", "research")
+_CASUAL_WORDS = ("casual", "informal", "relaxed", "friendly")
+_TECHNICAL_WORDS = ("technical", "engineering", "scientific")
+_PERSUASIVE_WORDS = ("persuasive", "convincing", "pitch", "sell")
+
+# (label, GatheredInfo attribute, formatter) rows for _format_gathered_info
+_GATHERED_FIELDS = (
+    ("Title/Topic", "title", str),
+    ("Target Audience", "audience", str),
+    ("Number of Slides", "slide_count", str),
+    ("Focus Areas", "focus_areas", ", ".join),
+    ("Key Topics", "key_topics", ", ".join),
+    ("Emphasis Style", "emphasis_style", str),
+    ("Tone", "tone", str),
+    ("Citation Style", "citation_style", str),
+    ("References Placement", "references_placement", str),
+    ("Theme", "theme", str),
+    ("Special Requests", "special_requests", str),
+)
+
+
+# Placeholder description -> LaTeX for _placeholder_to_latex
+_LATEX_TABLE = _FirstMatchTable([
+    (r"(?i)linear regression", r"y = \beta_0 + \beta_1 x + \epsilon"),
+    (r"(?i)quadratic", r"ax^2 + bx + c = 0"),
+])
+_LATEX_DEFAULT = r"f(x) = \sum_{i=1}^{n} x_i"
+
+# Structural JSON tokens: escape pairs are matched as a unit so an escaped
+# quote inside a string never toggles string state
+_JSON_TOKEN_RE = re.compile(r'\\.|[{}"]', re.DOTALL)
+
+
+def _find_json_span(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate the first balanced JSON object in text.
+    
+    Single pass over the structural tokens only, tracking brace depth and
+    whether we're inside a string (braces in strings don't count).
+    
+    Args:
+        text: Raw agent output, possibly with prose around the JSON
+        
+    Returns:
+        (start, end) slice bounds of the object, or None if unbalanced
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token == '"':
+            in_string = not in_string
+        elif in_string or len(token) == 2:
+            continue
+        elif token == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return start, match.end()
+    return None
+
+
+# Static Planner instructions. Kept byte-identical across sessions and placed
+# before any per-session text so the prompt prefix is cacheable.
+_PLANNER_INSTRUCTIONS = """Generate FULL content for the presentation described below.
+
+## Instructions
+1. Write 3-5 substantial bullet points per slide (not placeholders!)
+2. For slides needing citations, add `citation_queries` (search terms)
+3. For slides needing diagrams, add `diagram_placeholder` (description)
+4. For slides needing equations, add `equation_placeholder` (LaTeX description)
+5. Add speaker_notes only if Speaker Notes Requested is True
+
+Return a JSON object with 'slides' array containing PlannedSlide objects."""
+
+
+# Slide HTML template, compiled once at import. Autoescaping covers all
+# agent text; rendered SVGs are trusted markup and marked |safe.
+_SLIDE_ENV = jinja2.Environment(autoescape=True, auto_reload=False)
+_SLIDE_TEMPLATE = _SLIDE_ENV.from_string("""\
+<div class="slide slide-{{ slide.order }}" data-template="{{ slide.template_type }}">
+    <div class="slide-header">
+        <h1 class="slide-title">{{ slide.title }}</h1>
+    </div>
+    <div class="slide-content">
+        <ul>{% for point in slide.bullet_points %}{% if not loop.first %}
+{% endif %}<li>{{ point }}</li>{% endfor %}</ul>
+        {%- if slide.equation_svg %}<div class="equation">{{ slide.equation_svg | safe }}</div>{% endif %}
+        {%- if slide.diagram_svg %}<div class="diagram">{{ slide.diagram_svg | safe }}</div>{% endif %}
+        {%- if slide.image_url %}<img src="{{ slide.image_url }}" alt="{{ slide.image_alt or '' }}">{% endif %}
+    </div>
+</div>""")
+
+
+# =============================================================================
+# Synthesis Process Pool
+# =============================================================================
+
+# PDF parsing is CPU-bound, so threads serialize on the GIL. When
+# SYNTHESIS_WORKERS > 0 files are synthesized in a process pool instead.
+_PDF_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _synthesize_path(path: str):
+    """Synthesize one file (top-level so the process pool can pickle it)."""
+    return SynthesisTool()._run(path)
+
+
+def get_pdf_pool() -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    """
+    Get the synthesis process pool, creating it on first use.
+    
+    Created lazily (never at import) so spawned workers re-importing this
+    module don't recursively start pools of their own.
+    
+    Returns:
+        The shared pool, or None when SYNTHESIS_WORKERS is 0 (thread mode)
+    """
+    global _PDF_POOL
+    if _PDF_POOL is None and settings.synthesis_workers > 0:
+        _PDF_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=settings.synthesis_workers,
+        )
+        logger.info(f"Started synthesis process pool ({settings.synthesis_workers} workers)")
+    return _PDF_POOL
+
+
+def shutdown_pdf_pool() -> None:
+    """Shut down the synthesis process pool if it was started."""
+    global _PDF_POOL
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+        _PDF_POOL = None
+
 
 # =============================================================================
 # Flow Status Enum
@@ -92,6 +386,21 @@ class FlowStatus(str, Enum):
 # Flow State (Database-backed)
 # =============================================================================
 
+# FlowState field -> playground_sessions column
+_DB_FIELD_COLUMNS = {
+    "status": "status",
+    "current_stage": "current_stage",
+    "order_form": "order_form",
+    "skeleton": "skeleton",
+    "planned_content": "planned_content",
+    "refined_content": "refined_content",
+    "generated_presentation": "generated_slides",
+    "knowledge_base": "knowledge_base",
+    "qa_loops": "qa_loops_count",
+    "helper_attempts": "helper_retries",
+    "qa_report": "final_qa_score",
+}
+
 class FlowState(BaseModel):
     """
     State passed between flow steps.
@@ -153,21 +462,20 @@ class FlowState(BaseModel):
         arbitrary_types_allowed = True
         use_enum_values = True
     
+    def _db_value(self, field: str) -> Any:
+        """Serialize a single field to its database column value."""
+        if field == "helper_attempts":
+            return sum(self.helper_attempts.values())
+        if field == "qa_report":
+            return self.qa_report.average_score if self.qa_report else None
+        value = getattr(self, field)
+        return value.model_dump() if isinstance(value, BaseModel) else value
+    
     def to_db_dict(self) -> Dict[str, Any]:
         """Convert to dict for database storage."""
         return {
             "session_id": self.session_id,
-            "status": self.status,
-            "current_stage": self.current_stage,
-            "order_form": self.order_form.model_dump() if self.order_form else None,
-            "skeleton": self.skeleton.model_dump() if self.skeleton else None,
-            "planned_content": self.planned_content.model_dump() if self.planned_content else None,
-            "refined_content": self.refined_content.model_dump() if self.refined_content else None,
-            "generated_slides": self.generated_presentation.model_dump() if self.generated_presentation else None,
-            "knowledge_base": self.knowledge_base.model_dump() if self.knowledge_base else None,
-            "qa_loops_count": self.qa_loops,
-            "helper_retries": sum(self.helper_attempts.values()),
-            "final_qa_score": self.qa_report.average_score if self.qa_report else None,
+            **{column: self._db_value(field) for field, column in _DB_FIELD_COLUMNS.items()},
             "updated_at": datetime.utcnow(),
         }
     
@@ -209,14 +517,24 @@ class FlowEventEmitter:
     - stage_start: When a stage begins
     - stage_complete: When a stage completes
     - slide_progress: When a slide is generated (for async gen)
+    - file_progress: When a file finishes synthesis
+    - progress_batch: Coalesced progress events (see batch())
+    - token: When a streamed LLM response delta arrives
     - error: When an error occurs
     - pause: When awaiting user input
     - complete: When flow finishes
     """
     
+    # Progress events that may be coalesced inside batch()
+    BATCHABLE_EVENTS = frozenset({"slide_progress", "file_progress"})
+    batch_limit: int = 20          # Flush after this many buffered events
+    batch_interval: float = 0.05   # ...or this many seconds after the first
+    
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.listeners: List[Callable] = []
+        self._batch: Optional[List[Dict[str, Any]]] = None
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
     
     def add_listener(self, callback: Callable):
         """Add an event listener."""
@@ -231,6 +549,20 @@ class FlowEventEmitter:
             **data,
         }
         logger.debug(f"Event: {event_type} - {data}")
+        
+        if self._batch is not None:
+            if event_type in self.BATCHABLE_EVENTS:
+                self._buffer(event)
+                if len(self._batch) >= self.batch_limit:
+                    await self._flush_batch()
+                return
+            # Keep ordering: buffered progress goes out before this event
+            await self._flush_batch()
+        
+        await self._dispatch(event)
+    
+    async def _dispatch(self, event: Dict[str, Any]):
+        """Deliver a single event to all listeners."""
         for listener in self.listeners:
             try:
                 if asyncio.iscoroutinefunction(listener):
@@ -240,12 +572,66 @@ class FlowEventEmitter:
             except Exception as e:
                 logger.error(f"Event listener error: {e}")
     
+    def _buffer(self, event: Dict[str, Any]):
+        """Add a progress event to the batch, arming the flush timer."""
+        self._batch.append(event)
+        if self._flush_timer is None:
+            loop = asyncio.get_running_loop()
+            self._flush_timer = loop.call_later(
+                self.batch_interval,
+                lambda: asyncio.ensure_future(self._flush_batch()),
+            )
+    
+    async def _flush_batch(self):
+        """Send buffered progress events as one progress_batch event."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._batch:
+            return
+        events, self._batch = self._batch, []
+        await self._dispatch({
+            "type": "progress_batch",
+            "session_id": self.session_id,
+            "timestamp": datetime.utcnow().isoformat(),
+            "events": events,
+        })
+    
+    @asynccontextmanager
+    async def batch(self):
+        """
+        Coalesce bursty progress events into progress_batch frames.
+        
+        Inside the block, slide/file progress is buffered and flushed every
+        batch_interval seconds or batch_limit events; all other events (stage
+        transitions, errors) are still sent immediately.
+        """
+        if self._batch is not None:
+            # Already batching (nested block)
+            yield self
+            return
+        
+        self._batch = []
+        try:
+            yield self
+        finally:
+            await self._flush_batch()
+            self._batch = None
+    
     async def stage_start(self, stage: str):
         await self.emit("stage_start", {"stage": stage})
     
     async def stage_complete(self, stage: str, result: Any = None):
         await self.emit("stage_complete", {"stage": stage, "result": result})
     
+    async def file_progress(self, file_name: str, index: int, total: int, status: str = "completed"):
+        await self.emit("file_progress", {
+            "file_name": file_name,
+            "index": index,
+            "total": total,
+            "status": status,
+        })
+    
     async def slide_progress(self, slide_order: int, total: int, status: str = "completed"):
         await self.emit("slide_progress", {
             "slide_order": slide_order,
@@ -253,6 +639,9 @@ class FlowEventEmitter:
             "status": status,
         })
     
+    async def token(self, stage: str, delta: str):
+        await self.emit("token", {"stage": stage, "delta": delta})
+    
     async def pause_for_review(self, review_type: str, data: Dict):
         await self.emit("pause", {"review_type": review_type, **data})
     
@@ -279,6 +668,9 @@ class SlideGenerationFlow:
     - Proper agent execution
     """
     
+    # Per-session bound on cached clarifier replies
+    _CLARIFIER_CACHE_SIZE = 32
+    
     def __init__(
         self,
         session_id: Optional[str] = None,
@@ -288,6 +680,10 @@ class SlideGenerationFlow:
         self.emitter = event_emitter or FlowEventEmitter(self.state.session_id)
         self.retry_tracker = RetryBudget()
         self.metrics = MetricsCollector.get_or_create(self.state.session_id)
+        # Caps concurrent per-slide render batches from the parallel refiner
+        self._render_sem = asyncio.Semaphore(settings.render_concurrency)
+        # Clarifier replies keyed by a hash of the full rendered prompt (LRU)
+        self._clarifier_cache: "OrderedDict[str, str]" = OrderedDict()
     
     # =========================================================================
     # Stage 0: Synthesis (Pre-processing)
@@ -309,27 +705,38 @@ class SlideGenerationFlow:
         self.state.status = FlowStatus.SYNTHESIZING
         self.state.current_stage = "synthesis"
         
-        synthesis_tool = SynthesisTool()
+        pool = get_pdf_pool()
+        synthesis_tool = SynthesisTool() if pool is None else None
         
         # Combine results from all files
         all_sections = []
-        combined_summary_parts = []
+        summary_buf = io.StringIO()
         
-        for path in file_paths:
-            logger.info(f"Synthesizing file: {path}")
-            # Wrap the tool call in a thread pool since it's blocking
-            loop = asyncio.get_event_loop()
-            kb = await loop.run_in_executor(None, synthesis_tool._run, path)
-            
-            if isinstance(kb, str) and kb.startswith("Error"):
-                logger.error(f"Synthesis failed for {path}: {kb}")
-                continue
+        async with self.emitter.batch():
+            for index, path in enumerate(file_paths, start=1):
+                logger.info(f"Synthesizing file: {path}")
+                # CPU-bound parsing: process pool if configured, otherwise the
+                # tool's own worker threads
+                try:
+                    if pool is not None:
+                        loop = asyncio.get_running_loop()
+                        kb = await loop.run_in_executor(pool, _synthesize_path, path)
+                    else:
+                        kb = await synthesis_tool._arun(path)
+                except Exception as e:
+                    kb = f"Error: {e}"
                 
-            all_sections.extend(kb.sections)
-            combined_summary_parts.append(f"Content from {os.path.basename(path)}: {kb.summary}")
+                if isinstance(kb, str) and kb.startswith("Error"):
+                    logger.error(f"Synthesis failed for {path}: {kb}")
+                    await self.emitter.file_progress(os.path.basename(path), index, len(file_paths), "failed")
+                    continue
+                    
+                all_sections.extend(kb.sections)
+                summary_buf.write(f"Content from {os.path.basename(path)}: {kb.summary}\n\n")
+                await self.emitter.file_progress(os.path.basename(path), index, len(file_paths))
             
         final_kb = KnowledgeBase(
-            summary="\n\n".join(combined_summary_parts),
+            summary=summary_buf.getvalue().rstrip("\n"),
             sections=all_sections
         )
         
@@ -419,9 +826,6 @@ class SlideGenerationFlow:
                 "message": "Requirements confirmed! Ready to generate your presentation.",
             }
         
-        # Create clarifier agent
-        clarifier = create_clarifier_agent()
-        
         # Build the full context for the agent
         conversation_context = self._format_conversation_history()
         gathered_context = self._format_gathered_info()
@@ -430,25 +834,27 @@ class SlideGenerationFlow:
         
         # Determine what stage we're in
         if info.needs_confirmation():
+            stage_tag = "confirmation"
             stage_instruction = """## CURRENT STAGE: CONFIRMATION REQUIRED
 All essential info is gathered. You MUST now:
 1. Summarize everything in a readable format
 2. Ask: "Does this look correct? If so, I'll finalize your presentation requirements."
 DO NOT output JSON yet - wait for user confirmation!"""
         elif not missing_required:
+            stage_tag = "optional"
             stage_instruction = f"""## CURRENT STAGE: GATHER OPTIONAL INFO
 Required info is complete. Ask about ONE of these optional fields:
 {self._format_list(missing_optional[:2]) if missing_optional else "None left"}
 Ask ONLY ONE question. Be conversational."""
         else:
+            stage_tag = "required"
             stage_instruction = f"""## CURRENT STAGE: GATHER REQUIRED INFO
 Still need these required fields - ask about ONE:
 {self._format_list(missing_required)}
 Ask ONLY ONE question. Do not combine questions."""
         
-        # Create task with FULL CONTEXT
-        task = Task(
-            description=f"""You are continuing a conversation to gather presentation requirements.
+        # Render the prompt with FULL CONTEXT
+        description = f"""You are continuing a conversation to gather presentation requirements.
 
 ## FULL CONVERSATION HISTORY
 {conversation_context}
@@ -469,18 +875,31 @@ Ask ONLY ONE question. Do not combine questions."""
 - For confirmation: Summarize info + ask "Does this look correct?"
 - For completion: Output OrderForm JSON with exact field names
 
-Be friendly and efficient. ONE question at a time!""",
-            expected_output="Either ONE follow-up question, a confirmation summary, OR a complete OrderForm JSON",
-            agent=clarifier,
-        )
+Be friendly and efficient. ONE question at a time!"""
         
         try:
-            # Execute the agent
-            crew = Crew(agents=[clarifier], tasks=[task])
-            result = crew.kickoff()
-            
-            # Parse the response
-            response_text = str(result)
+            # Reuse the reply when this session sees the same message from the
+            # same gathered state (repeated "decide yourself", replayed turns),
+            # otherwise execute the agent, streaming tokens as they arrive
+            cache_key = hashlib.blake2b(json.dumps(
+                {"gi": info.model_dump(mode="json"), "stage": stage_tag, "msg": user_message},
+                sort_keys=True,
+            ).encode(), digest_size=16).hexdigest()
+            response_text = self._clarifier_cache.get(cache_key)
+            if response_text is not None:
+                logger.info("Clarifier cache hit - skipping agent call")
+                self._clarifier_cache.move_to_end(cache_key)
+                await self.emitter.token("clarifier", response_text)
+            else:
+                from app.crew.agents.clarifier import create_clarifier_agent
+                clarifier = create_clarifier_agent()
+                task = Task(
+                    description=description,
+                    expected_output="Either ONE follow-up question, a confirmation summary, OR a complete OrderForm JSON",
+                    agent=clarifier,
+                )
+                response_text = await self._stream_clarifier_response(clarifier, task)
+                self._store_clarifier_response(cache_key, response_text)
             
             # Add assistant response to history
             self.state.conversation_history.append(ClarificationMessage(
@@ -489,19 +908,7 @@ Be friendly and efficient. ONE question at a time!""",
             ))
             
             # Detect if this is a confirmation request from the agent
-            import re
-            confirmation_request_patterns = [
-                r"does this look correct",
-                r"is this correct",
-                r"does this (look|seem) (right|good)",
-                r"can you confirm",
-                r"please confirm",
-                r"ready to finalize",
-                r"if (this|everything) looks (good|correct)",
-                r"let me (know|confirm)",
-            ]
-            response_lower = response_text.lower()
-            if any(re.search(p, response_lower) for p in confirmation_request_patterns):
+            if _CONFIRM_REQ_RE.search(response_text):
                 self.state.gathered_info.confirmation_sent = True
                 logger.info(f"Detected confirmation request in agent response. Set confirmation_sent=True")
             
@@ -551,6 +958,51 @@ Be friendly and efficient. ONE question at a time!""",
             await self.emitter.error(str(e), "clarifier")
             raise
     
+    def _store_clarifier_response(self, key: str, response_text: str) -> None:
+        """Cache a clarifier reply, evicting the least recently used when full."""
+        self._clarifier_cache[key] = response_text
+        self._clarifier_cache.move_to_end(key)
+        while len(self._clarifier_cache) > self._CLARIFIER_CACHE_SIZE:
+            self._clarifier_cache.popitem(last=False)
+    
+    async def _stream_clarifier_response(self, agent, task: Task) -> str:
+        """
+        Run the clarifier and stream its reply through the emitter.
+        
+        The clarifier has no tools, so its model can be called directly in
+        streaming mode on the shared genai client instead of waiting on a
+        full Crew kickoff. Each delta is emitted as a "token" event;
+        order-form detection runs on the assembled text afterwards. Falls
+        back to a crew kickoff if the stream fails at any point.
+        """
+        system_instruction = f"You are {agent.role}. {agent.backstory}\nYour personal goal is: {agent.goal}"
+        prompt = f"{task.description}\n\nThis is the expected criteria for your final answer: {task.expected_output}"
+        
+        try:
+            if not settings.gemini_api_key:
+                raise RuntimeError("GEMINI_API_KEY not configured")
+            client = get_shared_client(settings.gemini_api_key)
+            stream = await client.aio.models.generate_content_stream(
+                model=agent.llm.model.removeprefix("gemini/"),
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    system_instruction=system_instruction,
+                    temperature=agent.llm.temperature,
+                ),
+            )
+            
+            chunks = []
+            async for chunk in stream:
+                delta = chunk.text
+                if delta:
+                    chunks.append(delta)
+                    await self.emitter.token("clarifier", delta)
+            return "".join(chunks)
+        except Exception as e:
+            logger.warning(f"Clarifier streaming failed, using crew kickoff: {e}")
+            crew = Crew(agents=[agent], tasks=[task])
+            return str(await crew.kickoff_async())
+    
     def _format_conversation_history(self) -> str:
         """Format the full conversation history for the agent prompt."""
         if not self.state.conversation_history:
@@ -569,47 +1021,19 @@ Be friendly and efficient. ONE question at a time!""",
         if not info:
             return "(Nothing gathered yet)"
         
-        parts = []
+        parts = [
+            f"- **{label}**: {fmt(value)}"
+            for label, attr, fmt in _GATHERED_FIELDS
+            if (value := getattr(info, attr))
+        ]
         
-        if info.title:
-            parts.append(f"- **Title/Topic**: {info.title}")
+        # Agent-decides and boolean flags (not expressible as plain values above)
         if info.let_agent_decide_title:
             parts.append("- **Title**: User wants you to decide")
-            
-        if info.audience:
-            parts.append(f"- **Target Audience**: {info.audience}")
-            
-        if info.slide_count:
-            parts.append(f"- **Number of Slides**: {info.slide_count}")
-            
-        if info.focus_areas:
-            parts.append(f"- **Focus Areas**: {', '.join(info.focus_areas)}")
-            
-        if info.key_topics:
-            parts.append(f"- **Key Topics**: {', '.join(info.key_topics)}")
-            
-        if info.emphasis_style:
-            parts.append(f"- **Emphasis Style**: {info.emphasis_style}")
-            
-        if info.tone:
-            parts.append(f"- **Tone**: {info.tone}")
-            
-        if info.citation_style:
-            parts.append(f"- **Citation Style**: {info.citation_style}")
-            
-        if info.references_placement:
-            parts.append(f"- **References Placement**: {info.references_placement}")
-            
-        if info.theme:
-            parts.append(f"- **Theme**: {info.theme}")
         if info.let_agent_decide_theme:
             parts.append("- **Theme**: User wants you to decide")
-            
         if info.include_speaker_notes is not None:
             parts.append(f"- **Speaker Notes**: {'Yes' if info.include_speaker_notes else 'No'}")
-            
-        if info.special_requests:
-            parts.append(f"- **Special Requests**: {info.special_requests}")
         
         return "\n".join(parts) if parts else "(Nothing gathered yet)"
     
@@ -644,39 +1068,18 @@ Be friendly and efficient. ONE question at a time!""",
         
         Uses heuristics to detect provided information.
         """
-        import re
         info = self.state.gathered_info
         msg_lower = message.lower()
+        # O(1) dedupe for focus areas added below
+        seen_focus = set(info.focus_areas)
         
         # ---- Detect user confirmation ----
-        confirmation_patterns = [
-            r"^yes\b",
-            r"^yeah\b",
-            r"^yep\b",
-            r"^correct\b",
-            r"looks? (good|great|correct|right)",
-            r"that('s| is) (correct|right|good)",
-            r"^perfect\b",
-            r"go ahead",
-            r"finalize",
-            r"sounds? (good|great|correct)",
-            r"^lgtm\b",
-        ]
-        
-        if info.confirmation_sent and any(re.search(p, msg_lower) for p in confirmation_patterns):
+        if info.confirmation_sent and _USER_CONFIRM_RE.search(msg_lower):
             info.user_confirmed = True
             logger.info(f"User confirmed! Set user_confirmed=True")
         
         # ---- Detect "decide yourself" patterns ----
-        decide_patterns = [
-            r"decide.*(yourself|for me|it yourself)",
-            r"you (can |should )?(choose|pick|decide)",
-            r"(pick|choose).*(yourself|for me)",
-            r"up to you",
-            r"your (choice|decision|call)",
-        ]
-        
-        if any(re.search(p, msg_lower) for p in decide_patterns):
+        if _DECIDE_RE.search(msg_lower):
             if "title" in msg_lower or "topic" in msg_lower:
                 info.let_agent_decide_title = True
                 info.has_title = True  # Agent will handle
@@ -688,40 +1091,20 @@ Be friendly and efficient. ONE question at a time!""",
                 info.has_citation_style = True  # Agent will handle
         
         # ---- Detect audience ----
-        audience_patterns = [
-            (r"(university |college )?students", "university students"),
-            (r"fellow students?", "fellow students"),
-            (r"professors?|faculty|academics?", "academics/professors"),
-            (r"executives?|management|c-suite", "executives"),
-            (r"(business )?professionals?", "business professionals"),
-            (r"engineers?|developers?|technical", "technical professionals"),
-            (r"general (public|audience)", "general public"),
-            (r"clients?|customers?", "clients"),
-            (r"investors?|stakeholders?", "investors/stakeholders"),
-        ]
-        
-        for pattern, audience_value in audience_patterns:
-            if re.search(pattern, msg_lower):
-                info.audience = audience_value
-                info.has_audience = True
-                break
+        audience_value = _AUDIENCE_TABLE.first(msg_lower)
+        if audience_value:
+            info.audience = audience_value
+            info.has_audience = True
         
         # Check for explicit audience statements
-        audience_match = re.search(r"(target audience|presenting to|for)\s*(?:is\s*|:?\s*)([^,.]+)", msg_lower)
+        audience_match = _AUDIENCE_EXPLICIT_RE.search(msg_lower)
         if audience_match and not info.has_audience:
             info.audience = audience_match.group(2).strip()
             info.has_audience = True
         
         # ---- Detect slide count ----
-        slide_patterns = [
-            r"(\d+)\s*slides?",
-            r"around\s*(\d+)",
-            r"about\s*(\d+)\s*slides?",
-            r"(\d+)\s*-\s*\d+\s*slides?",  # Range like "8-10 slides"
-        ]
-        
-        for pattern in slide_patterns:
-            match = re.search(pattern, msg_lower)
+        for pattern in _SLIDE_COUNT_RES:
+            match = pattern.search(msg_lower)
             if match:
                 try:
                     count = int(match.group(1))
@@ -733,104 +1116,75 @@ Be friendly and efficient. ONE question at a time!""",
                     pass
         
         # ---- Detect citation style ----
-        citation_patterns = [
-            (r"\bapa\b", "apa"),
-            (r"\bieee\b", "ieee"),
-            (r"\bharvard\b", "harvard"),
-            (r"\bchicago\b", "chicago"),
-            (r"\bmla\b", "apa"),  # Default to APA for MLA requests
-        ]
-        
-        for pattern, style in citation_patterns:
-            if re.search(pattern, msg_lower):
-                info.citation_style = style
-                info.has_citation_style = True
-                break
+        style = _CITATION_TABLE.first(msg_lower)
+        if style:
+            info.citation_style = style
+            info.has_citation_style = True
         
         # ---- Detect references placement ----
-        if any(phrase in msg_lower for phrase in ["last slide", "end", "at the end", "final slide"]):
-            if "reference" in msg_lower or "citation" in msg_lower:
+        if any(word in msg_lower for word in _REFS_LAST_WORDS):
+            if any(word in msg_lower for word in _REFERENCE_WORDS):
                 info.references_placement = "last_slide"
                 info.has_references_placement = True
-        elif any(phrase in msg_lower for phrase in ["each slide", "distributed", "on relevant"]):
-            if "reference" in msg_lower or "citation" in msg_lower:
+        elif any(word in msg_lower for word in _REFS_DISTRIBUTED_WORDS):
+            if any(word in msg_lower for word in _REFERENCE_WORDS):
                 info.references_placement = "distributed"
                 info.has_references_placement = True
         
         # ---- Detect emphasis style ----
-        if any(word in msg_lower for word in ["detailed", "thorough", "in-depth", "comprehensive"]):
+        if any(word in msg_lower for word in _DETAILED_WORDS):
             info.emphasis_style = "detailed"
             info.has_emphasis_style = True
-        elif any(word in msg_lower for word in ["concise", "brief", "short", "bullet", "minimal text"]):
+        elif any(word in msg_lower for word in _CONCISE_WORDS):
             info.emphasis_style = "concise"
             info.has_emphasis_style = True
-        elif any(word in msg_lower for word in ["visual", "images", "diagrams", "graphics"]):
+        elif any(word in msg_lower for word in _VISUAL_WORDS):
             info.emphasis_style = "visual-heavy"
             info.has_emphasis_style = True
         
         # ---- Detect tone ----
-        if any(word in msg_lower for word in ["academic", "scholarly", "formal", "research"]):
+        if any(word in msg_lower for word in _ACADEMIC_WORDS):
             info.tone = "academic"
             info.has_tone = True
-        elif any(word in msg_lower for word in ["casual", "informal", "relaxed", "friendly"]):
+        elif any(word in msg_lower for word in _CASUAL_WORDS):
             info.tone = "casual"
             info.has_tone = True
-        elif any(word in msg_lower for word in ["technical", "engineering", "scientific"]):
+        elif any(word in msg_lower for word in _TECHNICAL_WORDS):
             info.tone = "technical"
             info.has_tone = True
-        elif any(word in msg_lower for word in ["persuasive", "convincing", "pitch", "sell"]):
+        elif any(word in msg_lower for word in _PERSUASIVE_WORDS):
             info.tone = "persuasive"
             info.has_tone = True
         
         # ---- Detect theme ----
-        theme_patterns = [
-            (r"\bdark\s*(mode|theme)?\b", "dark"),
-            (r"\bminimal(ist)?\b", "minimal"),
-            (r"\bmodern\b", "modern"),
-            (r"\bacademic\b", "academic"),
-            (r"\bprofessional\b", "modern"),
-            (r"\bclean\b", "minimal"),
-        ]
-        
-        for pattern, theme_value in theme_patterns:
-            if re.search(pattern, msg_lower):
-                info.theme = theme_value
-                info.has_theme = True
-                break
+        theme_value = _THEME_TABLE.first(msg_lower)
+        if theme_value:
+            info.theme = theme_value
+            info.has_theme = True
         
         # ---- Detect topic/title (if explicit) ----
         # Look for phrases like "about X" or "presentation on X"
         if not info.has_title and not info.let_agent_decide_title:
-            topic_patterns = [
-                r"(?:presentation |talk |slides? )?(?:about|on|regarding|covering)\s+[\"']?([^\"'\n.]+)[\"']?",
-                r"topic\s*(?:is|:)\s*[\"']?([^\"'\n.]+)[\"']?",
-                r"title\s*(?:is|should be|:)\s*[\"']?([^\"'\n.]+)[\"']?",
-            ]
-            
-            for pattern in topic_patterns:
-                match = re.search(pattern, msg_lower)
+            for pattern in _TOPIC_RES:
+                match = pattern.search(msg_lower)
                 if match:
                     topic = match.group(1).strip()
                     if len(topic) > 5:  # Avoid capturing short noise
                         info.title = topic
                         info.has_title = True
                         # Also treat as focus area
-                        if topic not in info.focus_areas:
+                        if topic not in seen_focus:
+                            seen_focus.add(topic)
                             info.focus_areas.append(topic)
                             info.has_focus_areas = True
                         break
         
         # ---- Detect focus areas (key phrases) ----
-        focus_patterns = [
-            r"(?:focus on|emphasize|cover|include)\s+([^,.]+)",
-            r"(?:specifically|mainly|primarily)\s+([^,.]+)",
-        ]
-        
-        for pattern in focus_patterns:
-            matches = re.findall(pattern, msg_lower)
-            for match in matches:
+        for pattern in _FOCUS_RES:
+            for match in pattern.findall(msg_lower):
                 focus_item = match.strip()
-                if len(focus_item) > 3 and focus_item not in info.focus_areas:
+                if len(focus_item) > 3 and focus_item not in seen_focus:
+                    seen_focus.add(focus_item)
                     info.focus_areas.append(focus_item)
                     info.has_focus_areas = True
     
@@ -878,20 +1232,23 @@ Be friendly and efficient. ONE question at a time!""",
     
     def _looks_like_order_form(self, text: str) -> bool:
         """Check if response looks like a complete OrderForm."""
+        # Natural-language questions carry no JSON object at all
+        if "{" not in text:
+            return False
+        text_lower = text.lower()
         keywords = ["presentation_title", "target_audience", "theme_id", "citation_style"]
-        return sum(1 for k in keywords if k in text.lower()) >= 2
+        return sum(1 for k in keywords if k in text_lower) >= 2
     
     def _parse_order_form(self, text: str) -> OrderForm:
         """Parse OrderForm from agent response."""
-        import re
-        
-        # Try to find JSON in the response
-        json_match = re.search(r'\{[\s\S]*\}', text)
-        if json_match:
+        # Try to find JSON in the response (outermost braces)
+        start = text.find("{")
+        end = text.rfind("}")
+        if start != -1 and end > start:
             try:
-                data = json.loads(json_match.group())
-                return OrderForm(**data)
-            except (json.JSONDecodeError, ValueError):
+                data = _json_loads(text[start:end + 1])
+                return OrderForm.model_validate(data)
+            except ValueError:  # JSONDecodeError / ValidationError
                 pass
         
         # Fallback: create from gathered info
@@ -929,39 +1286,41 @@ Be friendly and efficient. ONE question at a time!""",
         order = self.state.order_form
         
         # Generate skeleton based on preferences
-        slides = []
         slide_count = order.target_slides
         
-        # Title slide
-        slides.append(SkeletonSlide(
-            order=1,
-            title=order.presentation_title,
-            content_type=SlideContentType.TITLE,
-            description=f"Title slide for {order.presentation_title}",
-        ))
-        
         # Content slides based on key_topics and focus_areas
-        topics = order.key_topics or ["Main Topic"]
-        focus = order.focus_areas or []
-        
-        for i, topic in enumerate(topics[:slide_count - 2], start=2):
-            is_focus = any(f.lower() in topic.lower() for f in focus)
-            slides.append(SkeletonSlide(
-                order=i,
-                title=topic,
-                content_type=SlideContentType.CONTENT,
-                description=f"{'[FOCUS] ' if is_focus else ''}Content slide covering {topic}",
-                needs_citation=True,
-                citation_topic=topic,
-            ))
-        
-        # Conclusion slide
-        slides.append(SkeletonSlide(
-            order=len(slides) + 1,
-            title="Conclusion",
-            content_type=SlideContentType.CONCLUSION,
-            description="Summary and key takeaways",
-        ))
+        topics = (order.key_topics or ["Main Topic"])[:slide_count - 2]
+        focus_lower = [f.lower() for f in order.focus_areas]
+        
+        slides = [
+            # Title slide
+            SkeletonSlide(
+                order=1,
+                title=order.presentation_title,
+                content_type=SlideContentType.TITLE,
+                description=f"Title slide for {order.presentation_title}",
+            ),
+            # Content slides are built from already-validated OrderForm data,
+            # so skip per-field validation for large decks
+            *(
+                SkeletonSlide.model_construct(
+                    order=i,
+                    title=topic,
+                    content_type=SlideContentType.CONTENT,
+                    description=f"{'[FOCUS] ' if any(fl in topic_lower for fl in focus_lower) else ''}Content slide covering {topic}",
+                    needs_citation=True,
+                    citation_topic=topic,
+                )
+                for i, (topic, topic_lower) in enumerate(zip(topics, map(str.lower, topics)), start=2)
+            ),
+            # Conclusion slide
+            SkeletonSlide(
+                order=len(topics) + 2,
+                title="Conclusion",
+                content_type=SlideContentType.CONCLUSION,
+                description="Summary and key takeaways",
+            ),
+        ]
         
         skeleton = Skeleton(
             presentation_title=order.presentation_title,
@@ -981,6 +1340,14 @@ Be friendly and efficient. ONE question at a time!""",
         
         return skeleton
     
+    @staticmethod
+    def _index_slides_by_order(slides: List[SkeletonSlide]) -> Dict[int, SkeletonSlide]:
+        """Map slide order -> slide (first slide wins on duplicate orders)."""
+        by_order: Dict[int, SkeletonSlide] = {}
+        for slide in slides:
+            by_order.setdefault(slide.order, slide)
+        return by_order
+    
     async def approve_outline(
         self,
         modifications: Optional[List[Dict]] = None,
@@ -1005,6 +1372,8 @@ Be friendly and efficient. ONE question at a time!""",
         
         if modifications:
             skeleton = self.state.skeleton
+            # order -> slide lookup, rebuilt lazily after structural changes
+            by_order: Optional[Dict[int, SkeletonSlide]] = None
             
             for mod in modifications:
                 action = mod.get("action")
@@ -1018,39 +1387,39 @@ Be friendly and efficient. ONE question at a time!""",
                         description=mod.get("description", ""),
                     )
                     skeleton.slides.append(new_slide)
+                    by_order = None
                     
                 elif action == "remove":
                     # Remove slide by order
                     order_to_remove = mod.get("order")
                     skeleton.slides = [s for s in skeleton.slides if s.order != order_to_remove]
+                    by_order = None
                     
                 elif action == "modify":
                     # Modify existing slide
-                    order_to_modify = mod.get("order")
-                    for slide in skeleton.slides:
-                        if slide.order == order_to_modify:
-                            if "title" in mod:
-                                slide.title = mod["title"]
-                            if "description" in mod:
-                                slide.description = mod["description"]
-                            if "needs_diagram" in mod:
-                                slide.needs_diagram = mod["needs_diagram"]
-                            if "needs_equation" in mod:
-                                slide.needs_equation = mod["needs_equation"]
-                            break
+                    if by_order is None:
+                        by_order = self._index_slides_by_order(skeleton.slides)
+                    slide = by_order.get(mod.get("order"))
+                    if slide is not None:
+                        if "title" in mod:
+                            slide.title = mod["title"]
+                        if "description" in mod:
+                            slide.description = mod["description"]
+                        if "needs_diagram" in mod:
+                            slide.needs_diagram = mod["needs_diagram"]
+                        if "needs_equation" in mod:
+                            slide.needs_equation = mod["needs_equation"]
                             
                 elif action == "reorder":
                     # Reorder slides
                     new_order = mod.get("new_order", [])
                     if new_order:
-                        ordered_slides = []
-                        for i, order in enumerate(new_order, start=1):
-                            for slide in skeleton.slides:
-                                if slide.order == order:
-                                    slide.order = i
-                                    ordered_slides.append(slide)
-                                    break
-                        skeleton.slides = ordered_slides
+                        if by_order is None:
+                            by_order = self._index_slides_by_order(skeleton.slides)
+                        skeleton.slides = [by_order[o] for o in new_order if o in by_order]
+                        for i, slide in enumerate(skeleton.slides, start=1):
+                            slide.order = i
+                        by_order = None
             
             # Re-number slides
             for i, slide in enumerate(skeleton.slides, start=1):
@@ -1115,20 +1484,11 @@ Be friendly and efficient. ONE question at a time!""",
         await self.emitter.stage_start("planner")
         self.state.current_stage = "planner"
         
-        planner = create_planner_agent()
-        
-        # Build the planning task
-        task = Task(
-            description=self._build_planner_prompt(),
-            expected_output="PlannedContent JSON with full bullet points for each slide",
-            agent=planner,
-        )
-        
-        crew = Crew(agents=[planner], tasks=[task])
-        result = crew.kickoff()
+        # Micro-batched with planner requests from concurrent sessions
+        result = await planner_batcher.submit(self._build_planner_prompt())
         
         # Parse result into PlannedContent
-        planned_content = self._parse_planned_content(str(result))
+        planned_content = self._parse_planned_content(result)
         self.state.planned_content = planned_content
         
         await self.emitter.stage_complete("planner", {
@@ -1136,7 +1496,17 @@ Be friendly and efficient. ONE question at a time!""",
         })
     
     def _build_planner_prompt(self) -> str:
-        """Build the prompt for the Planner agent."""
+        """
+        Build the prompt for the Planner agent.
+        
+        Static instructions come first and per-session context last, so
+        every planner call shares an identical prefix that the provider's
+        prompt cache can reuse.
+        """
+        return f"{_PLANNER_INSTRUCTIONS}\n\n{self._dynamic_planner_context()}"
+    
+    def _dynamic_planner_context(self) -> str:
+        """Build the per-session part of the Planner prompt."""
         skeleton = self.state.skeleton
         order = self.state.order_form
         
@@ -1147,36 +1517,24 @@ Be friendly and efficient. ONE question at a time!""",
             for s in skeleton.slides
         ])
         
-        return f"""Generate FULL content for this presentation.
-
-## Presentation Info
+        return f"""## Presentation Info
 Title: {skeleton.presentation_title}
 Audience: {skeleton.target_audience}
 Tone: {order.tone}
 Emphasis Style: {order.emphasis_style}
 Focus Areas: {', '.join(order.focus_areas) if order.focus_areas else 'None'}
+Speaker Notes Requested: {order.include_speaker_notes}
 
 ## Slides to Write
-{slides_list}
-
-## Instructions
-1. Write 3-5 substantial bullet points per slide (not placeholders!)
-2. For slides needing citations, add `citation_queries` (search terms)
-3. For slides needing diagrams, add `diagram_placeholder` (description)
-4. For slides needing equations, add `equation_placeholder` (LaTeX description)
-5. Add speaker_notes if requested: {order.include_speaker_notes}
-
-Return a JSON object with 'slides' array containing PlannedSlide objects."""
+{slides_list}"""
     
     def _parse_planned_content(self, text: str) -> PlannedContent:
         """Parse PlannedContent from agent response."""
-        import re
-        
         # Try to extract JSON
-        json_match = re.search(r'\{[\s\S]*\}', text)
-        if json_match:
+        span = _find_json_span(text)
+        if span:
             try:
-                data = json.loads(json_match.group())
+                data = _json_loads(text[span[0]:span[1]])
                 if "slides" in data:
                     return PlannedContent(
                         presentation_title=self.state.skeleton.presentation_title,
@@ -1185,7 +1543,7 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
                         citation_style=self.state.order_form.citation_style,
                         slides=[PlannedSlide(**s) for s in data["slides"]],
                     )
-            except (json.JSONDecodeError, ValueError) as e:
+            except ValueError as e:  # JSONDecodeError / ValidationError
                 logger.warning(f"Failed to parse PlannedContent: {e}")
         
         # Fallback: generate from skeleton
@@ -1199,7 +1557,7 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
                     order=s.order,
                     title=s.title,
                     content_type=s.content_type,
-                    bullet_points=[s.description or "Content to be added"],
+                    bullet_points=(s.description or "Content to be added",),
                 )
                 for s in self.state.skeleton.slides
             ],
@@ -1210,17 +1568,18 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
         await self.emitter.stage_start("refiner")
         self.state.current_stage = "refiner"
         
+        from app.crew.agents.refiner import create_refiner_agent
+        from app.crew.tools.render_service_tool import get_render_tool
+        
         render_tool = get_render_tool()
         refiner = create_refiner_agent(tools=[render_tool])
         
-        # Process each slide - could be parallelized
-        refined_slides = []
-        
-        for i, planned_slide in enumerate(self.state.planned_content.slides):
-            await self.emitter.slide_progress(planned_slide.order, len(self.state.planned_content.slides), "refining")
-            
-            refined_slide = await self._refine_slide(planned_slide, render_tool)
-            refined_slides.append(refined_slide)
+        # Slides render independently (I/O-bound), so refine them in parallel
+        async with self.emitter.batch():
+            refined_slides = await asyncio.gather(*(
+                self._refine_slide(planned_slide, render_tool)
+                for planned_slide in self.state.planned_content.slides
+            ))
         
         self.state.refined_content = RefinedContent(
             presentation_title=self.state.planned_content.presentation_title,
@@ -1228,7 +1587,7 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
             theme_id=self.state.planned_content.theme_id,
             citation_style=self.state.planned_content.citation_style,
             slides=refined_slides,
-            total_citations=sum(len(s.citations) for s in refined_slides),
+            total_citations=sum(len(s.citation_ids) for s in refined_slides),
             equations_rendered=sum(1 for s in refined_slides if s.equation_svg),
             diagrams_rendered=sum(1 for s in refined_slides if s.diagram_svg),
         )
@@ -1239,49 +1598,53 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
     
     async def _refine_slide(self, planned: PlannedSlide, render_tool) -> RefinedSlide:
         """Refine a single slide (render assets)."""
-        refined = RefinedSlide(
+        await self.emitter.slide_progress(planned.order, len(self.state.planned_content.slides), "refining")
+        
+        # Collect this slide's assets and render them in one batched call
+        assets = {}
+        jobs = []
+        if planned.equation_placeholder:
+            # Convert placeholder to LaTeX
+            latex = self._placeholder_to_latex(planned.equation_placeholder)
+            jobs.append({"type": "latex", "content": latex})
+        if planned.diagram_placeholder:
+            mermaid = self._placeholder_to_mermaid(planned.diagram_placeholder)
+            jobs.append({"type": "mermaid", "content": mermaid})
+        
+        if jobs:
+            try:
+                async with self._render_sem:
+                    svgs = await render_tool.render_batch(jobs)
+            except Exception as e:
+                logger.warning(f"Failed to render slide {planned.order} assets: {e}")
+                svgs = []
+            
+            # Each slot succeeds or fails on its own
+            for job, svg in zip(jobs, svgs):
+                if svg.startswith("Error"):
+                    logger.warning(f"Failed to render {job['type']}: {svg}")
+                elif job["type"] == "latex":
+                    assets["equation_latex"] = job["content"]
+                    assets["equation_svg"] = svg
+                else:
+                    assets["diagram_mermaid"] = job["content"]
+                    assets["diagram_svg"] = svg
+        
+        # RefinedSlide is frozen, so it is built once the assets are known
+        return RefinedSlide(
             order=planned.order,
             title=planned.title,
             content_type=planned.content_type,
             bullet_points=planned.bullet_points,
             template_type=planned.template_type or "content",
             speaker_notes=planned.speaker_notes,
+            **assets,
         )
-        
-        # Render equation if present
-        if planned.equation_placeholder:
-            try:
-                # Convert placeholder to LaTeX
-                latex = self._placeholder_to_latex(planned.equation_placeholder)
-                svg = render_tool._run(action="latex", content=latex)
-                if not svg.startswith("Error"):
-                    refined.equation_latex = latex
-                    refined.equation_svg = svg
-            except Exception as e:
-                logger.warning(f"Failed to render equation: {e}")
-        
-        # Render diagram if present
-        if planned.diagram_placeholder:
-            try:
-                mermaid = self._placeholder_to_mermaid(planned.diagram_placeholder)
-                svg = render_tool._run(action="mermaid", content=mermaid)
-                if not svg.startswith("Error"):
-                    refined.diagram_mermaid = mermaid
-                    refined.diagram_svg = svg
-            except Exception as e:
-                logger.warning(f"Failed to render diagram: {e}")
-        
-        return refined
     
     def _placeholder_to_latex(self, placeholder: str) -> str:
         """Convert a placeholder description to LaTeX. In production, agent does this."""
-        # Simple conversion for common patterns
-        if "linear regression" in placeholder.lower():
-            return r"y = \beta_0 + \beta_1 x + \epsilon"
-        elif "quadratic" in placeholder.lower():
-            return r"ax^2 + bx + c = 0"
-        else:
-            return r"f(x) = \sum_{i=1}^{n} x_i"
+        # Simple conversion for common patterns (first listed pattern wins)
+        return _LATEX_TABLE.first(placeholder) or _LATEX_DEFAULT
     
     def _placeholder_to_mermaid(self, placeholder: str) -> str:
         """Convert a placeholder description to Mermaid. In production, agent does this."""
@@ -1300,7 +1663,9 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
             for slide in self.state.refined_content.slides
         ]
         
-        generated_slides = await asyncio.gather(*tasks)
+        # Parallel slides emit progress in a burst; coalesce it for SSE
+        async with self.emitter.batch():
+            generated_slides = await asyncio.gather(*tasks)
         
         self.state.generated_presentation = GeneratedPresentation(
             title=self.state.refined_content.presentation_title,
@@ -1331,30 +1696,8 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
         )
     
     def _build_slide_html(self, slide: RefinedSlide) -> str:
-        """Build HTML for a slide. In production, uses templates."""
-        bullets_html = "\n".join([
-            f"<li>{point}</li>" for point in slide.bullet_points
-        ])
-        
-        content_html = f"<ul>{bullets_html}</ul>"
-        
-        if slide.equation_svg:
-            content_html += f'<div class="equation">{slide.equation_svg}</div>'
-        
-        if slide.diagram_svg:
-            content_html += f'<div class="diagram">{slide.diagram_svg}</div>'
-        
-        if slide.image_url:
-            content_html += f'<img src="{slide.image_url}" alt="{slide.image_alt or ""}">'
-        
-        return f"""<div class="slide slide-{slide.order}" data-template="{slide.template_type}">
-    <div class="slide-header">
-        <h1 class="slide-title">{slide.title}</h1>
-    </div>
-    <div class="slide-content">
-        {content_html}
-    </div>
-</div>"""
+        """Build HTML for a slide from the precompiled slide template."""
+        return _SLIDE_TEMPLATE.render(slide=slide)
     
     async def _run_qa(self):
         """Run Visual QA to grade slides."""
@@ -1362,27 +1705,25 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
         self.state.current_stage = "visual_qa"
         self.state.qa_loops += 1
         
-        # In production: render slides to images, run vision model
+        slides = self.state.generated_presentation.slides
+        
+        # In production: render slides to images, score them with
+        # app.crew.qa.kernels.slide_quality_batch, run vision model
         # For now: simulate passing QA
-        qa_results = [
-            QAResult(
-                slide_order=slide.order,
-                score=95.0 + (slide.order % 5),  # Simulated 95-99
-                issues=[],
-                passed=True,
-                iterations=self.state.qa_loops,
-            )
-            for slide in self.state.generated_presentation.slides
-        ]
+        orders = np.fromiter((slide.order for slide in slides), dtype=np.int32, count=len(slides))
+        results = QAResultsSoA.from_scores(
+            slide_orders=orders,
+            scores=95.0 + (orders % 5),  # Simulated 95-99
+            passed=np.ones(len(slides), dtype=bool),
+            iteration=self.state.qa_loops,
+        )
         
-        avg_score = sum(r.score for r in qa_results) / len(qa_results)
-        all_passed = all(r.passed for r in qa_results)
+        avg_score = results.average_score
+        all_passed = results.all_passed
         
-        self.state.qa_report = QAReport(
+        # Per-slide QAResult models are only built for the stored report
+        self.state.qa_report = results.to_report(
             session_id=self.state.session_id,
-            slides=qa_results,
-            average_score=avg_score,
-            all_passed=all_passed,
             total_iterations=self.state.qa_loops,
         )
         
@@ -1396,9 +1737,50 @@ Return a JSON object with 'slides' array containing PlannedSlide objects."""
 # Flow Runner (High-Level API)
 # =============================================================================
 
+# Live flows by session_id, so per-flow setup (emitter, retry budget,
+# metrics, render semaphore) is paid once per session rather than per turn.
+# LRU-bounded; sessions are also dropped once generation completes/fails.
+_FLOWS: "OrderedDict[str, SlideGenerationFlow]" = OrderedDict()
+_FLOWS_MAX = 1000
+
+
+def _get_flow(session_id: str, state: Optional[FlowState] = None) -> SlideGenerationFlow:
+    """
+    Get the cached flow for a session, creating it if needed.
+    
+    Args:
+        session_id: Session identifier
+        state: Authoritative state to attach (e.g. loaded from the store)
+    """
+    flow = _FLOWS.get(session_id)
+    if flow is None:
+        flow = _register_flow(SlideGenerationFlow(session_id=session_id))
+    else:
+        _FLOWS.move_to_end(session_id)
+    
+    if state is not None:
+        flow.state = state
+    return flow
+
+
+def _register_flow(flow: SlideGenerationFlow) -> SlideGenerationFlow:
+    """Cache a flow as most recently used, evicting the oldest past _FLOWS_MAX."""
+    _FLOWS[flow.state.session_id] = flow
+    _FLOWS.move_to_end(flow.state.session_id)
+    while len(_FLOWS) > _FLOWS_MAX:
+        _FLOWS.popitem(last=False)
+    return flow
+
+
+def _release_flow_if_finished(flow: SlideGenerationFlow) -> None:
+    """Drop a flow from the cache once its session has reached a terminal state."""
+    if flow.state.status in (FlowStatus.COMPLETED, FlowStatus.FAILED):
+        _FLOWS.pop(flow.state.session_id, None)
+
+
 async def create_session() -> FlowState:
     """Create a new generation session."""
-    flow = SlideGenerationFlow()
+    flow = _register_flow(SlideGenerationFlow())
     return flow.state
 
 
@@ -1408,9 +1790,7 @@ async def process_clarification(
     state: Optional[FlowState] = None,
 ) -> Dict[str, Any]:
     """Process a clarification message."""
-    flow = SlideGenerationFlow(session_id=session_id)
-    if state:
-        flow.state = state
+    flow = _get_flow(session_id, state)
     return await flow.process_clarification(user_message)
 
 
@@ -1419,8 +1799,7 @@ async def generate_outline(
     state: FlowState,
 ) -> Skeleton:
     """Generate the presentation outline."""
-    flow = SlideGenerationFlow(session_id=session_id)
-    flow.state = state
+    flow = _get_flow(session_id, state)
     return await flow.generate_outline()
 
 
@@ -1430,8 +1809,7 @@ async def approve_outline(
     modifications: Optional[List[Dict]] = None,
 ) -> Skeleton:
     """Approve and optionally modify the outline."""
-    flow = SlideGenerationFlow(session_id=session_id)
-    flow.state = state
+    flow = _get_flow(session_id, state)
     return await flow.approve_outline(modifications)
 
 
@@ -1441,10 +1819,14 @@ async def run_generation(
     event_listener: Optional[Callable] = None,
 ) -> GeneratedPresentation:
     """Run the full generation pipeline."""
-    emitter = FlowEventEmitter(session_id)
+    flow = _get_flow(session_id, state)
+    
     if event_listener:
-        emitter.add_listener(event_listener)
+        # Fresh emitter so listeners from earlier runs don't accumulate
+        flow.emitter = FlowEventEmitter(session_id)
+        flow.emitter.add_listener(event_listener)
     
-    flow = SlideGenerationFlow(session_id=session_id, event_emitter=emitter)
-    flow.state = state
-    return await flow.run_generation()
+    try:
+        return await flow.run_generation()
+    finally:
+        _release_flow_if_finished(flow)
@@ -0,0 +1 @@
+# Visual QA - image metric kernels and result containers
@@ -0,0 +1,154 @@
+"""
+Visual QA Image Kernels
+
+Per-slide pixel metrics computed from rendered slide screenshots
+(H x W x 3 uint8 arrays):
+
+- contrast: luminance standard deviation, normalized to 0-1
+- edge_density: share of pixels on a luminance edge (visual clutter)
+- whitespace: share of near-white pixels (breathing room)
+
+With Numba installed, all three are computed in one fused, parallel
+sweep over the image. Without it, an equivalent NumPy implementation
+is used, so results match either way (within float rounding).
+
+Usage:
+    from app.crew.qa.kernels import slide_quality_batch
+    metrics = slide_quality_batch(np.stack(screenshots))  # (N, 3)
+"""
+
+import numpy as np
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+
+
+# Metric columns returned by slide_quality / slide_quality_batch
+METRIC_NAMES = ("contrast", "edge_density", "whitespace")
+
+# Rec. 601 luma weights
+LUMA_R, LUMA_G, LUMA_B = 0.299, 0.587, 0.114
+
+EDGE_THRESHOLD = 32.0    # |dx| + |dy| luminance step that counts as an edge
+WHITE_THRESHOLD = 240.0  # Luminance at or above this is background
+
+
+# =============================================================================
+# NumPy Implementation (fallback)
+# =============================================================================
+
+def _slide_quality_numpy(img: np.ndarray) -> np.ndarray:
+    """Compute slide metrics with vectorized NumPy (three passes)."""
+    rgb = img[..., :3].astype(np.float64)
+    lum = rgb[..., 0] * LUMA_R + rgb[..., 1] * LUMA_G + rgb[..., 2] * LUMA_B
+    
+    contrast = min(float(lum.std()) / 128.0, 1.0)
+    
+    if lum.shape[0] > 1 and lum.shape[1] > 1:
+        base = lum[:-1, :-1]
+        grad = np.abs(lum[:-1, 1:] - base) + np.abs(lum[1:, :-1] - base)
+        edge_density = float((grad > EDGE_THRESHOLD).mean())
+    else:
+        edge_density = 0.0
+    
+    whitespace = float((lum >= WHITE_THRESHOLD).mean())
+    
+    return np.array([contrast, edge_density, whitespace], dtype=np.float32)
+
+
+# =============================================================================
+# Numba Implementation (fused single pass)
+# =============================================================================
+
+if numba is not None:
+
+    @numba.njit(inline="always")
+    def _luma(img, y, x):
+        return img[y, x, 0] * LUMA_R + img[y, x, 1] * LUMA_G + img[y, x, 2] * LUMA_B
+    
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _slide_quality_jit(img):
+        h, w = img.shape[0], img.shape[1]
+        lum_sum = 0.0
+        lum_sq = 0.0
+        edges = 0
+        white = 0
+        
+        for y in numba.prange(h):
+            for x in range(w):
+                lum = _luma(img, y, x)
+                lum_sum += lum
+                lum_sq += lum * lum
+                if lum >= WHITE_THRESHOLD:
+                    white += 1
+                if y + 1 < h and x + 1 < w:
+                    grad = abs(_luma(img, y, x + 1) - lum) + abs(_luma(img, y + 1, x) - lum)
+                    if grad > EDGE_THRESHOLD:
+                        edges += 1
+        
+        n = h * w
+        mean = lum_sum / n
+        var = max(lum_sq / n - mean * mean, 0.0)
+        
+        out = np.empty(3, dtype=np.float32)
+        out[0] = min(np.sqrt(var) / 128.0, 1.0)
+        out[1] = edges / ((h - 1) * (w - 1)) if h > 1 and w > 1 else 0.0
+        out[2] = white / n
+        return out
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+def slide_quality(img: np.ndarray) -> np.ndarray:
+    """
+    Compute quality metrics for one rendered slide.
+    
+    Args:
+        img: H x W x 3 (or 4) uint8 screenshot
+    
+    Returns:
+        float32 array ordered as METRIC_NAMES
+    """
+    if img.ndim != 3 or img.shape[2] < 3 or img.size == 0:
+        raise ValueError(f"Expected a non-empty H x W x 3 image, got shape {img.shape}")
+    
+    if numba is not None:
+        return _slide_quality_jit(np.ascontiguousarray(img[..., :3]))
+    return _slide_quality_numpy(img)
+
+
+def slide_quality_batch(images: np.ndarray) -> np.ndarray:
+    """
+    Compute quality metrics for a stack of same-sized slide screenshots.
+    
+    Args:
+        images: N x H x W x 3 uint8 array (e.g. np.stack(screenshots))
+    
+    Returns:
+        N x 3 float32 array, columns ordered as METRIC_NAMES
+    """
+    out = np.empty((len(images), len(METRIC_NAMES)), dtype=np.float32)
+    for i, img in enumerate(images):
+        out[i] = slide_quality(img)
+    return out
+
+
+def warmup() -> None:
+    """
+    Compile the Numba kernel ahead of the first real QA pass.
+    
+    With cache=True the compiled kernel is reused across restarts, so
+    this is only slow the first time. No-op without Numba.
+    """
+    if numba is None:
+        return
+    slide_quality(np.zeros((2, 2, 3), dtype=np.uint8))
+    logger.info("Visual QA kernels compiled")
@@ -0,0 +1,102 @@
+"""
+Visual QA Result Arrays
+
+Struct-of-arrays container for per-slide QA results. Aggregates and
+filters (average, failing slides, issue counts) run as array operations;
+QAResult/QAReport models are only built when the report is serialized.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+
+from app.models.schemas import QAReport, QAResult
+
+
+@dataclass
+class QAResultsSoA:
+    """
+    Per-slide QA results stored column-wise.
+    
+    Attributes:
+        slide_orders: int32 slide order per row
+        scores: float32 QA score (0-100) per row
+        passed: bool pass flag per row
+        iterations: int32 QA loop count per row
+        issues: Issue strings per row (mostly empty)
+    """
+    slide_orders: np.ndarray
+    scores: np.ndarray
+    passed: np.ndarray
+    iterations: np.ndarray
+    issues: List[List[str]] = field(default_factory=list)
+    
+    @classmethod
+    def from_scores(
+        cls,
+        slide_orders: np.ndarray,
+        scores: np.ndarray,
+        passed: np.ndarray,
+        iteration: int,
+    ) -> "QAResultsSoA":
+        """
+        Build results for one QA loop.
+        
+        Args:
+            slide_orders: Slide orders, one per row
+            scores: QA scores, one per row
+            passed: Pass flags, one per row
+            iteration: QA loop number shared by every row
+        """
+        count = len(slide_orders)
+        return cls(
+            slide_orders=np.asarray(slide_orders, dtype=np.int32),
+            scores=np.asarray(scores, dtype=np.float32),
+            passed=np.asarray(passed, dtype=bool),
+            iterations=np.full(count, iteration, dtype=np.int32),
+            issues=[[] for _ in range(count)],
+        )
+    
+    def __len__(self) -> int:
+        return len(self.slide_orders)
+    
+    @property
+    def average_score(self) -> float:
+        """Mean score (0.0 for an empty deck)."""
+        return float(self.scores.mean()) if len(self) else 0.0
+    
+    @property
+    def all_passed(self) -> bool:
+        """Whether every slide passed."""
+        return bool(self.passed.all())
+    
+    def failing_orders(self) -> List[int]:
+        """Slide orders that did not pass."""
+        return self.slide_orders[~self.passed].tolist()
+    
+    def to_report(self, session_id: str, total_iterations: int) -> QAReport:
+        """Materialize the QAReport model for storage/serialization."""
+        slides = [
+            QAResult(
+                slide_order=order,
+                score=score,
+                issues=issues,
+                passed=ok,
+                iterations=iteration,
+            )
+            for order, score, ok, iteration, issues in zip(
+                self.slide_orders.tolist(),
+                self.scores.tolist(),
+                self.passed.tolist(),
+                self.iterations.tolist(),
+                self.issues,
+            )
+        ]
+        return QAReport(
+            session_id=session_id,
+            slides=slides,
+            average_score=self.average_score,
+            all_passed=self.all_passed,
+            total_iterations=total_iterations,
+        )
@@ -11,15 +11,57 @@ Usage:
         print(f"{citation.authors[0]} ({citation.year}): {citation.title}")
 """
 
+import asyncio
+import heapq
 import httpx
+import importlib.util
 import re
 from typing import Optional, List
 from pydantic import BaseModel, Field, field_validator
 
-from app.config import settings
+from app.routers.generation.models import CitationMetadata
+from app.core.cache import TTLCache
+from app.core.logging import get_logger
 
+logger = get_logger(__name__)
 
-from app.routers.generation.models import CitationMetadata
+
+# HTTP/2 multiplexes the parallel CrossRef/Semantic Scholar/doi.org calls
+# over one connection when the optional h2 package is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One pooled client shared by every AcademicSearchTool, so TLS sessions to
+# the citation APIs survive across tool instances
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=30.0,
+            # CrossRef routes identified clients to its "polite" pool
+            headers={"User-Agent": "SankoSlides/0.2.0 (academic citation search)"},
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+def _clip(text: Optional[str], limit: int = 500) -> Optional[str]:
+    """Truncate text to limit chars, without copying when already short."""
+    if not text:
+        return None
+    return text if len(text) <= limit else text[:limit]
 
 
 class AcademicSearchTool:
@@ -39,8 +81,12 @@ class AcademicSearchTool:
     SEMANTIC_SCHOLAR_API = "https://api.semanticscholar.org/graph/v1/paper/search"
     ARXIV_API = "http://export.arxiv.org/api/query"
     
+    # Shared result caches (searches: 1 hour; DOIs rarely change: 1 day)
+    _search_cache = TTLCache(maxsize=1024, ttl=3600)
+    _doi_cache = TTLCache(maxsize=10000, ttl=86400)
+    
     def __init__(self):
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = _get_shared_client()
     
     async def search(
         self,
@@ -59,27 +105,49 @@ class AcademicSearchTool:
         Returns:
             List of CitationMetadata objects
         """
-        results = []
+        cache_key = (query.strip().casefold(), max_results, source)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            # Callers may edit their citations; each gets its own copies
+            return [c.model_copy(deep=True) for c in cached]
         
+        # Query the selected sources concurrently; one API failing must not
+        # drop the other's results
+        searches = []
         if source in ["crossref", "all"]:
-            crossref_results = await self._search_crossref(query, max_results)
-            results.extend(crossref_results)
-        
+            searches.append(self._search_crossref(query, max_results))
         if source in ["semantic_scholar", "all"]:
-            ss_results = await self._search_semantic_scholar(query, max_results)
-            results.extend(ss_results)
+            searches.append(self._search_semantic_scholar(query, max_results))
+        
+        results = []
+        for source_results in await asyncio.gather(*searches, return_exceptions=True):
+            if isinstance(source_results, BaseException):
+                logger.warning("Academic search source failed: %s", source_results)
+                continue
+            results.extend(source_results)
         
-        # Sort by relevance and dedupe by DOI
-        seen_dois = set()
-        unique_results = []
-        for r in sorted(results, key=lambda x: x.relevance_score, reverse=True):
-            if r.doi and r.doi in seen_dois:
+        # Dedupe by DOI in one pass (keeping the highest-scoring copy), then
+        # select the top results without sorting the whole list
+        candidates = []
+        doi_index = {}
+        for r in results:
+            if not r.doi:
+                candidates.append(r)
                 continue
-            if r.doi:
-                seen_dois.add(r.doi)
-            unique_results.append(r)
+            index = doi_index.get(r.doi)
+            if index is None:
+                doi_index[r.doi] = len(candidates)
+                candidates.append(r)
+            elif r.relevance_score > candidates[index].relevance_score:
+                candidates[index] = r
         
-        return unique_results[:max_results]
+        unique_results = heapq.nlargest(
+            max_results, candidates, key=lambda x: x.relevance_score
+        )
+        # Empty results may just mean an API was down - don't pin them
+        if unique_results:
+            self._search_cache.set(cache_key, tuple(c.model_copy(deep=True) for c in unique_results))
+        return unique_results
     
     async def _search_crossref(
         self,
@@ -132,7 +200,7 @@ class AcademicSearchTool:
                     issue=item.get("issue"),
                     pages=item.get("page"),
                     publisher=item.get("publisher"),
-                    abstract=item.get("abstract", "")[:500] if item.get("abstract") else None,
+                    abstract=_clip(item.get("abstract")),
                     verified=True,  # CrossRef is authoritative
                     relevance_score=item.get("score", 0) / 100,  # Normalize score
                 )
@@ -141,7 +209,7 @@ class AcademicSearchTool:
             return results
             
         except Exception as e:
-            print(f"CrossRef search failed: {e}")
+            logger.warning("CrossRef search failed: %s", e)
             return []
     
     async def _search_semantic_scholar(
@@ -185,7 +253,7 @@ class AcademicSearchTool:
                     doi=doi,
                     arxiv_id=arxiv_id,
                     url=f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else None,
-                    abstract=paper.get("abstract", "")[:500] if paper.get("abstract") else None,
+                    abstract=_clip(paper.get("abstract")),
                     verified=bool(doi),  # Verified if has DOI
                     relevance_score=0.7,  # SS doesn't provide relevance scores
                 )
@@ -194,7 +262,7 @@ class AcademicSearchTool:
             return results
             
         except Exception as e:
-            print(f"Semantic Scholar search failed: {e}")
+            logger.warning("Semantic Scholar search failed: %s", e)
             return []
     
     async def verify_doi(self, doi: str) -> bool:
@@ -210,14 +278,24 @@ class AcademicSearchTool:
         # Clean DOI
         clean_doi = doi.replace("https://doi.org/", "").replace("http://doi.org/", "")
         
+        cached = self._doi_cache.get(clean_doi)
+        if cached is not None:
+            return cached
+        
         try:
-            response = await self._client.head(
-                f"https://doi.org/{clean_doi}",
-                follow_redirects=True
-            )
-            return response.status_code == 200
+            # The agency endpoint answers for any registered DOI (CrossRef,
+            # DataCite, ...) with a tiny JSON body and no publisher redirects
+            response = await self._client.get(f"{self.CROSSREF_API}/{clean_doi}/agency")
         except Exception:
+            # Network failure is not an answer - leave it uncached
             return False
+        
+        valid = response.status_code == 200
+        # Only a definite answer is cached; rate limits (429) and other
+        # transient statuses are retried on the next call
+        if response.status_code in (200, 404):
+            self._doi_cache.set(clean_doi, valid)
+        return valid
     
     async def get_citation_by_doi(self, doi: str) -> Optional[CitationMetadata]:
         """
@@ -270,9 +348,14 @@ class AcademicSearchTool:
             )
             
         except Exception as e:
-            print(f"DOI lookup failed: {e}")
+            logger.warning("DOI lookup failed: %s", e)
             return None
     
     async def close(self):
-        """Close HTTP client."""
-        await self._client.aclose()
+        """
+        Release this tool.
+        
+        The HTTP client is shared across instances, so it is left open;
+        use close_shared_client() on application shutdown.
+        """
+        self._client = None
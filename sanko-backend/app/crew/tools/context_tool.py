@@ -5,10 +5,10 @@ Purpose: Allow agents to retrieve detailed content from specific
 document sections stored in the KnowledgeBase.
 """
 
-from typing import Type, Optional
-from pydantic import BaseModel, Field
+from typing import Dict, Type, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from crewai.tools import BaseTool
-from app.models.schemas import KnowledgeBase
+from app.models.schemas import KnowledgeBase, DocumentSection
 
 class ReadSectionToolInput(BaseModel):
     """Input for the ReadSectionTool."""
@@ -21,17 +21,34 @@ class ReadSectionTool(BaseTool):
     
     # We pass the knowledge_base directly to the tool instance
     kb: KnowledgeBase = Field(..., description="The KnowledgeBase to query.")
+    
+    # Case-folded title -> section, rebuilt when kb.sections changes
+    _index: Dict[str, DocumentSection] = PrivateAttr(default_factory=dict)
+    _index_stamp: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+
+    def _section_index(self) -> Dict[str, DocumentSection]:
+        """Get the title index, rebuilding it if the sections list changed."""
+        sections = self.kb.sections
+        stamp = (id(sections), len(sections))
+        if stamp != self._index_stamp:
+            index: Dict[str, DocumentSection] = {}
+            for section in sections:
+                # First match wins, as with the old linear scan
+                index.setdefault(section.title.casefold(), section)
+            self._index = index
+            self._index_stamp = stamp
+        return self._index
 
     def _run(self, section_title: str) -> str:
         """Execute the tool."""
         # Find the section by title (case-insensitive)
-        for section in self.kb.sections:
-            if section.title.lower() == section_title.lower():
-                # Format the output for the agent
-                result = f"## {section.title}\n\n{section.content}"
-                if section.visuals:
-                    result += "\n\n### Visual Elements in this Section:\n"
-                    result += "\n".join([f"- {v}" for v in section.visuals])
-                return result
+        section = self._section_index().get(section_title.casefold())
+        if section is not None:
+            # Format the output for the agent
+            result = f"## {section.title}\n\n{section.content}"
+            if section.visuals:
+                result += "\n\n### Visual Elements in this Section:\n"
+                result += "\n".join([f"- {v}" for v in section.visuals])
+            return result
         
         return f"Error: Section '{section_title}' not found. Available sections: {', '.join(self.kb.get_section_titles())}"
@@ -4,79 +4,194 @@ CrewAI Tool Wrappers
 Provides CrewAI-compatible BaseTool wrappers for our custom tools.
 This allows agents to invoke tools via function calling.
 
-The wrappers delegate to existing tool implementations.
+The wrappers delegate to existing tool implementations. Each one is an
+AsyncToolAdapter subclass built by make_tool from the implementation's
+coroutine and a result formatter.
 """
 
-import asyncio
-from typing import Optional, TYPE_CHECKING
+from typing import (
+    Any, Awaitable, Callable, ClassVar, Final, List, Type,
+    TYPE_CHECKING,
+)
 
 from crewai.tools import BaseTool
-from pydantic import Field
+from pydantic import BaseModel, Field
+
+from app.core.loop_thread import get_tool_loop
 
 if TYPE_CHECKING:
-    from app.tools.vision_tool import VisionTool
-    from app.tools.image_generation_tool import NanoBananaImageTool
-    from app.tools.image_search_tool import ImageSearchTool
-    from app.tools.academic_search_tool import AcademicSearchTool
+    from app.crew.tools.vision_tool import VisionTool
+    from app.crew.tools.image_generation_tool import NanoBananaImageTool
+    from app.crew.tools.image_search_tool import ImageSearchTool
+    from app.crew.tools.academic_search_tool import AcademicSearchTool
+
+
+# Sync _run calls hand their coroutines to this persistent loop rather than
+# re-entering the caller's loop with nest_asyncio
+_LOOP_THREAD = get_tool_loop()
+
+
+# =============================================================================
+# Result Formatters
+# =============================================================================
+
+def _fmt_image(i: int, result: Any) -> str:
+    """One numbered line of search_images output."""
+    return f"{i}. {result.url} (Source: {result.source})"
+
+
+def _fmt_citation(i: int, citation: Any) -> str:
+    """One numbered entry (plus DOI line) of search_citations output."""
+    authors = citation.authors
+    names = (
+        ", ".join(authors[:2]) + (" et al." if len(authors) > 2 else "")
+        if authors else "Unknown"
+    )
+    line = f"{i}. \"{citation.title}\" by {names} ({citation.year})"
+    return f"{line}\n   DOI: {citation.doi}" if citation.doi else line
+
+
+def _fmt_verification(result: Any) -> str:
+    """verify_image output for a VisionVerification."""
+    if result.is_match:
+        return f"✅ Image VERIFIED (score: {result.match_score:.2f}). Description: {result.actual_description}"
+    return f"❌ Image REJECTED (score: {result.match_score:.2f}). Issues: {', '.join(result.issues)}"
 
 
-class VisionVerificationTool(BaseTool):
+def _fmt_generation(result: Any) -> str:
+    """generate_image output for a GeneratedAsset."""
+    if result.success:
+        return f"✅ Generated image at: {result.file_path}"
+    return f"❌ Generation failed: {result.error}"
+
+
+def _fmt_images(results: List[Any]) -> str:
+    """search_images output for a list of ImageSearchResults."""
+    if not results:
+        return "No images found for this query. Consider using generate_image to create a custom visual."
+    return "Found images:\n" + "\n".join(
+        _fmt_image(i, r) for i, r in enumerate(results, 1)
+    )
+
+
+def _fmt_citations(results: List[Any]) -> str:
+    """search_citations output for a list of CitationMetadata."""
+    if not results:
+        return "No academic citations found for this query."
+    return "Found citations:\n" + "\n".join(
+        _fmt_citation(i, c) for i, c in enumerate(results, 1)
+    )
+
+
+# =============================================================================
+# Generic Adapter
+# =============================================================================
+
+class AsyncToolAdapter(BaseTool):
     """
-    CrewAI-compatible tool for verifying images match descriptions.
+    CrewAI BaseTool that drives an injected async tool implementation.
     
-    Delegates to VisionTool for actual implementation.
+    Subclasses (built with make_tool) only declare how to call the
+    implementation and how to format its result; dispatch to the background
+    loop, the not-configured check and error reporting live here once.
     """
-    name: str = "verify_image"
-    description: str = """Verifies that an image URL matches an expected description.
-Use when you need to confirm an image is appropriate for a slide.
-Returns a match score (0-1) and whether the image is acceptable.
-
-Input format: JSON with 'image_url' and 'expected_description' keys.
-Example: {"image_url": "https://...", "expected_description": "Neural network diagram"}"""
+    
+    name: str = "async_tool"
+    description: str = "Async tool adapter"
+    
+    # Per-tool behaviour, filled in by make_tool
+    _call: ClassVar[Callable[[Any, BaseModel], Awaitable[Any]]]
+    _format: ClassVar[Callable[[Any], str]]
+    _impl_name: ClassVar[str] = "Tool"
+    _error_prefix: ClassVar[str] = "Error running tool"
     
     # The actual tool implementation (injected)
-    _vision_tool: Optional["VisionTool"] = None
+    _impl: Any = None
     
-    def set_tool(self, tool: "VisionTool"):
+    def set_tool(self, tool: Any):
         """Inject the actual tool implementation."""
-        self._vision_tool = tool
+        self._impl = tool
+    
+    def _run(self, *args: Any, **kwargs: Any) -> str:
+        """Run the tool synchronously on the background loop."""
+        return _LOOP_THREAD.run(self._arun(*args, **kwargs))
     
-    def _run(self, image_url: str, expected_description: str = "") -> str:
-        """
-        Verify an image matches its expected description.
-        """
-        if not self._vision_tool:
-            return "Error: VisionTool not configured"
+    async def _arun(self, *args: Any, **kwargs: Any) -> str:
+        """Validate arguments, await the implementation and format the result."""
+        if not self._impl:
+            return f"Error: {self._impl_name} not configured"
         
         try:
-            # Run async tool in sync context
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import nest_asyncio
-                nest_asyncio.apply()
-            
-            result = loop.run_until_complete(
-                self._vision_tool.verify_image(image_url, expected_description)
-            )
-            
-            if result.is_match:
-                return f"✅ Image VERIFIED (score: {result.match_score:.2f}). Description: {result.actual_description}"
-            else:
-                return f"❌ Image REJECTED (score: {result.match_score:.2f}). Issues: {', '.join(result.issues)}"
-                
+            # Positional arguments follow the schema's field order
+            kwargs.update(zip(self.args_schema.model_fields, args))
+            params = self.args_schema.model_validate(kwargs)
+            return self._format(await self._call(self._impl, params))
         except Exception as e:
-            return f"Error verifying image: {str(e)}"
+            return f"{self._error_prefix}: {str(e)}"
 
 
-class ImageGenerationTool(BaseTool):
+def make_tool(
+    class_name: str,
+    *,
+    name: str,
+    description: str,
+    args_schema: Type[BaseModel],
+    call: Callable[[Any, BaseModel], Awaitable[Any]],
+    formatter: Callable[[Any], str],
+    impl_name: str,
+    error_prefix: str,
+    doc: str = "",
+) -> Type[AsyncToolAdapter]:
     """
-    CrewAI-compatible tool for generating images with Nano Banana Pro.
+    Build an AsyncToolAdapter subclass for one async tool.
     
-    Use this for creating custom visuals like diagrams, concepts, and graphics.
-    NOT for finding existing photos - use ImageSearchTool for that.
+    Args:
+        class_name: Name of the generated class
+        name: Tool name the agent calls
+        description: Tool description shown to the agent
+        args_schema: Pydantic model for the tool's arguments
+        call: (implementation, params) -> awaitable result
+        formatter: Turns the result into the agent-facing string
+        impl_name: Implementation name used in the not-configured error
+        error_prefix: Prefix for errors raised by the implementation
+        doc: Class docstring
+        
+    Returns:
+        The new tool class (instantiate, then set_tool(...))
     """
-    name: str = "generate_image"
-    description: str = """GENERATES custom visual assets using AI (Nano Banana Pro / Gemini 3 Pro Image).
+    return type(class_name, (AsyncToolAdapter,), {
+        "__module__": __name__,
+        "__doc__": doc,
+        "__annotations__": {
+            "name": str,
+            "description": str,
+            "args_schema": Type[BaseModel],
+        },
+        "name": name,
+        "description": description,
+        "args_schema": args_schema,
+        "_call": staticmethod(call),
+        "_format": staticmethod(formatter),
+        "_impl_name": impl_name,
+        "_error_prefix": error_prefix,
+    })
+
+
+# =============================================================================
+# Tool Descriptions
+# =============================================================================
+
+# Module-level constants: one shared string object per tool, however many
+# tool instances CrewAI builds per agent and request
+
+_VISION_DESC: Final[str] = """Verifies that an image URL matches an expected description.
+Use when you need to confirm an image is appropriate for a slide.
+Returns a match score (0-1) and whether the image is acceptable.
+
+Input format: JSON with 'image_url' and 'expected_description' keys.
+Example: {"image_url": "https://...", "expected_description": "Neural network diagram"}"""
+
+_IMAGE_GEN_DESC: Final[str] = """GENERATES custom visual assets using AI (Nano Banana Pro / Gemini 3 Pro Image).
 
 Best for:
 - Diagrams and flowcharts
@@ -93,51 +208,8 @@ Prompt should follow this structure for best results:
 - Style: Visual aesthetic (e.g., "modern", "minimalist", "corporate")
 
 Input: A detailed prompt describing the desired image."""
-    
-    _image_gen_tool: Optional["NanoBananaImageTool"] = None
-    
-    def set_tool(self, tool: "NanoBananaImageTool"):
-        """Inject the actual tool implementation."""
-        self._image_gen_tool = tool
-    
-    def _run(self, prompt: str) -> str:
-        """
-        Generate a custom image from prompt.
-        """
-        if not self._image_gen_tool:
-            return "Error: NanoBananaImageTool not configured"
-        
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import nest_asyncio
-                nest_asyncio.apply()
-            
-            result = loop.run_until_complete(
-                self._image_gen_tool.generate_asset(
-                    prompt=prompt,
-                    style="professional, high quality presentation graphic"
-                )
-            )
-            
-            if result.success:
-                return f"✅ Generated image at: {result.file_path}"
-            else:
-                return f"❌ Generation failed: {result.error}"
-                
-        except Exception as e:
-            return f"Error generating image: {str(e)}"
 
-
-class ImageSearchCrewTool(BaseTool):
-    """
-    CrewAI-compatible tool for searching existing images.
-    
-    Use this for finding real photographs and stock images.
-    NOT for creating custom graphics - use generate_image for that.
-    """
-    name: str = "search_images"
-    description: str = """Searches for EXISTING photos and images from Unsplash and Google.
+_IMAGE_SEARCH_DESC: Final[str] = """Searches for EXISTING photos and images from Unsplash and Google.
 
 Best for:
 - Real photographs
@@ -148,50 +220,8 @@ NOT for: Custom diagrams, concepts, or graphics (use generate_image instead).
 
 Input: Search query string describing what image you need.
 Example: "modern office workspace" or "team collaboration meeting\""""
-    
-    _image_search_tool: Optional["ImageSearchTool"] = None
-    
-    def set_tool(self, tool: "ImageSearchTool"):
-        """Inject the actual tool implementation."""
-        self._image_search_tool = tool
-    
-    def _run(self, query: str, max_results: int = 3) -> str:
-        """
-        Search for images matching the query.
-        """
-        if not self._image_search_tool:
-            return "Error: ImageSearchTool not configured"
-        
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import nest_asyncio
-                nest_asyncio.apply()
-            
-            results = loop.run_until_complete(
-                self._image_search_tool.search_images(query, max_results=max_results)
-            )
-            
-            if results:
-                output_lines = ["Found images:"]
-                for i, r in enumerate(results, 1):
-                    output_lines.append(f"{i}. {r.url} (Source: {r.source})")
-                return "\n".join(output_lines)
-            else:
-                return "No images found for this query. Consider using generate_image to create a custom visual."
-                
-        except Exception as e:
-            return f"Error searching images: {str(e)}"
-
 
-class AcademicSearchCrewTool(BaseTool):
-    """
-    CrewAI-compatible tool for finding academic citations.
-    
-    Searches CrossRef, Semantic Scholar, and ArXiv for verified citations.
-    """
-    name: str = "search_citations"
-    description: str = """Searches academic databases for verified citations.
+_CITATIONS_DESC: Final[str] = """Searches academic databases for verified citations.
 
 Use when you need:
 - Academic papers to cite claims
@@ -202,45 +232,89 @@ Returns: Citation metadata including title, authors, year, DOI.
 
 Input: Search query for academic content.
 Example: "machine learning image classification accuracy\""""
-    
-    _search_tool: Optional["AcademicSearchTool"] = None
-    
-    def set_tool(self, tool: "AcademicSearchTool"):
-        """Inject the actual tool implementation."""
-        self._search_tool = tool
-    
-    def _run(self, query: str, max_results: int = 2) -> str:
-        """
-        Search for academic citations.
-        """
-        if not self._search_tool:
-            return "Error: AcademicSearchTool not configured"
-        
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import nest_asyncio
-                nest_asyncio.apply()
-            
-            results = loop.run_until_complete(
-                self._search_tool.search(query, max_results=max_results)
-            )
-            
-            if results:
-                output_lines = ["Found citations:"]
-                for i, c in enumerate(results, 1):
-                    authors = ", ".join(c.authors[:2]) if c.authors else "Unknown"
-                    if len(c.authors) > 2:
-                        authors += " et al."
-                    output_lines.append(f"{i}. \"{c.title}\" by {authors} ({c.year})")
-                    if c.doi:
-                        output_lines.append(f"   DOI: {c.doi}")
-                return "\n".join(output_lines)
-            else:
-                return "No academic citations found for this query."
-                
-        except Exception as e:
-            return f"Error searching citations: {str(e)}"
+
+
+# =============================================================================
+# Tool Argument Schemas
+# =============================================================================
+
+class VerifyImageInput(BaseModel):
+    """Arguments for verify_image."""
+    image_url: str = Field(..., description="URL of the image to check")
+    expected_description: str = Field(default="", description="What the image should show")
+
+
+class GenerateImageInput(BaseModel):
+    """Arguments for generate_image."""
+    prompt: str = Field(..., description="Detailed description of the image to create")
+
+
+class SearchImagesInput(BaseModel):
+    """Arguments for search_images."""
+    query: str = Field(..., description="What the image should show")
+    max_results: int = Field(default=3, description="Maximum number of images")
+
+
+class SearchCitationsInput(BaseModel):
+    """Arguments for search_citations."""
+    query: str = Field(..., description="Academic search query")
+    max_results: int = Field(default=2, description="Maximum number of citations")
+
+
+# =============================================================================
+# CrewAI Tools
+# =============================================================================
+
+VisionVerificationTool = make_tool(
+    "VisionVerificationTool",
+    doc="CrewAI-compatible tool for verifying images match descriptions (delegates to VisionTool).",
+    name="verify_image",
+    description=_VISION_DESC,
+    args_schema=VerifyImageInput,
+    call=lambda tool, p: tool.verify_image(p.image_url, p.expected_description),
+    formatter=_fmt_verification,
+    impl_name="VisionTool",
+    error_prefix="Error verifying image",
+)
+
+ImageGenerationTool = make_tool(
+    "ImageGenerationTool",
+    doc="CrewAI-compatible tool for generating custom images with Nano Banana Pro.",
+    name="generate_image",
+    description=_IMAGE_GEN_DESC,
+    args_schema=GenerateImageInput,
+    call=lambda tool, p: tool.generate_asset(
+        prompt=p.prompt,
+        style="professional, high quality presentation graphic",
+    ),
+    formatter=_fmt_generation,
+    impl_name="NanoBananaImageTool",
+    error_prefix="Error generating image",
+)
+
+ImageSearchCrewTool = make_tool(
+    "ImageSearchCrewTool",
+    doc="CrewAI-compatible tool for finding existing photos and stock images.",
+    name="search_images",
+    description=_IMAGE_SEARCH_DESC,
+    args_schema=SearchImagesInput,
+    call=lambda tool, p: tool.search_images(p.query, max_results=p.max_results),
+    formatter=_fmt_images,
+    impl_name="ImageSearchTool",
+    error_prefix="Error searching images",
+)
+
+AcademicSearchCrewTool = make_tool(
+    "AcademicSearchCrewTool",
+    doc="CrewAI-compatible tool for finding verified academic citations.",
+    name="search_citations",
+    description=_CITATIONS_DESC,
+    args_schema=SearchCitationsInput,
+    call=lambda tool, p: tool.search(p.query, max_results=p.max_results),
+    formatter=_fmt_citations,
+    impl_name="AcademicSearchTool",
+    error_prefix="Error searching citations",
+)
 
 
 def create_crewai_tools(
@@ -14,16 +14,26 @@ Usage:
 """
 
 import os
+import asyncio
 import base64
-from datetime import datetime
-from typing import Optional, List
+import functools
+import hashlib
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Optional, List, Tuple, TypeVar
 from pathlib import Path
+from uuid import uuid4
+
+import aiofiles
 from pydantic import BaseModel, Field
 
-from google import genai
 from google.genai import types
 
-from app.config import settings
+from app.core.config import settings
+from app.clients.gemini.helpers import get_shared_client
+from app.core.cache import SingleFlight, TTLCache
+
+T = TypeVar("T")
 
 
 class GeneratedAsset(BaseModel):
@@ -36,6 +46,67 @@ class GeneratedAsset(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
 
 
+# Structured prompts for the fixed-shape helpers, pre-rendered down to their
+# varying fields (same output as _structured_prompt with these arguments)
+_BACKGROUND_PROMPT = (
+    "Subject: Abstract background pattern for {theme} presentation\n"
+    "Composition: Full frame, no focal point, suitable as background\n"
+    "Location: Abstract/conceptual space\n"
+    "Style: {mood}, subtle, not distracting, high resolution{color_text}"
+)
+_CONCEPT_PROMPT = (
+    "Subject: Visual metaphor representing {concept}\n"
+    "Composition: Centered, clean, easy to understand\n"
+    "Style: {style}"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _structured_prompt(
+    subject: str,
+    style: str,
+    composition: Optional[str],
+    action: Optional[str],
+    location: Optional[str],
+    text_to_render: Optional[str],
+) -> str:
+    """Assemble (and memoize) a Subject/Composition/Action/Location/Style prompt."""
+    # (label, value, required) - optional lines are dropped when empty
+    fields = (
+        ("Subject", subject, True),
+        ("Composition", composition, False),
+        ("Action", action, False),
+        ("Location", location, False),
+        ("Style", style, True),
+        # Nano Banana Pro handles text well
+        (
+            "Text in image",
+            text_to_render and f"\"{text_to_render}\" (render clearly and legibly)",
+            False,
+        ),
+    )
+    return "\n".join(
+        f"{label}: {value}" for label, value, required in fields if required or value
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _mime_for(path: str) -> str:
+    """MIME type for a reference image path (PNG if unknown)."""
+    return mimetypes.guess_type(path)[0] or "image/png"
+
+
+async def _load_reference(img_path: str) -> Optional[Tuple[str, bytes]]:
+    """Read one reference image without blocking the loop; (mime, bytes) or None."""
+    try:
+        async with aiofiles.open(img_path, "rb") as f:
+            raw = await f.read()
+    except Exception as e:
+        print(f"Failed to load reference image {img_path}: {e}")
+        return None
+    return _mime_for(img_path), raw
+
+
 class NanoBananaImageTool:
     """
     Tool for generating visual assets using Nano Banana Pro (Gemini 3 Pro Image).
@@ -52,17 +123,39 @@ class NanoBananaImageTool:
     - Action: What is happening (if applicable)
     - Location: Setting/environment
     - Style: Aesthetic, artistic style
+    
+    Saved assets are content-addressed: the file name is a hash of the
+    model, prompt and reference images, so a repeat request returns the
+    existing file without calling the model.
     """
     
+    # Recently returned assets by (output_dir, content key), so hot repeats
+    # skip even the filesystem check
+    _asset_cache = TTLCache(maxsize=256, ttl=86400)
+    _generate_flights = SingleFlight()
+    
+    # The genai client is synchronous; model calls run here so they don't
+    # block the event loop (shared, so the cap is process-wide)
+    _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="image-gen")
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
-        output_dir: str = "./generated_assets"
+        output_dir: str = "./generated_assets",
+        max_workers: int = 4,
     ):
         self.api_key = api_key or settings.gemini_api_key
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = get_shared_client(self.api_key)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Image generation is the heaviest model call - keep the cap low
+        self.max_workers = max_workers
+        self._sem = asyncio.Semaphore(max_workers)
+    
+    async def _bounded(self, work: Awaitable[T]) -> T:
+        """Await work while holding one of the max_workers slots."""
+        async with self._sem:
+            return await work
     
     def _build_structured_prompt(
         self,
@@ -79,31 +172,36 @@ class NanoBananaImageTool:
         The model performs best with structured prompts that clearly
         define Subject, Composition, Action, Location, and Style.
         """
-        parts = []
-        
-        # Subject (required)
-        parts.append(f"Subject: {subject}")
-        
-        # Composition (optional but recommended)
-        if composition:
-            parts.append(f"Composition: {composition}")
-        
-        # Action (optional)
-        if action:
-            parts.append(f"Action: {action}")
-        
-        # Location (optional)
-        if location:
-            parts.append(f"Location: {location}")
-        
-        # Style (required for consistency)
-        parts.append(f"Style: {style}")
-        
-        # Text rendering (Nano Banana Pro handles text well)
-        if text_to_render:
-            parts.append(f"Text in image: \"{text_to_render}\" (render clearly and legibly)")
+        return _structured_prompt(
+            subject, style, composition, action, location, text_to_render
+        )
+    
+    @staticmethod
+    def _asset_key(full_prompt: str, reference_data: List[bytes]) -> str:
+        """Content hash of everything that determines the generated image."""
+        digest = hashlib.sha256(settings.model_image.encode("utf-8"))
+        digest.update(full_prompt.encode("utf-8"))
+        # Reference order doesn't change the request's meaning
+        for ref_digest in sorted(hashlib.sha256(data).digest() for data in reference_data):
+            digest.update(ref_digest)
+        return digest.hexdigest()[:32]
+    
+    @staticmethod
+    async def _write_atomic(file_path: Path, data: bytes) -> None:
+        """
+        Write data next to file_path, then rename it into place.
         
-        return "\n".join(parts)
+        Concurrent readers (or a repeat request hitting the content-addressed
+        cache) never see a half-written PNG.
+        """
+        tmp_path = file_path.with_name(f".{file_path.name}.{uuid4().hex}.tmp")
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     async def generate_asset(
         self,
@@ -128,78 +226,39 @@ class NanoBananaImageTool:
         full_prompt = f"{prompt}\n\nStyle: {style}"
         
         try:
-            # Build content parts
-            content_parts = [types.Part(text=full_prompt)]
+            # Load reference images once, concurrently (up to 14 for brand
+            # consistency); their bytes feed both the request and the cache key
+            loaded = await asyncio.gather(
+                *(_load_reference(img_path) for img_path in (reference_images or [])[:14])
+            )
+            references = [ref for ref in loaded if ref is not None]
             
-            # Add reference images if provided (up to 14 for brand consistency)
-            if reference_images:
-                for i, img_path in enumerate(reference_images[:14]):
-                    try:
-                        with open(img_path, "rb") as f:
-                            img_data = base64.standard_b64encode(f.read()).decode("utf-8")
-                        
-                        # Determine MIME type
-                        path_lower = img_path.lower()
-                        if ".png" in path_lower:
-                            mime = "image/png"
-                        elif ".jpg" in path_lower or ".jpeg" in path_lower:
-                            mime = "image/jpeg"
-                        else:
-                            mime = "image/png"
-                        
-                        content_parts.append(
-                            types.Part(
-                                inline_data=types.Blob(
-                                    mime_type=mime,
-                                    data=img_data,
-                                )
-                            )
-                        )
-                    except Exception as e:
-                        print(f"Failed to load reference image {img_path}: {e}")
+            asset_key = self._asset_key(full_prompt, [raw for _, raw in references])
+            filename = f"asset_{asset_key}.png"
+            file_path = self.output_dir / filename
+            cache_key = (str(self.output_dir), asset_key)
             
-            # Call Nano Banana Pro (Gemini 3 Pro Image)
-            response = self.client.models.generate_content(
-                model=settings.model_image,  # gemini-3-pro-image-preview
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=content_parts
+            if save:
+                cached = self._asset_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+                if file_path.exists():
+                    asset = GeneratedAsset(
+                        success=True,
+                        file_path=str(file_path),
+                        file_name=filename,
+                        prompt_used=full_prompt,
+                        mime_type="image/png",
                     )
-                ],
-                config=types.GenerateContentConfig(
-                    response_modalities=["IMAGE"],
-                )
-            )
+                    self._asset_cache.set(cache_key, asset)
+                    return asset
             
-            # Extract generated image
-            for candidate in response.candidates:
-                for part in candidate.content.parts:
-                    if part.inline_data:
-                        # Decode image data
-                        image_data = base64.b64decode(part.inline_data.data)
-                        
-                        # Generate filename
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"asset_{timestamp}.png"
-                        file_path = self.output_dir / filename
-                        
-                        if save:
-                            with open(file_path, "wb") as f:
-                                f.write(image_data)
-                        
-                        return GeneratedAsset(
-                            success=True,
-                            file_path=str(file_path),
-                            file_name=filename,
-                            prompt_used=full_prompt,
-                            mime_type="image/png",
-                        )
-            
-            return GeneratedAsset(
-                success=False,
-                prompt_used=full_prompt,
-                error="No image was generated. Model may have refused the prompt."
+            # Identical concurrent requests share one model call
+            return await self._generate_flights.do(
+                (*cache_key, save),
+                lambda: self._bounded(self._generate_uncached(
+                    full_prompt, references, file_path, cache_key, save
+                )),
             )
             
         except Exception as e:
@@ -209,6 +268,74 @@ class NanoBananaImageTool:
                 error=str(e)
             )
     
+    async def _generate_uncached(
+        self,
+        full_prompt: str,
+        references: List[Tuple[str, bytes]],
+        file_path: Path,
+        cache_key: Tuple[str, str],
+        save: bool,
+    ) -> GeneratedAsset:
+        """Call the image model and save the result (no cache lookups)."""
+        # Build content parts
+        content_parts = [types.Part(text=full_prompt)]
+        for mime, raw in references:
+            # The SDK takes raw bytes and handles encoding itself
+            content_parts.append(
+                types.Part(inline_data=types.Blob(mime_type=mime, data=raw))
+            )
+        
+        # Call Nano Banana Pro (Gemini 3 Pro Image)
+        response = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(
+                self.client.models.generate_content,
+                model=settings.model_image,  # gemini-3-pro-image-preview
+                contents=[
+                    types.Content(
+                        role="user",
+                        parts=content_parts
+                    )
+                ],
+                config=types.GenerateContentConfig(
+                    response_modalities=["IMAGE"],
+                ),
+            ),
+        )
+        
+        # Extract generated image
+        for candidate in response.candidates:
+            for part in candidate.content.parts:
+                if part.inline_data:
+                    asset = GeneratedAsset(
+                        success=True,
+                        file_path=str(file_path),
+                        file_name=file_path.name,
+                        prompt_used=full_prompt,
+                        mime_type="image/png",
+                    )
+                    
+                    if save:
+                        raw = part.inline_data.data
+                        if isinstance(raw, (bytes, bytearray)):
+                            # Current SDKs already hand back decoded bytes
+                            image_data = raw
+                        else:
+                            # Decoding multi-MB base64 is CPU work - keep it off the loop
+                            image_data = await asyncio.get_running_loop().run_in_executor(
+                                None, base64.b64decode, raw
+                            )
+                        await self._write_atomic(file_path, image_data)
+                        self._asset_cache.set(cache_key, asset)
+                    
+                    return asset
+        
+        return GeneratedAsset(
+            success=False,
+            prompt_used=full_prompt,
+            error="No image was generated. Model may have refused the prompt."
+        )
+    
     async def generate_slide_background(
         self,
         theme: str,
@@ -230,11 +357,8 @@ class NanoBananaImageTool:
         if color_hints:
             color_text = f" incorporating these colors: {', '.join(color_hints)}"
         
-        prompt = self._build_structured_prompt(
-            subject=f"Abstract background pattern for {theme} presentation",
-            composition="Full frame, no focal point, suitable as background",
-            style=f"{mood}, subtle, not distracting, high resolution{color_text}",
-            location="Abstract/conceptual space"
+        prompt = _BACKGROUND_PROMPT.format(
+            theme=theme, mood=mood, color_text=color_text
         )
         
         return await self.generate_asset(
@@ -257,11 +381,7 @@ class NanoBananaImageTool:
         Returns:
             GeneratedAsset with the concept image
         """
-        prompt = self._build_structured_prompt(
-            subject=f"Visual metaphor representing {concept}",
-            composition="Centered, clean, easy to understand",
-            style=style,
-        )
+        prompt = _CONCEPT_PROMPT.format(concept=concept, style=style)
         
         return await self.generate_asset(
             prompt=prompt,
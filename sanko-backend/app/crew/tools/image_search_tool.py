@@ -9,14 +9,50 @@ This provides better image results than academic APIs which
 may return generic or low-quality images.
 """
 
+import asyncio
+import functools
 import httpx
-from typing import Optional, List
+import importlib.util
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Optional, List, TypeVar
 from pydantic import BaseModel, Field
 
-from google import genai
 from google.genai import types
 
-from app.config import settings
+from app.core.config import settings
+from app.clients.gemini.helpers import get_shared_client
+from app.core.cache import SingleFlight, TTLCache
+
+
+T = TypeVar("T")
+
+# HTTP/2 keeps one multiplexed connection per host when h2 is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One pooled client shared by every ImageSearchTool, so Unsplash lookups
+# reuse warm connections instead of a TCP+TLS handshake per tool instance
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
 
 
 class ImageSearchResult(BaseModel):
@@ -30,6 +66,13 @@ class ImageSearchResult(BaseModel):
     license_info: Optional[str] = Field(None, description="License if known")
 
 
+class _GoogleImageHit(BaseModel):
+    """Response schema for one image from the Google search prompt."""
+    url: str
+    source: str = ""
+    description: str = ""
+
+
 class ImageSearchTool:
     """
     Tool for searching images using multiple sources.
@@ -45,10 +88,27 @@ class ImageSearchTool:
     # Unsplash Source API (no key needed, limited features)
     UNSPLASH_SOURCE = "https://source.unsplash.com"
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Shared across instances: agents ask for the same concepts on many
+    # slides and re-runs, and identical concurrent searches share one call
+    _search_cache = TTLCache(maxsize=512, ttl=3600)
+    _search_flights = SingleFlight()
+    
+    # The genai client is synchronous; Google searches run here so they
+    # don't block the event loop (shared, so the cap is process-wide)
+    _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="image-search")
+    
+    def __init__(self, api_key: Optional[str] = None, max_workers: int = 10):
         self.api_key = api_key or settings.gemini_api_key
-        self.client = genai.Client(api_key=self.api_key)
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_shared_client(self.api_key)
+        # Caps concurrent uncached searches (each is an Unsplash HEAD plus a
+        # Gemini call) so batched tool calls queue instead of tripping rate limits
+        self.max_workers = max_workers
+        self._sem = asyncio.Semaphore(max_workers)
+    
+    async def _bounded(self, work: Awaitable[T]) -> T:
+        """Await work while holding one of the max_workers slots."""
+        async with self._sem:
+            return await work
     
     async def search_images(
         self,
@@ -67,6 +127,28 @@ class ImageSearchTool:
         Returns:
             List of ImageSearchResult
         """
+        cache_key = (query.strip().casefold(), max_results, size)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        results = await self._search_flights.do(
+            cache_key,
+            lambda: self._bounded(self._search_uncached(query, max_results, size)),
+        )
+        
+        # Empty results are usually transient failures - don't pin them
+        if results:
+            self._search_cache.set(cache_key, tuple(results))
+        return list(results)
+    
+    async def _search_uncached(
+        self,
+        query: str,
+        max_results: int,
+        size: str,
+    ) -> List[ImageSearchResult]:
+        """Query Unsplash, then Google, without consulting the cache."""
         results = []
         
         # Try Unsplash first (simple redirect-based API)
@@ -96,7 +178,7 @@ class ImageSearchTool:
             url = f"{self.UNSPLASH_SOURCE}/1600x900/?{query.replace(' ', ',')}"
             
             # Follow redirect to get actual image URL
-            response = await self._http_client.head(url, follow_redirects=True)
+            response = await _get_shared_client().head(url, follow_redirects=True)
             
             if response.status_code == 200:
                 final_url = str(response.url)
@@ -135,49 +217,44 @@ For each image found, provide:
 2. The source website
 3. A brief description
 
-Format as JSON array:
-[
-  {{"url": "...", "source": "...", "description": "..."}}
-]
-
 Only return images that are:
 - High resolution (at least 800px wide)
 - Relevant to the query
 - From reputable sources"""
 
             # Call Gemini with google_search tool enabled
-            response = self.client.models.generate_content(
-                model=settings.model_flash,
-                contents=[types.Content(
-                    role="user",
-                    parts=[types.Part(text=prompt)]
-                )],
-                config=types.GenerateContentConfig(
-                    tools=[types.Tool(google_search=types.GoogleSearch())],
-                    thinking_config=types.ThinkingConfig(
-                        thinking_level=settings.thinking_level_low
-                    )
-                )
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                functools.partial(
+                    self.client.models.generate_content,
+                    model=settings.model_flash,
+                    contents=[types.Content(
+                        role="user",
+                        parts=[types.Part(text=prompt)]
+                    )],
+                    config=types.GenerateContentConfig(
+                        tools=[types.Tool(google_search=types.GoogleSearch())],
+                        # Schema-constrained JSON: no prose to scan past
+                        response_mime_type="application/json",
+                        response_schema=list[_GoogleImageHit],
+                        candidate_count=1,
+                        thinking_config=types.ThinkingConfig(
+                            thinking_level=settings.thinking_level_low
+                        )
+                    ),
+                ),
             )
             
-            # Parse response
-            import json
-            import re
-            
-            response_text = response.text
-            json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
-            
-            if json_match:
-                images = json.loads(json_match.group())
-                return [
-                    ImageSearchResult(
-                        url=img.get("url", ""),
-                        title=img.get("description", ""),
-                        source=img.get("source", "Google Search"),
-                    )
-                    for img in images
-                    if img.get("url")
-                ]
+            images = json.loads(response.text or "[]")
+            return [
+                ImageSearchResult(
+                    url=img["url"],
+                    title=img.get("description", ""),
+                    source=img.get("source") or "Google Search",
+                )
+                for img in images
+                if img.get("url")
+            ]
         
         except Exception as e:
             print(f"Google image search failed: {e}")
@@ -204,7 +281,3 @@ Only return images that are:
         query = f"{concept} {context}".strip()
         results = await self.search_images(query, max_results=1)
         return results[0] if results else None
-    
-    async def close(self):
-        """Close HTTP client."""
-        await self._http_client.aclose()
@@ -6,15 +6,247 @@ Allows agents to render LaTeX equations, Mermaid diagrams, and format citations.
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
+import hashlib
+import json
+import os
+import time
+import weakref
+from functools import cached_property
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Hashable, Tuple
+from uuid import uuid4
+
+import aiofiles
 from crewai.tools import BaseTool
 from pydantic import Field
 
 from app.clients.render import RenderServiceClient
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.loop_thread import get_tool_loop
 
 logger = get_logger(__name__)
 
+# Optional orjson for serializing batch results (large SVG strings)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def _json_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+# ============================================================================
+# RENDER CACHE
+# ============================================================================
+
+# Renders are deterministic, so identical input (the same equation on
+# several slides, a rebuilt deck) is served from memory, then from disk,
+# before the render service is called
+_SVG_CACHE = TTLCache(maxsize=1024, ttl=24 * 3600)
+_CACHE_DIR: Optional[Path] = Path(settings.cache_dir) / "render" if settings.cache_dir else None
+
+# Disk writes between prune_render_cache sweeps
+_PRUNE_EVERY_WRITES = 256
+_writes_since_prune = 0
+
+
+def _cache_key(kind: str, content: str) -> str:
+    """Content address for a render result."""
+    return hashlib.blake2b(f"{kind}|{content}".encode(), digest_size=16).hexdigest()
+
+
+async def _cache_get(key: str) -> Optional[str]:
+    """Look a render result up in memory, then on disk."""
+    cached = _SVG_CACHE.get(key)
+    if cached is not None or _CACHE_DIR is None:
+        return cached
+    try:
+        async with aiofiles.open(_CACHE_DIR / key, "r", encoding="utf-8") as f:
+            cached = await f.read()
+    except OSError:
+        return None
+    _SVG_CACHE.set(key, cached)
+    return cached
+
+
+async def _cache_put(key: str, value: str) -> None:
+    """Store a render result in memory and (atomically) on disk."""
+    global _writes_since_prune
+    _SVG_CACHE.set(key, value)
+    if _CACHE_DIR is None:
+        return
+    tmp_path = _CACHE_DIR / f".{key}.{uuid4().hex}.tmp"
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+            await f.write(value)
+        os.replace(tmp_path, _CACHE_DIR / key)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug("Render cache write failed: %s", e)
+        return
+    
+    _writes_since_prune += 1
+    if _writes_since_prune >= _PRUNE_EVERY_WRITES:
+        _writes_since_prune = 0
+        await asyncio.to_thread(prune_render_cache)
+
+
+def prune_render_cache(
+    max_bytes: Optional[int] = None,
+    max_age_s: Optional[float] = None,
+) -> int:
+    """
+    Bound the on-disk render cache by age and total size.
+    
+    Removes files older than max_age_s, then the oldest remaining ones
+    until the directory fits in max_bytes. Blocking; run it in a thread
+    from async code.
+    
+    Args:
+        max_bytes: Size cap (default settings.render_cache_max_bytes)
+        max_age_s: Age cap (default settings.render_cache_max_age_s)
+    
+    Returns:
+        Number of files removed
+    """
+    if _CACHE_DIR is None:
+        return 0
+    if max_bytes is None:
+        max_bytes = settings.render_cache_max_bytes
+    if max_age_s is None:
+        max_age_s = settings.render_cache_max_age_s
+    
+    try:
+        with os.scandir(_CACHE_DIR) as it:
+            entries = sorted(
+                (st.st_mtime, st.st_size, entry.path)
+                for entry in it if entry.is_file()
+                for st in (entry.stat(),)
+            )
+    except FileNotFoundError:
+        return 0
+    
+    cutoff = time.time() - max_age_s
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, path in entries:  # oldest first
+        if mtime >= cutoff and total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    
+    if removed:
+        logger.info("Pruned %d file(s) from the render cache", removed)
+    return removed
+
+
+# ============================================================================
+# REQUEST COALESCING
+# ============================================================================
+
+class _RenderBatcher:
+    """
+    Coalesces concurrent single-item render requests into batch requests.
+    
+    The first request for a kind opens a short window (MAX_DELAY_S); every
+    request of the same kind arriving within it, up to the current batch
+    size, goes out in one HTTP call and each caller gets its own slot back.
+    The batch size adapts: it doubles when a batch fills before its window
+    closes and halves when windows close mostly empty.
+    
+    Bound to the event loop it is used on, like the client it wraps.
+    
+    Kinds:
+        "latex": payload is a LaTeX string, sent via /render/batch
+        ("citation", style): payload is a citation dict, sent via /render/citation
+    """
+    
+    MAX_DELAY_S = 0.005
+    MIN_BATCH = 4
+    MAX_BATCH = 64
+    
+    def __init__(self, client: RenderServiceClient):
+        self.client = client
+        self.batch_size = self.MIN_BATCH
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._flushes: set = set()
+    
+    async def submit(self, kind: Hashable, payload: Any) -> Dict[str, Any]:
+        """
+        Queue one item and wait for its share of the batched response.
+        
+        Returns:
+            Result dict shaped like the matching single-item client call
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(kind, [])
+        pending.append((payload, future))
+        
+        if len(pending) >= self.batch_size:
+            self.batch_size = min(self.batch_size * 2, self.MAX_BATCH)
+            self._dispatch(kind)
+        elif kind not in self._timers:
+            self._timers[kind] = loop.call_later(self.MAX_DELAY_S, self._on_window_closed, kind)
+        return await future
+    
+    def _on_window_closed(self, kind: Hashable) -> None:
+        if len(self._pending.get(kind, ())) * 2 < self.batch_size:
+            self.batch_size = max(self.batch_size // 2, self.MIN_BATCH)
+        self._dispatch(kind)
+    
+    def _dispatch(self, kind: Hashable) -> None:
+        timer = self._timers.pop(kind, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(kind, None)
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._flush(kind, batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, kind: Hashable, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        payloads = [payload for payload, _ in batch]
+        try:
+            results = await self._send(kind, payloads)
+        except Exception as e:
+            results = [{"success": False, "error": str(e)}] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def _send(self, kind: Hashable, payloads: List[Any]) -> List[Dict[str, Any]]:
+        if kind == "latex":
+            if len(payloads) == 1:
+                return [await self.client.render_latex(payloads[0])]
+            return await self.client.render_latex_batch(payloads)
+        
+        _, style = kind
+        response = await self.client.format_citations(payloads, style)
+        entries = response.get("citations") if response.get("success", True) else None
+        if not entries or len(entries) != len(payloads):
+            error = response.get("error", "Malformed citation response")
+            return [{"success": False, "error": error}] * len(payloads)
+        return [{"success": True, "formatted": entry["formatted"]} for entry in entries]
+
+
+# ============================================================================
+# TOOL
+# ============================================================================
+
 
 class RenderServiceTool(BaseTool):
     """
@@ -38,16 +270,33 @@ Available actions:
 3. format_citation: Format citation in specified style
    Input: {"action": "citation", "citation": {...}, "style": "apa"}
 
+4. batch: Render several LaTeX/Mermaid items in one call
+   Input: {"action": "batch", "jobs": [{"type": "latex", "content": "E = mc^2"}, {"type": "mermaid", "content": "graph TD\\n    A-->B"}]}
+   Returns a JSON array with one SVG (or "Error: ...") per job, in order.
+
 Returns SVG strings for equations/diagrams, formatted text for citations.
 """
     
-    _client: Optional[RenderServiceClient] = None
+    @cached_property
+    def _batchers(self) -> "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _RenderBatcher]":
+        # One client (and batcher) per event loop: an httpx pool is bound to
+        # the loop it was first used on. Sync _run calls all share the
+        # background tool loop, and async callers (the flow) keep theirs, so
+        # both stay warm.
+        return weakref.WeakKeyDictionary()
+    
+    def _get_batcher(self) -> _RenderBatcher:
+        """Get or create the request batcher for the running loop."""
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            batcher = self._batchers[loop] = _RenderBatcher(RenderServiceClient())
+        return batcher
     
-    def _get_client(self) -> RenderServiceClient:
-        """Get or create the render service client."""
-        if self._client is None:
-            self._client = RenderServiceClient()
-        return self._client
+    @property
+    def client(self) -> RenderServiceClient:
+        """The render service client for the running loop."""
+        return self._get_batcher().client
     
     def _run(
         self,
@@ -56,22 +305,62 @@ Returns SVG strings for equations/diagrams, formatted text for citations.
         citation: Optional[Dict[str, Any]] = None,
         citations: Optional[List[Dict[str, Any]]] = None,
         style: str = "apa",
+        jobs: Optional[List[Dict[str, str]]] = None,
     ) -> str:
         """
         Execute a render action.
         
         Args:
-            action: "latex", "mermaid", or "citation"
+            action: "latex", "mermaid", "citation", or "batch"
             content: LaTeX or Mermaid code (for latex/mermaid actions)
             citation: Single citation dict (for citation action)
             citations: List of citations (for batch citation formatting)
             style: Citation style (apa, ieee, harvard, chicago)
+            jobs: [{"type": "latex"|"mermaid", "content": ...}] (for batch action)
+            
+        Returns:
+            Rendered result as string (SVG for equations/diagrams, formatted text for citations,
+            JSON array of per-job results for batch)
+        """
+        # Run on the persistent tool loop so the client's connections are reused
+        return get_tool_loop().run(
+            self._async_run(action, content, citation, citations, style, jobs)
+        )
+    
+    async def _arun(
+        self,
+        action: str,
+        content: Optional[str] = None,
+        citation: Optional[Dict[str, Any]] = None,
+        citations: Optional[List[Dict[str, Any]]] = None,
+        style: str = "apa",
+        jobs: Optional[List[Dict[str, str]]] = None,
+    ) -> str:
+        """
+        Execute a render action on the caller's event loop.
+        
+        Same arguments and result as _run(); use this from async code so
+        concurrent renders share one loop and HTTP connection pool.
+        """
+        return await self._async_run(action, content, citation, citations, style, jobs)
+    
+    async def render_batch(self, jobs: List[Dict[str, str]]) -> List[str]:
+        """
+        Render several LaTeX/Mermaid items in one call.
+        
+        Items are rendered concurrently, and LaTeX items are coalesced with
+        any other renders in flight; a failure only affects its own slot.
+        
+        Args:
+            jobs: [{"type": "latex"|"mermaid", "content": ...}, ...]
             
         Returns:
-            Rendered result as string (SVG for equations/diagrams, formatted text for citations)
+            One SVG string (or "Error: ..." message) per job, in job order
         """
-        # Run async code in sync context
-        return asyncio.run(self._async_run(action, content, citation, citations, style))
+        return list(await asyncio.gather(*(
+            self._async_run(job.get("type", ""), job.get("content"), None, None, "apa")
+            for job in jobs
+        )))
     
     async def _async_run(
         self,
@@ -80,49 +369,97 @@ Returns SVG strings for equations/diagrams, formatted text for citations.
         citation: Optional[Dict[str, Any]],
         citations: Optional[List[Dict[str, Any]]],
         style: str,
+        jobs: Optional[List[Dict[str, str]]] = None,
     ) -> str:
         """Async implementation of the render action."""
-        client = self._get_client()
+        if action == "batch":
+            if not jobs:
+                return "Error: 'jobs' is required for batch rendering"
+            if any(job.get("type") not in ("latex", "mermaid") for job in jobs):
+                return "Error: batch jobs must have type 'latex' or 'mermaid'"
+            return _json_dumps(await self.render_batch(jobs))
+        
+        batcher = self._get_batcher()
+        client = batcher.client
         
         try:
             if action == "latex":
                 if not content:
                     return "Error: 'content' is required for latex rendering"
-                result = await client.render_latex(content)
+                key = _cache_key("latex", content)
+                cached = await _cache_get(key)
+                if cached is not None:
+                    return cached
+                result = await batcher.submit("latex", content)
                 if result.get("success", True) and "svg" in result:
+                    await _cache_put(key, result["svg"])
                     return result["svg"]
                 return f"Error rendering LaTeX: {result.get('error', 'Unknown error')}"
             
             elif action == "mermaid":
                 if not content:
                     return "Error: 'content' is required for mermaid rendering"
+                key = _cache_key("mermaid", content)
+                cached = await _cache_get(key)
+                if cached is not None:
+                    return cached
                 result = await client.render_mermaid(content)
                 if result.get("success", True) and "svg" in result:
+                    await _cache_put(key, result["svg"])
                     return result["svg"]
                 return f"Error rendering Mermaid: {result.get('error', 'Unknown error')}"
             
             elif action == "citation":
+                key = None
                 if citations:
                     result = await client.format_citations(citations, style)
                 elif citation:
-                    result = await client.format_citation(citation, style)
+                    key = _cache_key(f"citation|{style}", json.dumps(citation, sort_keys=True))
+                    cached = await _cache_get(key)
+                    if cached is not None:
+                        return cached
+                    result = await batcher.submit(("citation", style), citation)
                 else:
                     return "Error: 'citation' or 'citations' is required"
                 
                 if result.get("success", True) and "citations" in result:
                     return "\n".join(result["citations"])
                 elif result.get("success", True) and "formatted" in result:
+                    if key is not None:
+                        await _cache_put(key, result["formatted"])
                     return result["formatted"]
                 return f"Error formatting citation: {result.get('error', 'Unknown error')}"
             
             else:
-                return f"Error: Unknown action '{action}'. Use 'latex', 'mermaid', or 'citation'"
+                return f"Error: Unknown action '{action}'. Use 'latex', 'mermaid', 'citation', or 'batch'"
                 
         except Exception as e:
             logger.error(f"RenderServiceTool error: {e}")
             return f"Error: {str(e)}"
 
 
+# Process-wide tool so keep-alive connections to the render service stay
+# warm across slides and sessions
+_shared_render_tool: Optional[RenderServiceTool] = None
+
+
 def get_render_tool() -> RenderServiceTool:
-    """Get a configured RenderService tool."""
-    return RenderServiceTool()
+    """Get the shared RenderService tool."""
+    global _shared_render_tool
+    if _shared_render_tool is None:
+        _shared_render_tool = RenderServiceTool()
+    return _shared_render_tool
+
+
+async def warm_render_tool() -> bool:
+    """
+    Open a connection to the render service ahead of the first render.
+    
+    Returns:
+        True if the render service answered its health check
+    """
+    tool = get_render_tool()
+    healthy = await tool.client.health_check()
+    if not healthy:
+        logger.warning("Render service not reachable; renders will fail until it is up")
+    return healthy
@@ -5,15 +5,53 @@ Purpose: Convert PDF documents into a structured KnowledgeBase
 using Gemini 3 Flash multimodal capabilities.
 """
 
+import asyncio
+import concurrent.futures
+import io
 import os
 import json
+from typing import List, Optional, Tuple, Union
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 from google import genai
 from google.genai import types
 
+from app.clients.gemini.helpers import get_shared_client
 from app.models.schemas import KnowledgeBase
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.loop_thread import get_tool_loop
+
+logger = get_logger(__name__)
+
+# Optional orjson for parsing model JSON (its JSONDecodeError subclasses
+# json.JSONDecodeError, so except clauses work with either parser)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    _json_loads = json.loads
+
+# Optional: pypdf splits PDFs into page chunks that are synthesized
+# concurrently and extracts their text for the text fast path; without it
+# the whole file goes out in one vision request
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:  # pragma: no cover - depends on environment
+    PdfReader = PdfWriter = None
+
+SYNTHESIS_MODEL = "gemini-3-flash-preview"
+
+# Pages per concurrent synthesis request
+PAGES_PER_CHUNK = 5
+
+# Extra attempts for page chunks that fail (transient provider errors)
+CHUNK_RETRIES = 1
+
+# "auto" PDF handling sends extracted text instead of the PDF when pages
+# average more than this many characters (born-digital, not scanned)
+TEXT_DENSITY_THRESHOLD = 500
 
 # System prompt for the Gemini model
 SYNTHESIS_PROMPT = """
@@ -42,6 +80,88 @@ FOLLOW THESE STRICT RULES:
 Output ONLY the JSON object. Do not include any other text or formatting.
 """
 
+# Appended to SYNTHESIS_PROMPT when the PDF part is a page chunk
+CHUNK_NOTE = """
+NOTE: The provided document contains pages {first}-{last} of a longer document. Only extract these pages, and give every 'page_range' in the original document's page numbers.
+"""
+
+# Merges the per-chunk summaries of a chunked PDF into one overview
+SUMMARY_MERGE_PROMPT = """
+The following are summaries of consecutive parts of one document. Write a single high-level overview of the whole document in one paragraph. Output only the overview text.
+
+{summaries}
+"""
+
+
+# Page chunk: (first_page, last_page, content); pages are None if unsplit.
+# Content is PDF bytes (vision path) or extracted text (text path).
+PdfChunk = Tuple[Optional[int], Optional[int], Union[bytes, str]]
+
+
+def extract_pdf_text(pdf_data: bytes) -> List[str]:
+    """
+    Extract the text layer of each page.
+    
+    Returns:
+        One string per page, or an empty list if pypdf is unavailable or
+        the file can't be parsed
+    """
+    if PdfReader is None:
+        return []
+    try:
+        reader = PdfReader(io.BytesIO(pdf_data))
+        return [page.extract_text() or "" for page in reader.pages]
+    except Exception as e:
+        logger.warning("Could not extract PDF text, using vision: %s", e)
+        return []
+
+
+def text_chunks(pages: List[str], pages_per_chunk: int = PAGES_PER_CHUNK) -> List[PdfChunk]:
+    """Group extracted pages into chunks, marking page breaks as layout hints."""
+    chunks = []
+    for start in range(0, len(pages), pages_per_chunk):
+        end = min(start + pages_per_chunk, len(pages))
+        text = "\n\n".join(
+            f"--- Page {number} ---\n{pages[number - 1]}"
+            for number in range(start + 1, end + 1)
+        )
+        chunks.append((start + 1, end, text))
+    if len(chunks) == 1:
+        return [(None, None, chunks[0][2])]
+    return chunks
+
+
+def split_pdf(pdf_data: bytes, pages_per_chunk: int = PAGES_PER_CHUNK) -> List[PdfChunk]:
+    """
+    Split a PDF into standalone PDFs of at most pages_per_chunk pages.
+    
+    Falls back to a single unsplit chunk when pypdf is unavailable, the
+    file can't be parsed, or it is short enough to send whole.
+    """
+    whole = [(None, None, pdf_data)]
+    if PdfReader is None:
+        return whole
+    try:
+        reader = PdfReader(io.BytesIO(pdf_data))
+        page_count = len(reader.pages)
+        if page_count <= pages_per_chunk:
+            return whole
+        
+        chunks = []
+        for start in range(0, page_count, pages_per_chunk):
+            end = min(start + pages_per_chunk, page_count)
+            writer = PdfWriter()
+            for index in range(start, end):
+                writer.add_page(reader.pages[index])
+            buf = io.BytesIO()
+            writer.write(buf)
+            chunks.append((start + 1, end, buf.getvalue()))
+        return chunks
+    except Exception as e:
+        logger.warning("Could not split PDF into page chunks, sending whole file: %s", e)
+        return whole
+
+
 class SynthesisToolInput(BaseModel):
     """Input for the SynthesisTool."""
     file_path: str = Field(description="The path to the PDF file to be synthesized.")
@@ -51,34 +171,69 @@ class SynthesisTool(BaseTool):
     description: str = "Processes a PDF file, extracting its structure, text, and visual elements into a structured KnowledgeBase."
     args_schema: type[BaseModel] = SynthesisToolInput
 
-    def _run(self, file_path: str) -> KnowledgeBase:
+    def _run(self, file_path: str) -> Union[KnowledgeBase, str]:
+        # Sync entry point (CrewAI, process pool): drive the async
+        # implementation on the shared background loop. Large PDFs outlast
+        # a regular tool call, so this waits on its own limit.
+        timeout = settings.synthesis_timeout_s or None
+        future = get_tool_loop().submit(self._run_async(file_path))
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return f"Error: Synthesis of {file_path} timed out after {timeout:g}s"
+    
+    async def _arun(self, file_path: str) -> Union[KnowledgeBase, str]:
+        return await self._run_async(file_path)
+    
+    async def _run_async(self, file_path: str) -> Union[KnowledgeBase, str]:
+        """
+        Synthesize a PDF, sending its page chunks to Gemini concurrently.
+        
+        Failed page chunks are retried; if any still fails the whole file
+        is reported as an error rather than returned partially.
+        
+        Returns:
+            The merged KnowledgeBase, or an "Error: ..." message
+        """
         api_key = settings.gemini_api_key
         if not api_key:
             return "Error: GEMINI_API_KEY not configured."
 
-        client = genai.Client(api_key=api_key)
+        client = get_shared_client(api_key)
         
         try:
-            with open(file_path, "rb") as f:
-                pdf_data = f.read()
-
-            response = client.models.generate_content(
-                model="gemini-3-flash-preview",
-                contents=[
-                    types.Part.from_bytes(data=pdf_data, mime_type="application/pdf"),
-                    SYNTHESIS_PROMPT
-                ],
-                config=types.GenerateContentConfig(
-                    temperature=0.0,
-                    response_mime_type="application/json",
+            # Reading and splitting are blocking / CPU-bound
+            chunks = await asyncio.to_thread(self._load_chunks, file_path)
+            
+            semaphore = asyncio.Semaphore(max(1, settings.gemini_concurrency))
+            results: list = [None] * len(chunks)
+            pending = list(range(len(chunks)))
+            for _ in range(1 + CHUNK_RETRIES):
+                outcomes = await asyncio.gather(
+                    *(self._synthesize_chunk(client, chunks[i], semaphore) for i in pending),
+                    return_exceptions=True,
                 )
-            )
+                for i, outcome in zip(pending, outcomes):
+                    results[i] = outcome
+                pending = [i for i in pending if isinstance(results[i], Exception)]
+                if not pending:
+                    break
             
-            # The response should be a JSON string, parse it
-            response_json = json.loads(response.text)
-            knowledge_base = KnowledgeBase(**response_json)
+            if pending:
+                if len(chunks) == 1:
+                    raise results[0]
+                failed = ", ".join(f"{chunks[i][0]}-{chunks[i][1]}" for i in pending)
+                logger.warning("Synthesis of pages %s of %s failed: %s", failed, file_path, results[pending[0]])
+                return f"Error: Synthesis failed for pages {failed} of {file_path}"
             
-            return knowledge_base
+            parts = results
+            if len(parts) == 1:
+                return parts[0]
+            return KnowledgeBase(
+                summary=await self._merge_summaries(client, [p.summary for p in parts]),
+                sections=[section for part in parts for section in part.sections],
+            )
 
         except FileNotFoundError:
             return f"Error: File not found at {file_path}"
@@ -86,3 +241,66 @@ class SynthesisTool(BaseTool):
             return "Error: Failed to decode JSON from Gemini response."
         except Exception as e:
             return f"An unexpected error occurred: {e}"
+    
+    @staticmethod
+    def _load_chunks(file_path: str) -> List[PdfChunk]:
+        with open(file_path, "rb") as f:
+            pdf_data = f.read()
+        
+        # Text fast path: born-digital PDFs skip Gemini's per-page vision
+        # rendering entirely
+        handling = settings.pdf_handling
+        if handling != "vision":
+            pages = extract_pdf_text(pdf_data)
+            if pages:
+                density = sum(len(page) for page in pages) / len(pages)
+                if handling == "text" or density > TEXT_DENSITY_THRESHOLD:
+                    logger.info("Synthesizing %s from extracted text (%.0f chars/page)", file_path, density)
+                    return text_chunks(pages)
+            elif handling == "text":
+                logger.warning("No text extracted from %s, falling back to vision", file_path)
+        return split_pdf(pdf_data)
+    
+    async def _synthesize_chunk(
+        self,
+        client: genai.Client,
+        chunk: PdfChunk,
+        semaphore: asyncio.Semaphore,
+    ) -> KnowledgeBase:
+        """Extract one page chunk into a KnowledgeBase."""
+        first, last, content = chunk
+        prompt = SYNTHESIS_PROMPT
+        if first is not None:
+            prompt += CHUNK_NOTE.format(first=first, last=last)
+        
+        if isinstance(content, str):
+            contents = [prompt + "\n\nDOCUMENT TEXT:\n" + content]
+        else:
+            contents = [types.Part.from_bytes(data=content, mime_type="application/pdf"), prompt]
+        
+        async with semaphore:
+            response = await client.aio.models.generate_content(
+                model=SYNTHESIS_MODEL,
+                contents=contents,
+                config=types.GenerateContentConfig(
+                    temperature=0.0,
+                    response_mime_type="application/json",
+                )
+            )
+        
+        # The response should be a JSON string, parse it
+        return KnowledgeBase(**_json_loads(response.text))
+    
+    async def _merge_summaries(self, client: genai.Client, summaries: List[str]) -> str:
+        """Combine per-chunk summaries with one small text-only call."""
+        try:
+            response = await client.aio.models.generate_content(
+                model=SYNTHESIS_MODEL,
+                contents=SUMMARY_MERGE_PROMPT.format(summaries="\n\n".join(summaries)),
+                config=types.GenerateContentConfig(temperature=0.0),
+            )
+            if response.text and response.text.strip():
+                return response.text.strip()
+        except Exception as e:
+            logger.warning("Summary merge failed, joining chunk summaries: %s", e)
+        return " ".join(summaries)
@@ -13,15 +13,90 @@ Usage:
     print(f"Match score: {result.match_score}")  # 0.0 - 1.0
 """
 
+import asyncio
 import httpx
-import base64
-from typing import Optional, List
+import importlib.util
+import json
+from pathlib import PurePosixPath
+from typing import Optional, List, Tuple
+from urllib.parse import urlparse
 from pydantic import BaseModel, Field
 
-from google import genai
 from google.genai import types
 
-from app.config import settings
+from app.core.config import settings
+from app.clients.gemini.helpers import get_shared_client
+from app.core.cache import SingleFlight, TTLCache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Optional orjson for parsing model JSON (its JSONDecodeError subclasses
+# json.JSONDecodeError, so except clauses work with either parser)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    _json_loads = json.loads
+
+# HTTP/2 multiplexes image downloads per host when h2 is installed
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Leading-byte signatures of the image formats Gemini accepts
+_MAGIC = {
+    b"\x89PNG": "image/png",
+    b"\xff\xd8\xff": "image/jpeg",
+    b"GIF8": "image/gif",
+}
+
+# Fallback for unrecognized content, keyed by the URL path's extension
+_EXTENSION_MIME = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+}
+
+# Only these URLs are downloaded; anything else is rejected up front
+_FETCHABLE_SCHEMES = frozenset({"http", "https"})
+
+# Formats Gemini can't take as inline image data
+_UNSUPPORTED_MIME_TYPES = frozenset({"image/svg+xml"})
+
+# One pooled client shared by every VisionTool, so image downloads reuse
+# warm connections instead of a TCP+TLS handshake per tool instance
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Image hosts (Wikimedia, Unsplash) redirect to CDNs and may
+            # refuse requests without a User-Agent
+            follow_redirects=True,
+            headers={"User-Agent": "SankoSlides/0.2"},
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client (call on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
 
 
 class VisionVerification(BaseModel):
@@ -33,6 +108,42 @@ class VisionVerification(BaseModel):
     issues: List[str] = Field(default_factory=list, description="Any problems detected")
 
 
+# Verification instructions, identical for every batch; each image follows
+# as its own "IMAGE n / EXPECTED DESCRIPTION" text part plus the image
+_VERIFY_PROMPT = """Analyze each image below and compare it to its expected description. Each image is preceded by its index and expected description.
+
+For every image:
+1. Describe what you actually see in the image
+2. Compare it to the expected description
+3. Give a match score from 0.0 to 1.0
+4. List any issues or mismatches
+
+Respond with a JSON array holding one object per image, like:
+[
+    {
+        "index": 0,
+        "actual_description": "What you see in the image",
+        "match_score": 0.85,
+        "reasoning": "Why you gave this score",
+        "issues": ["Issue 1", "Issue 2"]
+    }
+]
+
+Be strict but fair. A perfect match is 1.0. Minor differences are 0.8-0.9. 
+Somewhat related is 0.5-0.7. Not related is 0.0-0.4."""
+
+_VERIFY_PROMPT_PART = types.Part(text=_VERIFY_PROMPT)
+
+
+class _VerificationEntry(BaseModel):
+    """Response schema for one image's verdict in a verification batch."""
+    index: int
+    actual_description: str
+    match_score: float
+    reasoning: str
+    issues: List[str] = Field(default_factory=list)
+
+
 class VisionTool:
     """
     Tool for verifying image relevance using Gemini 3 Flash Preview.
@@ -43,38 +154,66 @@ class VisionTool:
     """
     
     MATCH_THRESHOLD = 0.7  # Score >= this is considered a match
+    MAX_CONCURRENT_DOWNLOADS = 16  # Per verify_images_batch call
+    
+    # Verification is deterministic per (url, description), so successful
+    # analyses are shared across instances and concurrent duplicates
+    _verify_cache = TTLCache(maxsize=1024, ttl=3600)
+    _verify_flights = SingleFlight()
     
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.gemini_api_key
-        self.client = genai.Client(api_key=self.api_key)
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+        self.client = get_shared_client(self.api_key)
     
     async def download_image(self, url: str) -> Optional[bytes]:
         """Download image from URL."""
+        image = await self._stream_image(url)
+        return image[0] if image else None
+    
+    async def _stream_image(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Stream an image into a single buffer and detect its MIME type.
+        
+        Gives up as soon as the image is known to exceed
+        settings.max_image_bytes, instead of buffering it first.
+        
+        Returns:
+            (image bytes, MIME type), or None if the download failed
+        """
+        limit = settings.max_image_bytes
         try:
-            response = await self._http_client.get(url)
-            response.raise_for_status()
-            return response.content
+            async with _get_shared_client().stream("GET", url) as response:
+                response.raise_for_status()
+                declared = int(response.headers.get("content-length") or 0)
+                if declared > limit:
+                    raise ValueError(f"image is {declared} bytes (limit {limit})")
+                
+                buf = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buf += chunk
+                    if len(buf) > limit:
+                        raise ValueError(f"image exceeds {limit} bytes")
+            
+            image_data = bytes(buf)
+            return image_data, self._get_mime_type(url, image_data)
         except Exception as e:
-            print(f"Failed to download image from {url}: {e}")
+            logger.warning("Failed to download image from %s: %s", url, e)
             return None
     
     def _get_mime_type(self, url: str, content: bytes) -> str:
-        """Determine MIME type from URL or content."""
-        url_lower = url.lower()
-        if ".png" in url_lower:
-            return "image/png"
-        elif ".jpg" in url_lower or ".jpeg" in url_lower:
-            return "image/jpeg"
-        elif ".gif" in url_lower:
-            return "image/gif"
-        elif ".webp" in url_lower:
+        """Determine MIME type from the content's magic bytes, then the URL path."""
+        for signature, mime_type in _MAGIC.items():
+            if content.startswith(signature):
+                return mime_type
+        if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
             return "image/webp"
-        elif ".svg" in url_lower:
+        head = content[:256].lstrip()
+        if head.startswith(b"<svg") or (head.startswith(b"<?xml") and b"<svg" in content[:1024]):
             return "image/svg+xml"
-        else:
-            # Default to JPEG if can't determine
-            return "image/jpeg"
+        
+        # Unrecognized content: use the URL path's extension, else JPEG
+        suffix = PurePosixPath(urlparse(url).path).suffix.lower()
+        return _EXTENSION_MIME.get(suffix, "image/jpeg")
     
     async def verify_image(
         self,
@@ -91,117 +230,198 @@ class VisionTool:
         Returns:
             VisionVerification with match score and analysis
         """
-        # Download the image
-        image_data = await self.download_image(image_url)
-        
-        if not image_data:
-            return VisionVerification(
-                match_score=0.0,
-                is_match=False,
-                actual_description="Failed to download image",
-                reasoning="Could not retrieve image from URL",
-                issues=["Image download failed"]
-            )
+        return (await self.verify_images_batch([(image_url, expected_description)]))[0]
+    
+    async def verify_images_batch(
+        self,
+        items: List[Tuple[str, str]],
+    ) -> List[VisionVerification]:
+        """
+        Verify several images against their descriptions in one Gemini call.
         
-        # Encode for Gemini
-        image_b64 = base64.standard_b64encode(image_data).decode("utf-8")
-        mime_type = self._get_mime_type(image_url, image_data)
+        Images are downloaded concurrently and sent together, so K checks
+        cost one model round trip instead of K.
+        
+        Args:
+            items: (image_url, expected_description) pairs
+            
+        Returns:
+            One VisionVerification per item, in order
+        """
+        results = [self._verify_cache.get(item) for item in items]
+        pending = list(dict.fromkeys(
+            item for item, cached in zip(items, results) if cached is None
+        ))
+        if not pending:
+            return results
+        
+        verdicts = await self._verify_flights.do(
+            tuple(pending),
+            lambda: self._verify_uncached(pending),
+        )
+        by_item = dict(zip(pending, verdicts))
+        return [cached or by_item[item] for item, cached in zip(items, results)]
+    
+    async def _verify_uncached(
+        self,
+        items: List[Tuple[str, str]],
+    ) -> List[VisionVerification]:
+        """
+        Download and analyze the images, caching parsed verdicts.
+        
+        Images that can't be analyzed (non-HTTP URLs, failed or oversized
+        downloads, SVG) get a synthetic verdict without a Gemini call.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+        
+        async def fetch(url: str) -> Optional[Tuple[bytes, str]]:
+            async with semaphore:
+                return await self._stream_image(url)
+        
+        verdicts: List[Optional[VisionVerification]] = [None] * len(items)
+        fetchable = []
+        for i, (image_url, _) in enumerate(items):
+            if urlparse(image_url).scheme.lower() in _FETCHABLE_SCHEMES:
+                fetchable.append(i)
+            else:
+                verdicts[i] = self._rejected(
+                    "Unsupported image URL",
+                    "Image URL must use http or https",
+                )
+        
+        images = await asyncio.gather(*(fetch(items[i][0]) for i in fetchable))
+        
+        downloaded = []
+        for i, image in zip(fetchable, images):
+            if image is None:
+                # Includes images over settings.max_image_bytes
+                verdicts[i] = self._rejected(
+                    "Could not retrieve image from URL",
+                    "Image download failed",
+                    actual_description="Failed to download image",
+                )
+            elif image[1] in _UNSUPPORTED_MIME_TYPES:
+                verdicts[i] = self._rejected(
+                    f"{image[1]} images can't be analyzed inline",
+                    "Unsupported image format",
+                )
+            else:
+                downloaded.append((i, image))
+        
+        if downloaded:
+            analyzed = await self._analyze_images(
+                [items[i] for i, _ in downloaded],
+                [image for _, image in downloaded],
+            )
+            for (i, _), verdict in zip(downloaded, analyzed):
+                verdicts[i] = verdict
+        return verdicts
+    
+    @staticmethod
+    def _rejected(
+        reasoning: str,
+        issue: str,
+        actual_description: str = "Image not analyzed",
+    ) -> VisionVerification:
+        """Verdict for an image that was never sent to the model."""
+        return VisionVerification(
+            match_score=0.0,
+            is_match=False,
+            actual_description=actual_description,
+            reasoning=reasoning,
+            issues=[issue]
+        )
+    
+    async def _analyze_images(
+        self,
+        items: List[Tuple[str, str]],
+        images: List[Tuple[bytes, str]],
+    ) -> List[VisionVerification]:
+        """Send downloaded images to Gemini in one request and parse the verdicts."""
+        parts = [_VERIFY_PROMPT_PART]
+        for index, ((_, expected_description), (image_data, mime_type)) in enumerate(zip(items, images)):
+            parts.append(types.Part(text=f"IMAGE {index}\nEXPECTED DESCRIPTION: {expected_description}"))
+            # The SDK base64-encodes Blob data itself
+            parts.append(types.Part(inline_data=types.Blob(
+                mime_type=mime_type,
+                data=image_data,
+            )))
         
-        # Build verification prompt
-        prompt = f"""Analyze this image and compare it to the expected description.
-
-EXPECTED DESCRIPTION: {expected_description}
-
-Your task:
-1. Describe what you actually see in the image
-2. Compare it to the expected description
-3. Give a match score from 0.0 to 1.0
-4. List any issues or mismatches
-
-Respond in this exact JSON format:
-{{
-    "actual_description": "What you see in the image",
-    "match_score": 0.85,
-    "reasoning": "Why you gave this score",
-    "issues": ["Issue 1", "Issue 2"]
-}}
-
-Be strict but fair. A perfect match is 1.0. Minor differences are 0.8-0.9. 
-Somewhat related is 0.5-0.7. Not related is 0.0-0.4."""
-
         try:
             # Call Gemini 3 Flash with HIGH thinking for careful analysis
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=settings.model_flash,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[
-                            types.Part(text=prompt),
-                            types.Part(
-                                inline_data=types.Blob(
-                                    mime_type=mime_type,
-                                    data=image_b64,
-                                )
-                            )
-                        ]
-                    )
-                ],
+                contents=[types.Content(role="user", parts=parts)],
                 config=types.GenerateContentConfig(
+                    # Schema-constrained JSON: parsed whole, no scanning
+                    response_mime_type="application/json",
+                    response_schema=list[_VerificationEntry],
                     thinking_config=types.ThinkingConfig(
                         thinking_level=settings.thinking_level_high
                     )
                 )
             )
-            
-            response_text = response.text
-            
-            # Parse JSON response
-            import json
-            import re
-            
-            json_match = re.search(r'\{[^{}]*\}', response_text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                score = float(data.get("match_score", 0.5))
-                return VisionVerification(
+        except Exception as e:
+            return [
+                VisionVerification(
+                    match_score=0.0,
+                    is_match=False,
+                    actual_description="Error during analysis",
+                    reasoning=str(e),
+                    issues=[f"Vision analysis error: {str(e)}"]
+                )
+                for _ in items
+            ]
+        
+        response_text = response.text or ""
+        
+        entries = {}
+        try:
+            for entry in _json_loads(response_text):
+                if isinstance(entry, dict):
+                    entries[int(entry.get("index", -1))] = entry
+        except (ValueError, TypeError):
+            pass
+        
+        verdicts = []
+        for index, item in enumerate(items):
+            entry = entries.get(index)
+            try:
+                score = float(entry.get("match_score", 0.5))
+                verdict = VisionVerification(
                     match_score=score,
                     is_match=score >= self.MATCH_THRESHOLD,
-                    actual_description=data.get("actual_description", ""),
-                    reasoning=data.get("reasoning", ""),
-                    issues=data.get("issues", [])
+                    actual_description=entry.get("actual_description", ""),
+                    reasoning=entry.get("reasoning", ""),
+                    issues=entry.get("issues", [])
                 )
+            except (AttributeError, ValueError, TypeError):
+                # Fallback if parsing fails
+                verdicts.append(VisionVerification(
+                    match_score=0.5,
+                    is_match=False,
+                    actual_description=response_text[:200],
+                    reasoning="Could not parse structured response",
+                    issues=["Response parsing failed"]
+                ))
+                continue
             
-            # Fallback if parsing fails
-            return VisionVerification(
-                match_score=0.5,
-                is_match=False,
-                actual_description=response_text[:200],
-                reasoning="Could not parse structured response",
-                issues=["Response parsing failed"]
-            )
-            
-        except Exception as e:
-            return VisionVerification(
-                match_score=0.0,
-                is_match=False,
-                actual_description="Error during analysis",
-                reasoning=str(e),
-                issues=[f"Vision analysis error: {str(e)}"]
-            )
+            # Only real verdicts are cached; failures above may be transient
+            self._verify_cache.set(item, verdict)
+            verdicts.append(verdict)
+        return verdicts
     
     async def describe_image(self, image_url: str) -> str:
         """
         Get a description of an image without comparison.
         Useful for understanding what an image contains.
         """
-        image_data = await self.download_image(image_url)
+        image = await self._stream_image(image_url)
         
-        if not image_data:
+        if not image:
             return "Failed to download image"
         
-        image_b64 = base64.standard_b64encode(image_data).decode("utf-8")
-        mime_type = self._get_mime_type(image_url, image_data)
+        image_data, mime_type = image
         
         try:
             response = self.client.models.generate_content(
@@ -214,7 +434,7 @@ Somewhat related is 0.5-0.7. Not related is 0.0-0.4."""
                             types.Part(
                                 inline_data=types.Blob(
                                     mime_type=mime_type,
-                                    data=image_b64,
+                                    data=image_data,
                                 )
                             )
                         ]
@@ -224,7 +444,3 @@ Somewhat related is 0.5-0.7. Not related is 0.0-0.4."""
             return response.text
         except Exception as e:
             return f"Error: {str(e)}"
-    
-    async def close(self):
-        """Close HTTP client."""
-        await self._http_client.aclose()
@@ -5,10 +5,20 @@ All data models used for API request/response validation
 and inter-agent communication.
 """
 
-from typing import Optional, List, Dict, Literal, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Optional, List, Dict, Literal, Any, ClassVar, Tuple
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Optional orjson for serializing large outbound payloads
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 
 
 # =============================================================================
@@ -36,12 +46,70 @@ class SlideContentType(str, Enum):
     CONCLUSION = "conclusion"
 
 
+# Last wall-clock reading for _fast_utcnow, reused for up to 1 ms
+_last_now_mono = 0.0
+_last_now: Optional[datetime] = None
+
+
+def _fast_utcnow() -> datetime:
+    """
+    Current UTC time (timezone-aware), shared by calls within 1 ms.
+    
+    Messages created in a burst get the same timestamp instead of paying
+    for a new datetime each.
+    """
+    global _last_now_mono, _last_now
+    mono = time.monotonic()
+    if _last_now is None or mono - _last_now_mono > 0.001:
+        _last_now = datetime.fromtimestamp(time.time(), tz=timezone.utc)
+        _last_now_mono = mono
+    return _last_now
+
+
+# Config for small models created or mutated on every clarification turn
+# and slide (e.g. gathered_info.has_title = True): assignments are not
+# re-validated and unknown keys from LLM output are dropped. Their is_*/
+# get_* helpers stay plain methods rather than validators.
+_HOT_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False)
+
+# Config for the pipeline stage models (OrderForm through QAReport): schemas
+# are built on first use rather than at import, and assignments made by the
+# pipeline stages are not re-validated.
+_STAGE_MODEL_CONFIG = ConfigDict(defer_build=True, extra="ignore", validate_assignment=False)
+
+# Per-slide stage outputs that are built once and only read afterwards;
+# their list-like fields are tuples
+_FROZEN_STAGE_MODEL_CONFIG = ConfigDict(**_STAGE_MODEL_CONFIG, frozen=True)
+
+# Short identifiers repeated on every slide/deck ("content", "modern",
+# "apa", ...): interned so equal values share one string object
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+class _JsonPayload(BaseModel):
+    """Base for stage outputs sent to clients as large JSON documents."""
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to compact JSON bytes.
+        
+        With orjson this dumps the model_dump(mode="json") tree, which for
+        HTML- and base64-heavy payloads is several times faster than
+        model_dump_json's own string escaping.
+        """
+        if orjson is not None:
+            return orjson.dumps(self.model_dump(mode="json"))
+        return self.model_dump_json().encode()
+
+
 # =============================================================================
 # Color & Theme Schemas
 # =============================================================================
 
 class ColorPalette(BaseModel):
     """Custom color palette for theme overrides."""
+    model_config = _HOT_MODEL_CONFIG
+    
     primary: str = Field(default="#3B82F6", description="Primary brand color")
     secondary: str = Field(default="#10B981", description="Secondary accent")
     background: str = Field(default="#FFFFFF", description="Slide background")
@@ -76,9 +144,11 @@ class KnowledgeBase(BaseModel):
 
 class ClarificationMessage(BaseModel):
     """A single message in the clarification conversation."""
+    model_config = _HOT_MODEL_CONFIG
+    
     role: Literal["user", "assistant"]
     content: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_fast_utcnow)
 
 
 class GatheredInfo(BaseModel):
@@ -88,6 +158,24 @@ class GatheredInfo(BaseModel):
     This model progressively tracks what the user has provided,
     preventing the agent from asking for the same info twice.
     """
+    model_config = _HOT_MODEL_CONFIG
+    
+    # (has_* flag, label, let_agent_decide_* flag or None) per field; a field
+    # is missing unless its flag is set or the user delegated the decision
+    _REQUIRED_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = (
+        ("has_title", "presentation title or topic", "let_agent_decide_title"),
+        ("has_audience", "target audience", None),
+        ("has_slide_count", "number of slides", None),
+        ("has_focus_areas", "key focus areas or topics to cover", None),
+    )
+    _OPTIONAL_FIELDS: ClassVar[Tuple[Tuple[str, str, Optional[str]], ...]] = (
+        ("has_emphasis_style", "emphasis style (detailed/concise/visual-heavy)", None),
+        ("has_tone", "tone (academic/casual/technical/persuasive)", None),
+        ("has_citation_style", "citation style (APA/IEEE/Harvard/Chicago)", None),
+        ("has_references_placement", "references placement (distributed/last slide)", None),
+        ("has_theme", "theme preference", "let_agent_decide_theme"),
+    )
+    
     # Flags for what we have
     has_title: bool = Field(default=False, description="Title/topic provided")
     has_audience: bool = Field(default=False, description="Target audience provided")
@@ -123,33 +211,19 @@ class GatheredInfo(BaseModel):
     confirmation_sent: bool = Field(default=False, description="Whether confirmation was sent to user")
     user_confirmed: bool = Field(default=False, description="Whether user confirmed the details")
     
+    def _missing(self, fields: Tuple[Tuple[str, str, Optional[str]], ...]) -> List[str]:
+        return [
+            label for flag, label, decide in fields
+            if not getattr(self, flag) and (decide is None or not getattr(self, decide))
+        ]
+    
     def get_missing_required(self) -> List[str]:
         """Get list of required fields that are still missing."""
-        missing = []
-        if not self.has_title and not self.let_agent_decide_title:
-            missing.append("presentation title or topic")
-        if not self.has_audience:
-            missing.append("target audience")
-        if not self.has_slide_count:
-            missing.append("number of slides")
-        if not self.has_focus_areas:
-            missing.append("key focus areas or topics to cover")
-        return missing
+        return self._missing(self._REQUIRED_FIELDS)
     
     def get_missing_optional(self) -> List[str]:
         """Get list of optional fields that could be gathered."""
-        missing = []
-        if not self.has_emphasis_style:
-            missing.append("emphasis style (detailed/concise/visual-heavy)")
-        if not self.has_tone:
-            missing.append("tone (academic/casual/technical/persuasive)")
-        if not self.has_citation_style:
-            missing.append("citation style (APA/IEEE/Harvard/Chicago)")
-        if not self.has_references_placement:
-            missing.append("references placement (distributed/last slide)")
-        if not self.has_theme and not self.let_agent_decide_theme:
-            missing.append("theme preference")
-        return missing
+        return self._missing(self._OPTIONAL_FIELDS)
     
     def is_complete_enough(self) -> bool:
         """Check if we have enough info to proceed (all required fields)."""
@@ -183,6 +257,8 @@ class OrderForm(BaseModel):
     Captures ALL user preferences for slide generation,
     including new fields for focus, emphasis, and references.
     """
+    model_config = _STAGE_MODEL_CONFIG
+    
     # Theme selection
     theme_id: str = Field(
         default="modern",
@@ -270,6 +346,8 @@ class OrderForm(BaseModel):
 
 class SkeletonSlide(BaseModel):
     """A single slide in the structural skeleton."""
+    model_config = _STAGE_MODEL_CONFIG
+    
     order: int = Field(..., ge=1, description="Slide order (1-indexed)")
     title: str = Field(..., max_length=100, description="Slide title")
     
@@ -301,6 +379,8 @@ class SkeletonSlide(BaseModel):
 
 class Skeleton(BaseModel):
     """Complete presentation skeleton from Outliner."""
+    model_config = _STAGE_MODEL_CONFIG
+    
     presentation_title: str
     target_audience: str
     narrative_arc: str = Field(default="", description="Brief story flow")
@@ -314,6 +394,8 @@ class Skeleton(BaseModel):
 
 class CitationMetadata(BaseModel):
     """Citation metadata for academic references."""
+    model_config = _STAGE_MODEL_CONFIG
+    
     title: str = Field(default="", description="Title of the work")
     authors: List[str] = Field(default_factory=list)
     year: str = Field(default="")
@@ -342,12 +424,14 @@ class CitationMetadata(BaseModel):
 
 class PlannedSlide(BaseModel):
     """Slide after Planner processing - with full content and placeholders."""
+    model_config = _FROZEN_STAGE_MODEL_CONFIG
+    
     order: int = Field(..., ge=1)
     title: str
     content_type: SlideContentType = Field(default=SlideContentType.CONTENT)
     
     # Full content (written by Planner)
-    bullet_points: List[str] = Field(default_factory=list)
+    bullet_points: Tuple[str, ...] = Field(default_factory=tuple)
     
     # Placeholders for Refiner to fill
     equation_placeholder: Optional[str] = Field(
@@ -356,25 +440,27 @@ class PlannedSlide(BaseModel):
     diagram_placeholder: Optional[str] = Field(
         None, description="Description of diagram needed"
     )
-    citation_queries: List[str] = Field(
-        default_factory=list, description="Search queries for citations"
+    citation_queries: Tuple[str, ...] = Field(
+        default_factory=tuple, description="Search queries for citations"
     )
     image_query: Optional[str] = Field(
         None, description="Image search query"
     )
     
     speaker_notes: Optional[str] = None
-    template_type: Optional[str] = Field(
+    template_type: Optional[_InternedStr] = Field(
         None, description="Which layout template to use"
     )
 
 
 class PlannedContent(BaseModel):
     """Complete content after Planner - ready for Refiner."""
+    model_config = _STAGE_MODEL_CONFIG
+    
     presentation_title: str
     target_audience: str
-    theme_id: str = Field(default="modern")
-    citation_style: str = Field(default="apa")
+    theme_id: _InternedStr = Field(default="modern")
+    citation_style: _InternedStr = Field(default="apa")
     slides: List[PlannedSlide] = Field(default_factory=list)
 
 
@@ -384,12 +470,14 @@ class PlannedContent(BaseModel):
 
 class RefinedSlide(BaseModel):
     """Slide after Refiner - with all assets rendered."""
+    model_config = _FROZEN_STAGE_MODEL_CONFIG
+    
     order: int = Field(..., ge=1)
     title: str
     content_type: SlideContentType = Field(default=SlideContentType.CONTENT)
     
     # Final content
-    bullet_points: List[str] = Field(default_factory=list)
+    bullet_points: Tuple[str, ...] = Field(default_factory=tuple)
     
     # Rendered assets
     equation_svg: Optional[str] = Field(None, description="Rendered LaTeX SVG")
@@ -397,10 +485,12 @@ class RefinedSlide(BaseModel):
     diagram_svg: Optional[str] = Field(None, description="Rendered Mermaid SVG")
     diagram_mermaid: Optional[str] = Field(None, description="Original Mermaid source")
     
-    # Citations
-    citations: List[CitationMetadata] = Field(default_factory=list)
-    formatted_citations: List[str] = Field(
-        default_factory=list, description="Pre-formatted citation strings"
+    # Citations (metadata lives once in RefinedContent.citation_pool)
+    citation_ids: Tuple[str, ...] = Field(
+        default_factory=tuple, description="Keys into RefinedContent.citation_pool"
+    )
+    formatted_citations: Tuple[str, ...] = Field(
+        default_factory=tuple, description="Pre-formatted citation strings"
     )
     
     # Images
@@ -409,21 +499,49 @@ class RefinedSlide(BaseModel):
     image_caption: Optional[str] = None
     
     # Layout
-    template_type: str = Field(default="content")
+    template_type: _InternedStr = Field(default="content")
     speaker_notes: Optional[str] = None
     
     # Quality tracking
     all_claims_verified: bool = Field(default=False)
-    removed_claims: List[str] = Field(default_factory=list)
-
-
-class RefinedContent(BaseModel):
+    removed_claims: Tuple[str, ...] = Field(default_factory=tuple)
+    
+    @cached_property
+    def special_kind(self) -> int:
+        """
+        Special content on this slide, in template priority order:
+        0 = none, 1 = equation, 2 = image, 3 = diagram.
+        
+        Classified on first access and kept for the slide's lifetime
+        (the model is frozen); model_copy drops it so copies reclassify.
+        """
+        if self.equation_latex or self.equation_svg:
+            return 1
+        if self.image_url:
+            return 2
+        if self.diagram_mermaid or self.diagram_svg:
+            return 3
+        return 0
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "RefinedSlide":
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop("special_kind", None)
+        return copy
+
+
+class RefinedContent(_JsonPayload):
     """Complete content after Refiner - ready for Generator."""
+    model_config = _STAGE_MODEL_CONFIG
+    
     presentation_title: str
     target_audience: str
-    theme_id: str = Field(default="modern")
-    citation_style: str = Field(default="apa")
+    theme_id: _InternedStr = Field(default="modern")
+    citation_style: _InternedStr = Field(default="apa")
     slides: List[RefinedSlide] = Field(default_factory=list)
+    citation_pool: Dict[str, CitationMetadata] = Field(
+        default_factory=dict,
+        description="Citation metadata shared by all slides, keyed by citation id"
+    )
     
     # Quality metrics
     total_citations: int = Field(default=0)
@@ -432,29 +550,53 @@ class RefinedContent(BaseModel):
     diagrams_rendered: int = Field(default=0)
     
     def update_metrics(self):
-        """Update quality metrics from slides."""
-        self.total_citations = sum(len(s.citations) for s in self.slides)
-        self.verified_images = sum(1 for s in self.slides if s.image_url)
-        self.equations_rendered = sum(1 for s in self.slides if s.equation_svg)
-        self.diagrams_rendered = sum(1 for s in self.slides if s.diagram_svg)
+        """Update quality metrics from slides (one pass over the deck)."""
+        citations = images = equations = diagrams = 0
+        for s in self.slides:
+            citations += len(s.citation_ids)
+            if s.image_url:
+                images += 1
+            if s.equation_svg:
+                equations += 1
+            if s.diagram_svg:
+                diagrams += 1
+        
+        self.total_citations = citations
+        self.verified_images = images
+        self.equations_rendered = equations
+        self.diagrams_rendered = diagrams
+    
+    def citations_for(self, slide: RefinedSlide) -> List[CitationMetadata]:
+        """Resolve a slide's citation ids against the pool (unknown ids skipped)."""
+        pool = self.citation_pool
+        return [pool[cid] for cid in slide.citation_ids if cid in pool]
 
 
 # =============================================================================
 # Generator Output - GeneratedSlides
 # =============================================================================
 
-class GeneratedSlide(BaseModel):
-    """A single generated HTML slide."""
+@dataclass(frozen=True, slots=True)
+class GeneratedSlide:
+    """
+    A single generated HTML slide.
+    
+    A plain slotted dataclass: built once per slide by the generator and
+    only read afterwards. Validated only when parsed as part of a
+    GeneratedPresentation.
+    """
     order: int
     title: str
-    theme_id: str
+    theme_id: _InternedStr
+    rendered_html: Annotated[str, Field(description="Complete HTML for this slide")]
     color_palette: Optional[ColorPalette] = None
-    rendered_html: str = Field(..., description="Complete HTML for this slide")
     speaker_notes: Optional[str] = None
 
 
-class GeneratedPresentation(BaseModel):
+class GeneratedPresentation(_JsonPayload):
     """Complete presentation with HTML slides."""
+    model_config = _STAGE_MODEL_CONFIG
+    
     title: str
     slides: List[GeneratedSlide] = Field(default_factory=list)
     theme_id: str
@@ -468,18 +610,26 @@ class GeneratedPresentation(BaseModel):
 # Visual QA Output
 # =============================================================================
 
-class QAResult(BaseModel):
-    """Result from Visual QA evaluation of a slide."""
+@dataclass(frozen=True, slots=True)
+class QAResult:
+    """
+    Result from Visual QA evaluation of a slide.
+    
+    A plain slotted dataclass like GeneratedSlide; validated only when
+    parsed as part of a QAReport.
+    """
     slide_order: int
-    score: float = Field(..., ge=0, le=100)
-    issues: List[str] = Field(default_factory=list)
+    score: Annotated[float, Field(ge=0, le=100)]
+    issues: List[str] = field(default_factory=list)
     screenshot_base64: Optional[str] = None
-    passed: bool = Field(default=False)
-    iterations: int = Field(default=1)
+    passed: bool = False
+    iterations: int = 1
 
 
-class QAReport(BaseModel):
+class QAReport(_JsonPayload):
     """Complete QA report for a presentation."""
+    model_config = _STAGE_MODEL_CONFIG
+    
     session_id: str
     slides: List[QAResult] = Field(default_factory=list)
     average_score: float = Field(default=0.0)
@@ -1,46 +1,63 @@
-from typing import Dict, Type
+import importlib
+from typing import Dict, Optional, Tuple
 from app.templates.base import BaseTemplate
-from app.templates.layouts import (
-    TitleTemplate,
-    ContentTemplate,
-    SectionTemplate,
-    TwoColumnTemplate,
-    ConclusionTemplate,
-    TwoColImageTemplate,
-    FullImageTemplate,
-    TwoColMathTemplate,
-    DiagramTemplate,
-    QuoteTemplate,
-    TimelineTemplate,
-    ComparisonTemplate,
-    CodeTemplate
-)
+from app.models.schemas import SlideContentType
 from app.routers.generation.models import EnrichedSlide
 
-# Registry of all available templates
-TEMPLATE_REGISTRY: Dict[str, Type[BaseTemplate]] = {
-    "title": TitleTemplate,
-    "content": ContentTemplate,
-    "section": SectionTemplate,
-    "two_column": TwoColumnTemplate,
-    "conclusion": ConclusionTemplate,
-    "two_col_image": TwoColImageTemplate,
-    "full_image": FullImageTemplate,
-    "two_col_math": TwoColMathTemplate,
-    "diagram": DiagramTemplate,
-    "quote": QuoteTemplate,
-    "timeline": TimelineTemplate,
-    "comparison": ComparisonTemplate,
-    "code": CodeTemplate,
+_LAYOUTS = "app.templates.layouts"
+
+# Registry of all available templates: id -> (layout module, class name).
+# Layout modules are imported on first use of one of their templates.
+TEMPLATE_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "title": (f"{_LAYOUTS}.title", "TitleTemplate"),
+    "content": (f"{_LAYOUTS}.content", "ContentTemplate"),
+    "section": (f"{_LAYOUTS}.section", "SectionTemplate"),
+    "two_column": (f"{_LAYOUTS}.two_column", "TwoColumnTemplate"),
+    "conclusion": (f"{_LAYOUTS}.conclusion", "ConclusionTemplate"),
+    "two_col_image": (f"{_LAYOUTS}.image", "TwoColImageTemplate"),
+    "full_image": (f"{_LAYOUTS}.image", "FullImageTemplate"),
+    "two_col_math": (f"{_LAYOUTS}.math", "TwoColMathTemplate"),
+    "diagram": (f"{_LAYOUTS}.diagram", "DiagramTemplate"),
+    "quote": (f"{_LAYOUTS}.quote", "QuoteTemplate"),
+    "timeline": (f"{_LAYOUTS}.special", "TimelineTemplate"),
+    "comparison": (f"{_LAYOUTS}.special", "ComparisonTemplate"),
+    "code": (f"{_LAYOUTS}.special", "CodeTemplate"),
 }
 
+# One shared instance per template id. Templates are stateless (render()
+# takes everything it needs as arguments), so they are safe to share.
+_TEMPLATE_CACHE: Dict[str, BaseTemplate] = {}
+
 def get_template_by_id(template_id: str) -> BaseTemplate:
     """Get a template instance by its ID."""
-    template_cls = TEMPLATE_REGISTRY.get(template_id)
-    if not template_cls:
-        # Fallback to content template if not found
-        return ContentTemplate()
-    return template_cls()
+    template = _TEMPLATE_CACHE.get(template_id)
+    if template is not None:
+        return template
+    
+    # Fallback to content template if not found
+    if template_id not in TEMPLATE_REGISTRY:
+        return get_template_by_id("content")
+    
+    module_path, class_name = TEMPLATE_REGISTRY[template_id]
+    template = getattr(importlib.import_module(module_path), class_name)()
+    _TEMPLATE_CACHE[template_id] = template
+    return template
+
+# Templates for slides carrying special content, indexed by
+# EnrichedSlide.special_kind (1 = equation, 2 = image, 3 = diagram)
+_SPECIAL_TEMPLATE_IDS: Tuple[Optional[str], ...] = (
+    None,
+    "two_col_math",
+    "two_col_image",
+    "diagram",
+)
+# Template id per slide content type, keyed on the enum members themselves so
+# lookups match by identity and yield the plain registry key. Types without
+# a dedicated layout (overview, equation, image) use the content template.
+_CONTENT_TYPE_TEMPLATE_IDS: Dict[SlideContentType, str] = {
+    content_type: content_type.value if content_type.value in TEMPLATE_REGISTRY else "content"
+    for content_type in SlideContentType
+}
 
 def select_template_for_slide(slide: EnrichedSlide) -> BaseTemplate:
     """
@@ -53,18 +70,13 @@ def select_template_for_slide(slide: EnrichedSlide) -> BaseTemplate:
     """
     # First, apply heuristics for special content based on data presence
     # This allows slides with content_type='content' but special data to use specialized templates
-    if slide.equation_latex or slide.equation_svg:
-        return TwoColMathTemplate()
-    
-    if slide.image_url:
-        return TwoColImageTemplate()
-    
-    if slide.diagram_mermaid or slide.diagram_svg:
-        return DiagramTemplate()
-    
-    # Then check for explicit content type mapping
-    if slide.content_type in TEMPLATE_REGISTRY:
-        return TEMPLATE_REGISTRY[slide.content_type]()
+    special_kind = slide.special_kind
+    if special_kind:
+        return get_template_by_id(_SPECIAL_TEMPLATE_IDS[special_kind])
     
-    # Default
-    return ContentTemplate()
+    # Then the explicit content type mapping, defaulting to ContentTemplate
+    template_id = _CONTENT_TYPE_TEMPLATE_IDS.get(slide.content_type)
+    if template_id is None:
+        # Converted legacy slides may carry any registry id as a plain string
+        template_id = slide.content_type
+    return get_template_by_id(template_id)
@@ -1,8 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Tuple, Union
+
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
 
+# Theme CSS keyed on (theme id, palette colours). A deck renders every slide
+# with the same theme and palette, so the CSS is built once per deck rather
+# than once per slide. A theme's structural properties are fixed per id;
+# only its palette can be customised.
+_THEME_CSS_CACHE: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+_THEME_CSS_CACHE_SIZE = 32
+
+
 class BaseTemplate(ABC):
     """Base abstract class for all slide templates."""
     
@@ -37,12 +46,16 @@ class BaseTemplate(ABC):
         Defaults to returning the theme's CSS variables.
         Templates can override this to add specific styles.
         """
-        palette = colors if colors else theme.colors
-        # We might need to create a temporary theme object with the overridden palette to generate CSS
-        active_theme = theme
-        if colors:
-            # Shallow copy and replace colors for CSS generation
-            # Note: This depends on how SlideTheme is implemented (Pydantic model)
-            active_theme = theme.model_copy(update={"colors": colors})
-            
-        return active_theme.to_css_variables()
+        palette = colors or theme.colors
+        key = (theme.id, tuple(palette.__dict__.values()))
+        css = _THEME_CSS_CACHE.get(key)
+        if css is None:
+            active_theme = theme
+            if colors:
+                # Shallow copy and replace colors for CSS generation
+                active_theme = theme.model_copy(update={"colors": colors})
+            css = active_theme.to_css_variables()
+            if len(_THEME_CSS_CACHE) >= _THEME_CSS_CACHE_SIZE:
+                _THEME_CSS_CACHE.clear()
+            _THEME_CSS_CACHE[key] = css
+        return css
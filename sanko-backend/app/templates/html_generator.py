@@ -5,74 +5,20 @@ Generates HTML slides using the template system.
 Wraps template output in complete HTML documents with theme CSS.
 """
 
-from typing import TYPE_CHECKING, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Union
 
-from app.config import SLIDE_WIDTH, SLIDE_HEIGHT
+from app.core.config import SLIDE_WIDTH, SLIDE_HEIGHT
+from app.routers.generation.models import EnrichedSlide
 
 if TYPE_CHECKING:
     from app.agents.planner import EnrichedSlide as LegacyEnrichedSlide
-    from app.routers.generation.models import EnrichedSlide
     from app.themes import SlideTheme, ColorPalette
 
 
-def generate_slide_html_sync(
-    slide: Union["EnrichedSlide", "LegacyEnrichedSlide"],
-    theme: "SlideTheme",
-    colors: "ColorPalette",
-) -> str:
-    """
-    Generate HTML for a single slide using the template system.
-    
-    Selects the appropriate template based on slide content and wraps
-    the rendered output in a complete HTML document with theme CSS.
-    
-    Args:
-        slide: Enriched slide data (from either new or legacy model)
-        theme: Theme configuration
-        colors: Color palette
-        
-    Returns:
-        Complete HTML document for the slide
-    """
-    # Deferred import to break circular dependency
-    from app.templates import select_template_for_slide
-    
-    # Convert legacy slide to new model if needed
-    from app.routers.generation.models import EnrichedSlide as NewEnrichedSlide
-    
-    if not isinstance(slide, NewEnrichedSlide):
-        # Convert from legacy model
-        slide = NewEnrichedSlide(
-            order=slide.order,
-            title=slide.title,
-            bullet_points=slide.bullet_points,
-            content_type=slide.content_type,
-            citations=list(slide.citations) if hasattr(slide, 'citations') else [],
-            image_url=getattr(slide, 'image_url', None),
-            image_alt=getattr(slide, 'image_alt', None),
-            equation_latex=getattr(slide, 'equation_latex', None),
-            diagram_mermaid=getattr(slide, 'diagram_mermaid', None),
-            speaker_notes=getattr(slide, 'speaker_notes', None),
-            formatted_citations=getattr(slide, 'formatted_citations', []),
-        )
-    
-    # Select the appropriate template
-    template = select_template_for_slide(slide)
-    
-    # Render the slide content
-    slide_content = template.render(slide, theme, colors)
-    
-    # Get CSS variables from theme
-    css_vars = template.get_css(theme, colors)
-    
-    # Wrap in complete HTML document
-    html = f'''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-{css_vars}
-
+# Document shell, built once at import. Only the theme's CSS variables vary
+# between slides; everything else is shared by every slide in every deck.
+_BASE_CSS = f"""
 /* Base slide styles */
 * {{ margin: 0; padding: 0; box-sizing: border-box; }}
 
@@ -253,11 +199,120 @@ def generate_slide_html_sync(
     border-radius: var(--radius-md);
     text-align: center;
 }}
-    </style>
+"""
+
+_SHELL_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+"""
+
+_SHELL_BODY_OPEN = """    </style>
 </head>
 <body>
-    {slide_content}
+    """
+
+_SHELL_SUFFIX = """
 </body>
-</html>'''
+</html>"""
+
+
+# Fields carried over from legacy slide models (when present on the slide)
+_LEGACY_FIELDS = (
+    "order",
+    "title",
+    "bullet_points",
+    "content_type",
+    "image_url",
+    "image_alt",
+    "equation_latex",
+    "diagram_mermaid",
+    "speaker_notes",
+    "formatted_citations",
+)
+_LEGACY_SEQUENCE_FIELDS = frozenset({"bullet_points", "formatted_citations"})
+_MISSING = object()
+
+
+def _from_legacy(slide: "LegacyEnrichedSlide") -> EnrichedSlide:
+    """
+    Convert a legacy slide model to EnrichedSlide without re-validating.
+    
+    The legacy model already validated its data, so the fields are copied
+    with model_construct; absent fields keep EnrichedSlide's defaults.
+    """
+    values = {}
+    for field in _LEGACY_FIELDS:
+        value = getattr(slide, field, _MISSING)
+        if value is not _MISSING:
+            values[field] = tuple(value) if field in _LEGACY_SEQUENCE_FIELDS else value
+    return EnrichedSlide.model_construct(**values)
+
+
+@lru_cache(maxsize=16)
+def _shell_prefix(css_vars: str) -> str:
+    """Document head and opening body for a theme's CSS variables."""
+    return _SHELL_HEAD + css_vars + "\n" + _BASE_CSS + _SHELL_BODY_OPEN
+
+
+def generate_slide_html_sync(
+    slide: Union["EnrichedSlide", "LegacyEnrichedSlide"],
+    theme: "SlideTheme",
+    colors: "ColorPalette",
+) -> str:
+    """
+    Generate HTML for a single slide using the template system.
     
-    return html
+    Selects the appropriate template based on slide content and wraps
+    the rendered output in a complete HTML document with theme CSS.
+    
+    Args:
+        slide: Enriched slide data (from either new or legacy model)
+        theme: Theme configuration
+        colors: Color palette
+        
+    Returns:
+        Complete HTML document for the slide
+    """
+    # Deferred import to break circular dependency
+    from app.templates import select_template_for_slide
+    
+    # Convert legacy slide to new model if needed
+    if type(slide) is not EnrichedSlide:
+        slide = _from_legacy(slide)
+    
+    # Select the appropriate template
+    template = select_template_for_slide(slide)
+    
+    # Render the slide content
+    slide_content = template.render(slide, theme, colors)
+    
+    # Get CSS variables from theme
+    css_vars = template.get_css(theme, colors)
+    
+    # Wrap in complete HTML document
+    return _shell_prefix(css_vars) + slide_content + _SHELL_SUFFIX
+
+
+def generate_slides_html_batch(
+    slides: Iterable[Union["EnrichedSlide", "LegacyEnrichedSlide"]],
+    theme: "SlideTheme",
+    colors: "ColorPalette",
+) -> List[str]:
+    """
+    Generate HTML documents for a whole deck, in slide order.
+    
+    Slides are rendered on the calling thread. One slide takes tens of
+    microseconds, less than it costs to pickle it to a worker process and
+    the HTML back, so a process pool only slows this down.
+    
+    Args:
+        slides: Enriched slides (new or legacy model, may be mixed)
+        theme: Theme configuration
+        colors: Color palette
+        
+    Returns:
+        One complete HTML document per slide
+    """
+    return [generate_slide_html_sync(slide, theme, colors) for slide in slides]
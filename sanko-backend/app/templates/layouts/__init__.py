@@ -1,13 +1,35 @@
-from .title import TitleTemplate
-from .content import ContentTemplate
-from .section import SectionTemplate
-from .two_column import TwoColumnTemplate
-from .conclusion import ConclusionTemplate
-from .image import TwoColImageTemplate, FullImageTemplate
-from .math import TwoColMathTemplate
-from .diagram import DiagramTemplate
-from .quote import QuoteTemplate
-from .special import TimelineTemplate, ComparisonTemplate, CodeTemplate
+import importlib
+from typing import TYPE_CHECKING
+
+# Layout classes are imported on first access (PEP 562), so a process only
+# loads the layouts that its decks actually use
+_EXPORTS = {
+    "TitleTemplate": ".title",
+    "ContentTemplate": ".content",
+    "SectionTemplate": ".section",
+    "TwoColumnTemplate": ".two_column",
+    "ConclusionTemplate": ".conclusion",
+    "TwoColImageTemplate": ".image",
+    "FullImageTemplate": ".image",
+    "TwoColMathTemplate": ".math",
+    "DiagramTemplate": ".diagram",
+    "QuoteTemplate": ".quote",
+    "TimelineTemplate": ".special",
+    "ComparisonTemplate": ".special",
+    "CodeTemplate": ".special",
+}
+
+if TYPE_CHECKING:
+    from .title import TitleTemplate
+    from .content import ContentTemplate
+    from .section import SectionTemplate
+    from .two_column import TwoColumnTemplate
+    from .conclusion import ConclusionTemplate
+    from .image import TwoColImageTemplate, FullImageTemplate
+    from .math import TwoColMathTemplate
+    from .diagram import DiagramTemplate
+    from .quote import QuoteTemplate
+    from .special import TimelineTemplate, ComparisonTemplate, CodeTemplate
 
 __all__ = [
     "TitleTemplate",
@@ -24,3 +46,11 @@ __all__ = [
     "ComparisonTemplate",
     "CodeTemplate",
 ]
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
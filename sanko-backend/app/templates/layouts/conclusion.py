@@ -1,4 +1,5 @@
 from typing import Optional
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -12,12 +13,12 @@ class ConclusionTemplate(BaseTemplate):
     def render(self, slide: EnrichedSlide, theme: SlideTheme, colors: Optional[ColorPalette] = None) -> str:
         points_html = ""
         if slide.bullet_points:
-            points_html = "<ul>" + "".join([f"<li>{point}</li>" for point in slide.bullet_points]) + "</ul>"
+            points_html = "<ul>" + "".join([f"<li>{escape(point)}</li>" for point in slide.bullet_points]) + "</ul>"
             
         return f'''
         <div class="slide slide-conclusion" data-template="conclusion" data-slide-id="{slide.order}">
             <div class="conclusion-header">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
             </div>
             <div class="takeaways-region">
                 {points_html}
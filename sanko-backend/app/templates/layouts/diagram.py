@@ -1,4 +1,5 @@
 from typing import Optional
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -12,18 +13,18 @@ class DiagramTemplate(BaseTemplate):
     def render(self, slide: EnrichedSlide, theme: SlideTheme, colors: Optional[ColorPalette] = None) -> str:
         caption_html = ""
         if slide.bullet_points:
-             caption_html = f'<div class="diagram-caption"><p>{slide.bullet_points[0]}</p></div>'
+             caption_html = f'<div class="diagram-caption"><p>{escape(slide.bullet_points[0])}</p></div>'
             
         if slide.diagram_svg:
             diagram_content = f'<div class="diagram-svg">{slide.diagram_svg}</div>'
         else:
             mermaid_code = slide.diagram_mermaid if slide.diagram_mermaid else "graph TD; A-->B;"
-            diagram_content = f'<div class="mermaid">{mermaid_code}</div>'
+            diagram_content = f'<div class="mermaid">{escape(mermaid_code)}</div>'
         
         return f'''
         <div class="slide slide-diagram" data-template="diagram" data-slide-id="{slide.order}">
             <div class="header-region">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
             </div>
             <div class="diagram-container">
                 {diagram_content}
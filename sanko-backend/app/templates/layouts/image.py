@@ -1,4 +1,5 @@
 from typing import Optional
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -12,19 +13,19 @@ class TwoColImageTemplate(BaseTemplate):
     def render(self, slide: EnrichedSlide, theme: SlideTheme, colors: Optional[ColorPalette] = None) -> str:
         points_html = ""
         if slide.bullet_points:
-            points_html = "<ul>" + "".join([f"<li>{point}</li>" for point in slide.bullet_points]) + "</ul>"
+            points_html = "<ul>" + "".join([f"<li>{escape(point)}</li>" for point in slide.bullet_points]) + "</ul>"
             
         image_src = slide.image_url if slide.image_url else "https://via.placeholder.com/600x400?text=Placeholder+Image"
         image_alt = slide.image_alt if slide.image_alt else "Slide image"
         
         caption_html = ""
         if slide.image_caption:
-             caption_html = f'<p class="image-caption">{slide.image_caption}</p>'
+             caption_html = f'<p class="image-caption">{escape(slide.image_caption)}</p>'
         
         return f'''
         <div class="slide slide-two-col-image" data-template="two_col_image" data-slide-id="{slide.order}">
             <div class="header-region">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
             </div>
             <div class="columns-container">
                 <div class="column content-column">
@@ -32,7 +33,7 @@ class TwoColImageTemplate(BaseTemplate):
                 </div>
                 <div class="column image-column">
                     <div class="image-wrapper">
-                         <img src="{image_src}" alt="{image_alt}" />
+                         <img src="{escape(image_src)}" alt="{escape(image_alt)}" />
                          {caption_html}
                     </div>
                 </div>
@@ -52,17 +53,17 @@ class FullImageTemplate(BaseTemplate):
         
         caption_html = ""
         if slide.image_caption:
-            caption_html = f'<p class="image-caption">{slide.image_caption}</p>'
+            caption_html = f'<p class="image-caption">{escape(slide.image_caption)}</p>'
         elif slide.bullet_points:
-             caption_html = f'<p class="image-caption">{slide.bullet_points[0]}</p>'
+             caption_html = f'<p class="image-caption">{escape(slide.bullet_points[0])}</p>'
 
         return f'''
         <div class="slide slide-full-image" data-template="full_image" data-slide-id="{slide.order}">
             <div class="background-image-container">
-                <img src="{image_src}" alt="{image_alt}" class="hero-image" />
+                <img src="{escape(image_src)}" alt="{escape(image_alt)}" class="hero-image" />
             </div>
             <div class="overlay-content">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
                 {caption_html}
             </div>
         </div>
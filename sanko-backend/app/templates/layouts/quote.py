@@ -1,4 +1,5 @@
 from typing import Optional
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -25,10 +26,10 @@ class QuoteTemplate(BaseTemplate):
         <div class="slide slide-quote" data-template="quote" data-slide-id="{slide.order}">
             <div class="quote-content">
                 <blockquote class="main-quote">
-                    "{quote_text}"
+                    "{escape(quote_text)}"
                 </blockquote>
                 <div class="quote-attribution">
-                    <span class="quote-author">— {author_text}</span>
+                    <span class="quote-author">— {escape(author_text)}</span>
                 </div>
             </div>
         </div>
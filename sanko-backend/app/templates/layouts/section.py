@@ -1,4 +1,5 @@
 from typing import Optional
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -15,7 +16,7 @@ class SectionTemplate(BaseTemplate):
         return f'''
         <div class="slide slide-section" data-template="section" data-slide-id="{slide.order}">
             <div class="section-content">
-                <h1 class="section-title">{slide.title}</h1>
+                <h1 class="section-title">{escape(slide.title)}</h1>
                 <div class="section-decoration"></div>
             </div>
         </div>
@@ -1,4 +1,5 @@
 from typing import Optional
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -18,7 +19,7 @@ class TimelineTemplate(BaseTemplate):
                  steps_html += f'''
                  <div class="timeline-step">
                     <div class="step-marker">{i+1}</div>
-                    <div class="step-content">{point}</div>
+                    <div class="step-content">{escape(point)}</div>
                  </div>
                  '''
              steps_html += "</div>"
@@ -26,7 +27,7 @@ class TimelineTemplate(BaseTemplate):
         return f'''
         <div class="slide slide-timeline" data-template="timeline" data-slide-id="{slide.order}">
             <div class="header-region">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
             </div>
             <div class="timeline-container">
                 {steps_html}
@@ -47,13 +48,13 @@ class ComparisonTemplate(BaseTemplate):
         left_points = points[:mid]
         right_points = points[mid:]
         
-        left_html = "<ul>" + "".join([f"<li>{p}</li>" for p in left_points]) + "</ul>"
-        right_html = "<ul>" + "".join([f"<li>{p}</li>" for p in right_points]) + "</ul>"
+        left_html = "<ul>" + "".join([f"<li>{escape(p)}</li>" for p in left_points]) + "</ul>"
+        right_html = "<ul>" + "".join([f"<li>{escape(p)}</li>" for p in right_points]) + "</ul>"
         
         return f'''
         <div class="slide slide-comparison" data-template="comparison" data-slide-id="{slide.order}">
             <div class="header-region">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
             </div>
             <div class="comparison-container">
                 <div class="comparison-side left-side">
@@ -83,10 +84,10 @@ class CodeTemplate(BaseTemplate):
         return f'''
         <div class="slide slide-code" data-template="code" data-slide-id="{slide.order}">
             <div class="header-region">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
             </div>
             <div class="code-container">
-                <pre><code class="language-python">{code_content}</code></pre>
+                <pre><code class="language-python">{escape(code_content)}</code></pre>
             </div>
         </div>
         '''
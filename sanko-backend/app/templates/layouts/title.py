@@ -1,5 +1,6 @@
 from datetime import date
 from typing import Optional
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -19,8 +20,8 @@ class TitleTemplate(BaseTemplate):
         return f'''
         <div class="slide slide-title" data-template="title" data-slide-id="{slide.order}">
             <div class="title-content">
-                <h1 class="main-title">{slide.title}</h1>
-                <p class="subtitle">{subtitle}</p>
+                <h1 class="main-title">{escape(slide.title)}</h1>
+                <p class="subtitle">{escape(subtitle)}</p>
             </div>
             <div class="title-footer">
                 <span class="author">{author_text}</span>
@@ -1,5 +1,6 @@
 from typing import Optional
 import math
+from markupsafe import escape
 from app.templates.base import BaseTemplate
 from app.themes import SlideTheme, ColorPalette
 from app.routers.generation.models import EnrichedSlide
@@ -17,13 +18,13 @@ class TwoColumnTemplate(BaseTemplate):
         left_points = points[:mid]
         right_points = points[mid:]
         
-        left_html = "<ul>" + "".join([f"<li>{p}</li>" for p in left_points]) + "</ul>" if left_points else ""
-        right_html = "<ul>" + "".join([f"<li>{p}</li>" for p in right_points]) + "</ul>" if right_points else ""
+        left_html = "<ul>" + "".join([f"<li>{escape(p)}</li>" for p in left_points]) + "</ul>" if left_points else ""
+        right_html = "<ul>" + "".join([f"<li>{escape(p)}</li>" for p in right_points]) + "</ul>" if right_points else ""
         
         return f'''
         <div class="slide slide-two-column" data-template="two_column" data-slide-id="{slide.order}">
             <div class="header-region">
-                <h2 class="slide-title">{slide.title}</h2>
+                <h2 class="slide-title">{escape(slide.title)}</h2>
             </div>
             <div class="columns-container">
                 <div class="column left-column">
@@ -11,13 +11,13 @@ CrewAI Wrappers (for agent function calling):
 - VisionVerificationTool, ImageGenerationTool, ImageSearchCrewTool, AcademicSearchCrewTool
 """
 
-from app.tools.vision_tool import VisionTool, VisionVerification
-from app.tools.image_generation_tool import NanoBananaImageTool, GeneratedAsset
-from app.tools.academic_search_tool import AcademicSearchTool, CitationMetadata
-from app.tools.image_search_tool import ImageSearchTool, ImageSearchResult
+from app.crew.tools.vision_tool import VisionTool, VisionVerification
+from app.crew.tools.image_generation_tool import NanoBananaImageTool, GeneratedAsset
+from app.crew.tools.academic_search_tool import AcademicSearchTool, CitationMetadata
+from app.crew.tools.image_search_tool import ImageSearchTool, ImageSearchResult
 
 # CrewAI-compatible wrappers
-from app.tools.crewai_tools import (
+from app.crew.tools.crewai_tools import (
     VisionVerificationTool,
     ImageGenerationTool,
     ImageSearchCrewTool,
@@ -38,7 +38,8 @@ def main():
         host=args.host,
         port=args.port,
         reload=not args.no_reload,
-        loop="asyncio",  # Use asyncio loop (respects our policy)
+        # Windows: asyncio respects our Proactor policy; elsewhere use uvloop
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
 
 
@@ -0,0 +1,87 @@
+"""
+Tests for the shared result cache in app.crew.tools.academic_search_tool
+"""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.core.cache import TTLCache
+from app.crew.tools import academic_search_tool
+from app.crew.tools.academic_search_tool import AcademicSearchTool
+from app.models.schemas import CitationMetadata
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    """Tool with a fresh cache and a single stubbed source."""
+    monkeypatch.setattr(AcademicSearchTool, "_search_cache", TTLCache(maxsize=16, ttl=60))
+    tool = AcademicSearchTool()
+    tool._search_crossref = AsyncMock(side_effect=lambda query, max_results: [
+        CitationMetadata(title="Attention", authors=["Vaswani"], doi="10.1/a", relevance_score=0.9),
+    ])
+    return tool
+
+
+class TestSearchCache:
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_is_served_from_cache(self, tool):
+        first = await tool.search("Transformers", source="crossref")
+        second = await tool.search("  transformers ", source="crossref")
+        
+        assert [c.title for c in first] == [c.title for c in second] == ["Attention"]
+        assert tool._search_crossref.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_callers_cannot_mutate_cached_citations(self, tool):
+        first = await tool.search("transformers", source="crossref")
+        first[0].title = "Edited"
+        first[0].authors.append("Someone")
+        
+        second = await tool.search("transformers", source="crossref")
+        second[0].verified = True
+        third = await tool.search("transformers", source="crossref")
+        
+        assert second[0].title == third[0].title == "Attention"
+        assert second[0].authors == third[0].authors == ["Vaswani"]
+        assert third[0].verified is False
+
+
+class TestDoiCache:
+    
+    @pytest.fixture
+    def serve_status(self, monkeypatch):
+        """Answer DOI lookups with a given status, counting the requests."""
+        monkeypatch.setattr(AcademicSearchTool, "_doi_cache", TTLCache(maxsize=16, ttl=60))
+        self.requests = 0
+        
+        def install(status):
+            def handler(request):
+                self.requests += 1
+                return httpx.Response(status, json={})
+            monkeypatch.setattr(
+                academic_search_tool, "_shared_client",
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            )
+            return AcademicSearchTool()
+        return install
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, valid", [(200, True), (404, False)])
+    async def test_definite_answers_are_cached(self, serve_status, status, valid):
+        tool = serve_status(status)
+        
+        assert await tool.verify_doi("https://doi.org/10.1/a") is valid
+        assert await tool.verify_doi("10.1/a") is valid
+        assert self.requests == 1
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [400, 403, 429, 503])
+    async def test_other_statuses_are_not_cached(self, serve_status, status):
+        tool = serve_status(status)
+        
+        assert await tool.verify_doi("10.1/a") is False
+        assert await tool.verify_doi("10.1/a") is False
+        assert self.requests == 2
@@ -403,4 +403,212 @@ class TestMergeGatheredInfo:
         assert merged.presentation_title == "Existing Title"
 
 
+
+class TestOrderFormDetection:
+    """Test detection and parsing of OrderForm JSON in agent responses."""
+    
+    def setup_method(self):
+        """Create a flow for testing."""
+        self.flow = SlideGenerationFlow()
+        self.flow.state.gathered_info = GatheredInfo()
+    
+    def test_question_is_not_order_form(self):
+        """Plain questions without JSON should never be treated as an OrderForm."""
+        text = "What presentation_title and target_audience do you have in mind?"
+        
+        assert self.flow._looks_like_order_form(text) is False
+    
+    def test_json_response_is_order_form(self):
+        """JSON with OrderForm keys should be detected."""
+        text = 'Here you go: {"presentation_title": "AI", "target_audience": "students"}'
+        
+        assert self.flow._looks_like_order_form(text) is True
+    
+    def test_parse_order_form_from_surrounding_text(self):
+        """JSON embedded in prose should be parsed."""
+        text = 'Done!\n{"presentation_title": "AI Agents", "target_slides": 12}\nThanks.'
+        
+        order_form = self.flow._parse_order_form(text)
+        
+        assert order_form.presentation_title == "AI Agents"
+        assert order_form.target_slides == 12
+    
+    def test_parse_order_form_invalid_json_falls_back(self):
+        """Invalid JSON should fall back to gathered info."""
+        self.flow.state.gathered_info.title = "Fallback Title"
+        
+        order_form = self.flow._parse_order_form("{not json}")
+        
+        assert order_form.presentation_title == "Fallback Title"
+        assert order_form.is_complete is False
+    
+    def test_parse_order_form_schema_mismatch_falls_back(self):
+        """Valid JSON with wrong field types should fall back, not raise."""
+        self.flow.state.gathered_info.title = "Fallback Title"
+        
+        order_form = self.flow._parse_order_form('{"target_slides": "lots"}')
+        
+        assert order_form.presentation_title == "Fallback Title"
+        assert order_form.is_complete is False
+
+
+class TestClarifierResponseCache:
+    """Test the per-session clarifier response cache."""
+    
+    @pytest.fixture(autouse=True)
+    def fake_agent(self, monkeypatch):
+        """Count agent builds and answer with a reply naming the session."""
+        import app.crew.agents.clarifier as clarifier_module
+        import app.crew.flows.slide_generation as flow_module
+        
+        self.agents_built = 0
+        
+        def create_agent():
+            self.agents_built += 1
+            return object()
+        
+        async def stream(flow, agent, task):
+            return f"Question for {flow.state.session_id}?"
+        
+        monkeypatch.setattr(clarifier_module, "create_clarifier_agent", create_agent)
+        monkeypatch.setattr(flow_module, "Task", lambda **kwargs: kwargs)
+        monkeypatch.setattr(SlideGenerationFlow, "_stream_clarifier_response", stream)
+    
+    @pytest.mark.asyncio
+    async def test_identical_prompt_skips_agent(self):
+        """Replaying a turn from the same state should reuse the reply."""
+        flow = SlideGenerationFlow()
+        flow.state.gathered_info = GatheredInfo()
+        
+        first = await flow.process_clarification("hello")
+        flow.state.conversation_history.clear()
+        flow.state.gathered_info = GatheredInfo()
+        second = await flow.process_clarification("hello")
+        
+        assert first == second
+        assert self.agents_built == 1
+    
+    @pytest.mark.asyncio
+    async def test_repeated_message_from_same_state_hits(self):
+        """A repeated message hits even though the history keeps growing."""
+        flow = SlideGenerationFlow()
+        
+        first = await flow.process_clarification("decide yourself")
+        second = await flow.process_clarification("decide yourself")
+        
+        assert first == second
+        assert len(flow.state.conversation_history) == 4
+        assert self.agents_built == 1
+    
+    @pytest.mark.asyncio
+    async def test_state_message_and_session_are_part_of_key(self):
+        """A different gathered state, message or session must not hit."""
+        flow_a = SlideGenerationFlow()
+        flow_b = SlideGenerationFlow()
+        
+        reply_a = await flow_a.process_clarification("hello")
+        reply_b = await flow_b.process_clarification("hello")
+        assert reply_b["question"] == f"Question for {flow_b.state.session_id}?"
+        
+        await flow_a.process_clarification("hi")
+        flow_a.state.gathered_info.title = "Quantum Computing"
+        await flow_a.process_clarification("hello")
+        
+        assert reply_a["question"] == f"Question for {flow_a.state.session_id}?"
+        assert self.agents_built == 4
+    
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """The cache should stay bounded, dropping the stalest entry first."""
+        monkeypatch.setattr(SlideGenerationFlow, "_CLARIFIER_CACHE_SIZE", 2)
+        flow = SlideGenerationFlow()
+        
+        flow._store_clarifier_response("a", "1")
+        flow._store_clarifier_response("b", "2")
+        flow._store_clarifier_response("a", "1")
+        flow._store_clarifier_response("c", "3")
+        
+        assert list(flow._clarifier_cache) == ["a", "c"]
+
+
+class TestClarifierStreaming:
+    """Test that clarifier replies stream through the shared genai client."""
+    
+    @pytest.fixture
+    def flow(self, monkeypatch):
+        import app.crew.flows.slide_generation as flow_module
+        
+        monkeypatch.setattr(flow_module.settings, "gemini_api_key", "test-key")
+        flow = SlideGenerationFlow()
+        self.tokens = []
+        flow.emitter.add_listener(
+            lambda event: self.tokens.append(event["delta"]) if event["type"] == "token" else None
+        )
+        return flow
+    
+    @pytest.fixture
+    def agent_and_task(self):
+        from types import SimpleNamespace
+        
+        agent = SimpleNamespace(
+            role="Clarifier", backstory="Helpful.", goal="Ask questions.",
+            llm=SimpleNamespace(model="gemini-2.0-flash", temperature=0.7),
+        )
+        task = SimpleNamespace(description="Ask one question", expected_output="ONE question")
+        return agent, task
+    
+    def install_stream(self, monkeypatch, deltas, fail_after=None):
+        """Serve generate_content_stream from a list of text deltas."""
+        from types import SimpleNamespace
+        import app.crew.flows.slide_generation as flow_module
+        
+        self.requests = []
+        
+        async def chunks():
+            for i, delta in enumerate(deltas):
+                if i == fail_after:
+                    raise ConnectionError("stream dropped")
+                yield SimpleNamespace(text=delta)
+        
+        async def generate_content_stream(**kwargs):
+            self.requests.append(kwargs)
+            return chunks()
+        
+        client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(
+            generate_content_stream=generate_content_stream,
+        )))
+        monkeypatch.setattr(flow_module, "get_shared_client", lambda api_key: client)
+    
+    @pytest.mark.asyncio
+    async def test_reply_is_streamed_as_tokens(self, flow, agent_and_task, monkeypatch):
+        agent, task = agent_and_task
+        self.install_stream(monkeypatch, ["What ", None, "is the title?"])
+        
+        reply = await flow._stream_clarifier_response(agent, task)
+        
+        assert reply == "What is the title?"
+        assert self.tokens == ["What ", "is the title?"]
+        request = self.requests[0]
+        assert request["model"] == "gemini-2.0-flash"
+        assert "Ask one question" in request["contents"]
+        assert request["config"].system_instruction.startswith("You are Clarifier.")
+        assert request["config"].temperature == 0.7
+    
+    @pytest.mark.asyncio
+    async def test_failed_stream_falls_back_to_crew(self, flow, agent_and_task, monkeypatch):
+        import app.crew.flows.slide_generation as flow_module
+        
+        agent, task = agent_and_task
+        self.install_stream(monkeypatch, ["What ", "is"], fail_after=1)
+        
+        class FakeCrew:
+            def __init__(self, agents, tasks):
+                pass
+            
+            async def kickoff_async(self):
+                return "Fallback question?"
+        
+        monkeypatch.setattr(flow_module, "Crew", FakeCrew)
+        
+        assert await flow._stream_clarifier_response(agent, task) == "Fallback question?"
+
 # Run with: pytest tests/test_clarifier_memory.py -v
@@ -35,3 +35,14 @@ def test_read_section_tool_not_found():
 
 def test_read_section_tool_input_schema():
     assert ReadSectionToolInput.model_fields['section_title'].description == "The exact title of the section to read."
+
+def test_read_section_tool_sees_appended_sections():
+    kb = KnowledgeBase(summary="S", sections=[DocumentSection(title="S1", content="C1")])
+    tool = ReadSectionTool(kb=kb)
+    
+    assert "C1" in tool._run(section_title="s1")
+    
+    # Index must refresh when the KnowledgeBase grows
+    kb.sections.append(DocumentSection(title="Straße", content="C2"))
+    
+    assert "C2" in tool._run(section_title="STRASSE")
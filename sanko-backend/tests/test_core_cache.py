@@ -0,0 +1,87 @@
+"""
+Tests for app.core.cache (TTLCache and SingleFlight)
+"""
+
+import asyncio
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import SingleFlight, TTLCache
+
+
+class TestTTLCache:
+
+    def test_get_set_and_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "a" is now most recent
+        
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+    
+    def test_entries_expire(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("k", "v")
+        
+        now[0] += 5
+        assert cache.get("k") == "v"
+        now[0] += 6
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flights = SingleFlight()
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+        
+        results = await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+        
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert len(flights) == 0  # forgotten once finished
+    
+    @pytest.mark.asyncio
+    async def test_distinct_keys_and_later_calls_run_again(self):
+        flights = SingleFlight()
+        calls = []
+        
+        async def work(tag):
+            calls.append(tag)
+            return tag
+        
+        assert await asyncio.gather(
+            flights.do("a", lambda: work("a")),
+            flights.do("b", lambda: work("b")),
+        ) == ["a", "b"]
+        assert await flights.do("a", lambda: work("a")) == "a"
+        assert calls == ["a", "b", "a"]
+    
+    @pytest.mark.asyncio
+    async def test_exceptions_are_shared(self):
+        flights = SingleFlight()
+        
+        async def boom():
+            await asyncio.sleep(0)
+            raise ValueError("nope")
+        
+        results = await asyncio.gather(
+            flights.do("k", boom), flights.do("k", boom), return_exceptions=True
+        )
+        
+        assert all(isinstance(r, ValueError) for r in results)
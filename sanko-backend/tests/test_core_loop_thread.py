@@ -0,0 +1,55 @@
+"""
+Tests for app.core.loop_thread (background event loop for sync tool calls)
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.loop_thread import LoopThread
+
+
+class TestLoopThread:
+
+    def test_run_reuses_one_loop(self):
+        runner = LoopThread("test-loop")
+        try:
+            first = runner.run(self._current_loop())
+            second = runner.run(self._current_loop())
+            
+            assert first is second
+            assert first is runner.loop
+        finally:
+            runner.stop()
+    
+    @pytest.mark.asyncio
+    async def test_run_from_inside_running_loop(self):
+        runner = LoopThread("test-loop")
+        try:
+            loop = runner.run(self._current_loop())
+            assert loop is not asyncio.get_running_loop()
+        finally:
+            runner.stop()
+    
+    def test_stop_then_restart(self):
+        runner = LoopThread("test-loop")
+        old = runner.run(self._current_loop())
+        runner.stop()
+        
+        assert old.is_closed()
+        try:
+            assert runner.run(self._current_loop()) is not old
+        finally:
+            runner.stop()
+    
+    def test_default_timeout(self):
+        runner = LoopThread("test-loop", default_timeout=0.05)
+        try:
+            with pytest.raises(TimeoutError):
+                runner.run(asyncio.sleep(1))
+        finally:
+            runner.stop()
+    
+    @staticmethod
+    async def _current_loop():
+        return asyncio.get_running_loop()
@@ -0,0 +1,129 @@
+"""
+Tests for the CrewAI tool wrappers in app.crew.tools.crewai_tools
+
+Covers how the sync _run entry points drive the async tool
+implementations.
+"""
+
+import pytest
+from pydantic import BaseModel
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.crew.tools.crewai_tools import (
+    AcademicSearchCrewTool,
+    ImageSearchCrewTool,
+    VisionVerificationTool,
+    make_tool,
+)
+
+
+def _vision_tool(score: float = 0.9):
+    tool = MagicMock()
+    tool.verify_image = AsyncMock(return_value=SimpleNamespace(
+        is_match=True,
+        match_score=score,
+        actual_description="A neural network diagram",
+        issues=[],
+    ))
+    return tool
+
+
+class TestBackgroundLoop:
+    """Sync _run calls execute on the shared background loop."""
+    
+    def test_run_from_plain_sync_code(self):
+        wrapper = VisionVerificationTool()
+        wrapper.set_tool(_vision_tool())
+        
+        result = wrapper._run("https://example.com/a.png", "diagram")
+        
+        assert "VERIFIED" in result
+        assert "0.90" in result
+    
+    @pytest.mark.asyncio
+    async def test_run_from_inside_running_loop(self):
+        """No nest_asyncio needed when the caller already has a loop."""
+        wrapper = AcademicSearchCrewTool()
+        search = MagicMock()
+        search.search = AsyncMock(return_value=[
+            SimpleNamespace(title="Paper", authors=["A", "B", "C"], year=2024, doi="10.1/x"),
+        ])
+        wrapper.set_tool(search)
+        
+        result = wrapper._run("transformers")
+        
+        assert '"Paper" by A, B et al. (2024)' in result
+        assert "DOI: 10.1/x" in result
+    
+    def test_tool_errors_are_reported(self):
+        wrapper = VisionVerificationTool()
+        tool = MagicMock()
+        tool.verify_image = AsyncMock(side_effect=RuntimeError("boom"))
+        wrapper.set_tool(tool)
+        
+        assert wrapper._run("https://example.com/a.png") == "Error verifying image: boom"
+
+
+class TestResultFormatting:
+    """Search results are rendered into the agent-facing strings."""
+    
+    def test_citation_formatting(self):
+        wrapper = AcademicSearchCrewTool()
+        search = MagicMock()
+        search.search = AsyncMock(return_value=[
+            SimpleNamespace(title="Solo", authors=["A"], year=2020, doi=None),
+            SimpleNamespace(title="Pair", authors=["A", "B"], year=2021, doi="10.2/y"),
+            SimpleNamespace(title="Anon", authors=[], year=2022, doi=None),
+        ])
+        wrapper.set_tool(search)
+        
+        assert wrapper._run("q") == (
+            "Found citations:\n"
+            '1. "Solo" by A (2020)\n'
+            '2. "Pair" by A, B (2021)\n'
+            "   DOI: 10.2/y\n"
+            '3. "Anon" by Unknown (2022)'
+        )
+    
+    def test_no_results_messages(self):
+        image_tool = MagicMock()
+        image_tool.search_images = AsyncMock(return_value=[])
+        wrapper = ImageSearchCrewTool()
+        wrapper.set_tool(image_tool)
+        
+        assert wrapper._run("nothing").startswith("No images found")
+
+
+class TestMakeTool:
+    """make_tool builds CrewAI tools from a coroutine and a formatter."""
+    
+    def test_generated_tool(self):
+        from crewai.tools import BaseTool
+        
+        class EchoInput(BaseModel):
+            text: str
+            times: int = 2
+        
+        EchoTool = make_tool(
+            "EchoTool",
+            name="echo",
+            description="Repeats text",
+            args_schema=EchoInput,
+            call=lambda impl, p: impl.echo(p.text, p.times),
+            formatter=lambda result: f"-> {result}",
+            impl_name="Echoer",
+            error_prefix="Error echoing",
+        )
+        tool = EchoTool()
+        assert isinstance(tool, BaseTool)
+        assert tool.name == "echo"
+        assert tool._run(text="hi") == "Error: Echoer not configured"
+        
+        impl = MagicMock()
+        impl.echo = AsyncMock(side_effect=lambda text, times: text * times)
+        tool.set_tool(impl)
+        
+        assert tool._run(text="ab") == "-> abab"
+        assert tool._run("x", 3) == "-> xxx"  # positional, in schema order
+        assert tool._run().startswith("Error echoing:")  # missing required arg
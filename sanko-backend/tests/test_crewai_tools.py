@@ -14,7 +14,7 @@ class TestCrewAIToolImports:
     
     def test_can_import_tools(self):
         """Verify all tool wrappers can be imported."""
-        from app.tools.crewai_tools import (
+        from app.crew.tools.crewai_tools import (
             VisionVerificationTool,
             ImageGenerationTool,
             ImageSearchCrewTool,
@@ -33,14 +33,14 @@ class TestImageGenerationTool:
     def test_inherits_from_base_tool(self):
         """Verify tool properly inherits from CrewAI BaseTool."""
         from crewai.tools import BaseTool
-        from app.tools.crewai_tools import ImageGenerationTool
+        from app.crew.tools.crewai_tools import ImageGenerationTool
         
         tool = ImageGenerationTool()
         assert isinstance(tool, BaseTool)
     
     def test_has_required_attributes(self):
         """Verify tool has name and description."""
-        from app.tools.crewai_tools import ImageGenerationTool
+        from app.crew.tools.crewai_tools import ImageGenerationTool
         
         tool = ImageGenerationTool()
         assert tool.name == "generate_image"
@@ -49,7 +49,7 @@ class TestImageGenerationTool:
     
     def test_description_guides_agent_usage(self):
         """Verify description tells agent when to use this tool."""
-        from app.tools.crewai_tools import ImageGenerationTool
+        from app.crew.tools.crewai_tools import ImageGenerationTool
         
         tool = ImageGenerationTool()
         # Should mention creating/generating visuals
@@ -64,14 +64,14 @@ class TestImageSearchTool:
     def test_inherits_from_base_tool(self):
         """Verify tool properly inherits from CrewAI BaseTool."""
         from crewai.tools import BaseTool
-        from app.tools.crewai_tools import ImageSearchCrewTool
+        from app.crew.tools.crewai_tools import ImageSearchCrewTool
         
         tool = ImageSearchCrewTool()
         assert isinstance(tool, BaseTool)
     
     def test_has_required_attributes(self):
         """Verify tool has name and description."""
-        from app.tools.crewai_tools import ImageSearchCrewTool
+        from app.crew.tools.crewai_tools import ImageSearchCrewTool
         
         tool = ImageSearchCrewTool()
         assert tool.name == "search_images"
@@ -79,7 +79,7 @@ class TestImageSearchTool:
     
     def test_description_guides_agent_usage(self):
         """Verify description tells agent when to use this tool."""
-        from app.tools.crewai_tools import ImageSearchCrewTool
+        from app.crew.tools.crewai_tools import ImageSearchCrewTool
         
         tool = ImageSearchCrewTool()
         # Should mention finding existing photos
@@ -92,14 +92,14 @@ class TestVisionVerificationTool:
     def test_inherits_from_base_tool(self):
         """Verify tool properly inherits from CrewAI BaseTool."""
         from crewai.tools import BaseTool
-        from app.tools.crewai_tools import VisionVerificationTool
+        from app.crew.tools.crewai_tools import VisionVerificationTool
         
         tool = VisionVerificationTool()
         assert isinstance(tool, BaseTool)
     
     def test_has_required_attributes(self):
         """Verify tool has name and description."""
-        from app.tools.crewai_tools import VisionVerificationTool
+        from app.crew.tools.crewai_tools import VisionVerificationTool
         
         tool = VisionVerificationTool()
         assert tool.name == "verify_image"
@@ -112,14 +112,14 @@ class TestAcademicSearchTool:
     def test_inherits_from_base_tool(self):
         """Verify tool properly inherits from CrewAI BaseTool."""
         from crewai.tools import BaseTool
-        from app.tools.crewai_tools import AcademicSearchCrewTool
+        from app.crew.tools.crewai_tools import AcademicSearchCrewTool
         
         tool = AcademicSearchCrewTool()
         assert isinstance(tool, BaseTool)
     
     def test_has_required_attributes(self):
         """Verify tool has name and description."""
-        from app.tools.crewai_tools import AcademicSearchCrewTool
+        from app.crew.tools.crewai_tools import AcademicSearchCrewTool
         
         tool = AcademicSearchCrewTool()
         assert tool.name == "search_citations"
@@ -131,7 +131,7 @@ class TestCreateCrewAITools:
     
     def test_creates_all_tools(self):
         """Verify factory creates all 4 tools."""
-        from app.tools.crewai_tools import create_crewai_tools
+        from app.crew.tools.crewai_tools import create_crewai_tools
         
         # Mock the underlying tools
         vision = MagicMock()
@@ -0,0 +1,25 @@
+from app.crew.flows.slide_generation import SlideGenerationFlow
+from app.models.schemas import RefinedSlide
+
+
+def test_slide_html_escapes_text_but_keeps_svg():
+    slide = RefinedSlide(
+        order=1,
+        title="<script>alert('title')</script>",
+        bullet_points=["a < b & c", "<img src=x onerror=alert(1)>"],
+        equation_svg='<svg class="eq"><path d="M0 0"/></svg>',
+        diagram_svg="<svg><text>A &amp; B</text></svg>",
+        image_url='https://img.example/a.png" onload="alert(1)',
+        image_alt="<b>alt</b>",
+    )
+    
+    html = SlideGenerationFlow()._build_slide_html(slide)
+    
+    assert "<script>" not in html
+    assert "&lt;script&gt;alert(&#39;title&#39;)&lt;/script&gt;" in html
+    assert "<li>a &lt; b &amp; c</li>" in html
+    assert "<li>&lt;img src=x onerror=alert(1)&gt;</li>" in html
+    assert '<div class="equation"><svg class="eq"><path d="M0 0"/></svg></div>' in html
+    assert '<div class="diagram"><svg><text>A &amp; B</text></svg></div>' in html
+    assert 'onload="alert(1)"' not in html
+    assert 'alt="&lt;b&gt;alt&lt;/b&gt;"' in html
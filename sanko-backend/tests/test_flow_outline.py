@@ -0,0 +1,77 @@
+import pytest
+
+from app.crew.flows.slide_generation import SlideGenerationFlow
+from app.models.schemas import Skeleton, SkeletonSlide
+
+
+def _flow_with_skeleton(count: int) -> SlideGenerationFlow:
+    flow = SlideGenerationFlow(session_id="test-session")
+    flow.state.skeleton = Skeleton(
+        presentation_title="Deck",
+        target_audience="students",
+        slides=[SkeletonSlide(order=i, title=f"Slide {i}") for i in range(1, count + 1)],
+    )
+    return flow
+
+
+@pytest.mark.asyncio
+async def test_approve_outline_reorder_then_modify():
+    flow = _flow_with_skeleton(4)
+    
+    skeleton = await flow.approve_outline([
+        {"action": "reorder", "new_order": [4, 1, 2, 3]},
+        # Orders refer to the reordered deck
+        {"action": "modify", "order": 1, "title": "Moved first"},
+    ])
+    
+    assert [s.title for s in skeleton.slides] == ["Moved first", "Slide 1", "Slide 2", "Slide 3"]
+    assert [s.order for s in skeleton.slides] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_approve_outline_remove_and_add_renumbers():
+    flow = _flow_with_skeleton(3)
+    
+    skeleton = await flow.approve_outline([
+        {"action": "remove", "order": 2},
+        {"action": "add", "title": "Appendix"},
+        {"action": "modify", "order": 3, "description": "Extra material"},
+    ])
+    
+    assert [s.title for s in skeleton.slides] == ["Slide 1", "Slide 3", "Appendix"]
+    assert [s.order for s in skeleton.slides] == [1, 2, 3]
+    # Orders aren't re-numbered until the end, so order 3 is still "Slide 3"
+    assert skeleton.slides[1].description == "Extra material"
+    assert skeleton.slides[2].description == ""
+
+
+@pytest.mark.asyncio
+async def test_session_helpers_reuse_one_flow_per_session():
+    from app.crew.flows import slide_generation
+    
+    state = await slide_generation.create_session()
+    flow = slide_generation._FLOWS[state.session_id]
+    state.skeleton = _flow_with_skeleton(2).state.skeleton
+    
+    await slide_generation.approve_outline(state.session_id, state)
+    await slide_generation.approve_outline(state.session_id, state)
+    
+    assert slide_generation._FLOWS[state.session_id] is flow
+    assert flow.state is state
+
+
+@pytest.mark.asyncio
+async def test_session_registry_stays_bounded(monkeypatch):
+    from collections import OrderedDict
+    from app.crew.flows import slide_generation
+    
+    monkeypatch.setattr(slide_generation, "_FLOWS", OrderedDict())
+    monkeypatch.setattr(slide_generation, "_FLOWS_MAX", 2)
+    
+    first = await slide_generation.create_session()
+    second = await slide_generation.create_session()
+    slide_generation._get_flow(first.session_id)  # first is now most recent
+    third = await slide_generation.create_session()
+    
+    assert list(slide_generation._FLOWS) == [first.session_id, third.session_id]
+    assert second.session_id not in slide_generation._FLOWS
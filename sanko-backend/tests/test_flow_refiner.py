@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from app.crew.flows.slide_generation import SlideGenerationFlow
+from app.models.schemas import PlannedContent, PlannedSlide
+
+
+class _FakeRenderTool:
+    """Render tool stub that records peak concurrent slide batches."""
+    
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+    
+    async def render_batch(self, jobs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return [f"<svg>{job['type']}</svg>" for job in jobs]
+
+
+def _planned_content(count: int) -> PlannedContent:
+    return PlannedContent(
+        presentation_title="Deck",
+        target_audience="students",
+        slides=[
+            PlannedSlide(
+                order=i,
+                title=f"Slide {i}",
+                diagram_placeholder="flow",
+                equation_placeholder="quadratic" if i % 2 else None,
+            )
+            for i in range(1, count + 1)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_refiner_renders_in_parallel_with_cap():
+    flow = SlideGenerationFlow(session_id="test-session")
+    flow.state.planned_content = _planned_content(6)
+    flow._render_sem = asyncio.Semaphore(2)
+    tool = _FakeRenderTool()
+    
+    with patch('app.crew.tools.render_service_tool.get_render_tool', return_value=tool), \
+            patch('app.crew.agents.refiner.create_refiner_agent'):
+        await flow._run_refiner()
+    
+    refined = flow.state.refined_content
+    assert [s.order for s in refined.slides] == [1, 2, 3, 4, 5, 6]
+    assert refined.diagrams_rendered == 6
+    assert refined.equations_rendered == 3
+    assert refined.slides[0].equation_svg == "<svg>latex</svg>"
+    assert tool.peak == 2
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from app.crew.flows.slide_generation import SlideGenerationFlow, FlowStatus
 from app.models.schemas import KnowledgeBase, DocumentSection
 
@@ -19,11 +19,11 @@ async def test_run_synthesis_success():
         sections=[DocumentSection(title="S2", content="C2")]
     )
     
-    # Mock SynthesisTool._run
+    # Mock SynthesisTool._arun
     # We mock it at the class level or instance level where it's used in the flow
     with patch('app.crew.flows.slide_generation.SynthesisTool') as MockTool:
         mock_tool_instance = MockTool.return_value
-        mock_tool_instance._run.side_effect = [kb1, kb2]
+        mock_tool_instance._arun = AsyncMock(side_effect=[kb1, kb2])
         
         # Run
         result = await flow.run_synthesis(file_paths)
@@ -35,7 +35,7 @@ async def test_run_synthesis_success():
         assert "Summary 1" in flow.state.knowledge_base.summary
         assert "Summary 2" in flow.state.knowledge_base.summary
         assert result == flow.state.knowledge_base
-        assert mock_tool_instance._run.call_count == 2
+        assert mock_tool_instance._arun.await_count == 2
 
 @pytest.mark.asyncio
 async def test_run_synthesis_with_error():
@@ -44,7 +44,7 @@ async def test_run_synthesis_with_error():
     
     with patch('app.crew.flows.slide_generation.SynthesisTool') as MockTool:
         mock_tool_instance = MockTool.return_value
-        mock_tool_instance._run.return_value = "Error: Something went wrong"
+        mock_tool_instance._arun = AsyncMock(return_value="Error: Something went wrong")
         
         # Run
         result = await flow.run_synthesis(file_paths)
@@ -52,3 +52,54 @@ async def test_run_synthesis_with_error():
         # Assertions - should continue but result in empty sections if all failed
         assert len(result.sections) == 0
         assert flow.state.status == FlowStatus.AWAITING_CLARIFICATION
+
+@pytest.mark.asyncio
+async def test_run_synthesis_skips_files_that_raise():
+    flow = SlideGenerationFlow(session_id="test-session")
+    kb = KnowledgeBase(summary="Fine", sections=[DocumentSection(title="S", content="C")])
+    
+    with patch('app.crew.flows.slide_generation.SynthesisTool') as MockTool:
+        MockTool.return_value._arun = AsyncMock(side_effect=[RuntimeError("pool died"), kb])
+        result = await flow.run_synthesis(["bad.pdf", "good.pdf"])
+    
+    assert [s.title for s in result.sections] == ["S"]
+    assert flow.state.status == FlowStatus.AWAITING_CLARIFICATION
+
+@pytest.mark.asyncio
+async def test_run_synthesis_batches_file_progress():
+    flow = SlideGenerationFlow(session_id="test-session")
+    events = []
+    flow.emitter.add_listener(events.append)
+    
+    kb = KnowledgeBase(summary="S", sections=[])
+    
+    with patch('app.crew.flows.slide_generation.SynthesisTool') as MockTool:
+        MockTool.return_value._arun = AsyncMock(return_value=kb)
+        await flow.run_synthesis(["a.pdf", "b.pdf", "c.pdf"])
+    
+    types = [e["type"] for e in events]
+    assert "file_progress" not in types
+    
+    batches = [e for e in events if e["type"] == "progress_batch"]
+    progress = [inner for b in batches for inner in b["events"]]
+    assert [p["file_name"] for p in progress] == ["a.pdf", "b.pdf", "c.pdf"]
+    # Buffered progress is flushed before the stage completes
+    assert types.index("progress_batch") < types.index("stage_complete")
+
+@pytest.mark.asyncio
+async def test_run_synthesis_uses_process_pool_when_configured():
+    from concurrent.futures import ThreadPoolExecutor
+    
+    flow = SlideGenerationFlow(session_id="test-session")
+    kb = KnowledgeBase(summary="Pooled", sections=[])
+    
+    # Stand in for the process pool; the pooled entry point must be used
+    with ThreadPoolExecutor(max_workers=1) as pool, \
+            patch('app.crew.flows.slide_generation.get_pdf_pool', return_value=pool), \
+            patch('app.crew.flows.slide_generation._synthesize_path', return_value=kb) as mock_path, \
+            patch('app.crew.flows.slide_generation.SynthesisTool') as MockTool:
+        result = await flow.run_synthesis(["file1.pdf"])
+    
+    mock_path.assert_called_once_with("file1.pdf")
+    MockTool.assert_not_called()
+    assert result.summary == "Content from file1.pdf: Pooled"
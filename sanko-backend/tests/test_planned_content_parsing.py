@@ -0,0 +1,30 @@
+import pytest
+
+from app.crew.flows.slide_generation import _find_json_span
+
+
+class TestFindJsonSpan:
+    """Test the brace-depth scanner used to pull JSON out of agent output."""
+    
+    def test_object_surrounded_by_prose(self):
+        text = 'Here is the plan:\n{"slides": [{"order": 1}]}\nLet me know!'
+        
+        start, end = _find_json_span(text)
+        
+        assert text[start:end] == '{"slides": [{"order": 1}]}'
+    
+    def test_braces_and_escaped_quotes_inside_strings(self):
+        text = '{"title": "Sets {a, b} and \\"quotes\\"", "n": 1} trailing }'
+        
+        start, end = _find_json_span(text)
+        
+        assert text[start:end] == '{"title": "Sets {a, b} and \\"quotes\\"", "n": 1}'
+    
+    def test_stops_at_first_balanced_object(self):
+        text = '{"a": 1} and later {"b": 2}'
+        
+        assert _find_json_span(text) == (0, 8)
+    
+    @pytest.mark.parametrize("text", ["no json here", '{"slides": [1, 2]'])
+    def test_missing_or_unbalanced_returns_none(self, text):
+        assert _find_json_span(text) is None
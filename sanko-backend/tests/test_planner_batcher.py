@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from app.crew.flows.planner_batcher import PlannerBatcher
+
+
+class TestPlannerBatcher:
+    """Test coalescing of concurrent planner prompts."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_prompts_share_one_batch(self):
+        """Prompts submitted together are dispatched in a single runner call."""
+        calls = []
+        
+        async def runner(prompts):
+            calls.append(list(prompts))
+            return [f"result:{p}" for p in prompts]
+        
+        batcher = PlannerBatcher(runner=runner, batch_wait_timeout_s=0.02)
+        results = await asyncio.gather(*(batcher.submit(p) for p in ["a", "b", "c"]))
+        
+        assert results == ["result:a", "result:b", "result:c"]
+        assert calls == [["a", "b", "c"]]
+    
+    @pytest.mark.asyncio
+    async def test_batches_split_at_max_size(self):
+        """A full batch is flushed without waiting for more prompts."""
+        calls = []
+        
+        async def runner(prompts):
+            calls.append(list(prompts))
+            return prompts
+        
+        batcher = PlannerBatcher(runner=runner, max_batch_size=2, batch_wait_timeout_s=0.02)
+        results = await asyncio.gather(*(batcher.submit(p) for p in ["a", "b", "c"]))
+        
+        assert results == ["a", "b", "c"]
+        assert [len(c) for c in calls] == [2, 1]
+    
+    @pytest.mark.asyncio
+    async def test_runner_error_propagates_to_callers(self):
+        """A failed batch raises in every waiting caller."""
+        async def runner(prompts):
+            raise RuntimeError("LLM unavailable")
+        
+        batcher = PlannerBatcher(runner=runner, batch_wait_timeout_s=0.01)
+        
+        with pytest.raises(RuntimeError, match="LLM unavailable"):
+            await batcher.submit("a")
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_is_isolated_per_prompt(self):
+        """A failed batch is rerun per prompt; only the bad prompt raises."""
+        calls = []
+        
+        async def runner(prompts):
+            calls.append(list(prompts))
+            if "bad" in prompts:
+                raise RuntimeError("bad prompt")
+            return [f"result:{p}" for p in prompts]
+        
+        batcher = PlannerBatcher(runner=runner, batch_wait_timeout_s=0.02)
+        results = await asyncio.gather(
+            *(batcher.submit(p) for p in ["a", "bad", "c"]),
+            return_exceptions=True,
+        )
+        
+        assert results[0] == "result:a"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "result:c"
+        assert calls[0] == ["a", "bad", "c"]
+        assert sorted(map(tuple, calls[1:])) == [("a",), ("bad",), ("c",)]
+    
+    @pytest.mark.asyncio
+    async def test_short_result_list_does_not_hang_callers(self):
+        """A runner returning too few results is retried per prompt, never leaving a caller waiting."""
+        calls = []
+        
+        async def runner(prompts):
+            calls.append(list(prompts))
+            if prompts == ["b"]:
+                return []
+            return [f"result:{p}" for p in prompts][:1]
+        
+        batcher = PlannerBatcher(runner=runner, batch_wait_timeout_s=0.02)
+        results = await asyncio.wait_for(asyncio.gather(
+            *(batcher.submit(p) for p in ["a", "b"]),
+            return_exceptions=True,
+        ), timeout=1)
+        
+        assert results[0] == "result:a"
+        assert isinstance(results[1], RuntimeError)
+        assert calls[0] == ["a", "b"]
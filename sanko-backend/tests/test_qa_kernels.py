@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from app.crew.qa import kernels
+from app.crew.qa.kernels import METRIC_NAMES, slide_quality, slide_quality_batch
+
+
+class TestSlideQuality:
+    """Test the Visual QA pixel metrics."""
+    
+    def test_blank_white_slide(self):
+        img = np.full((20, 30, 3), 255, dtype=np.uint8)
+        
+        contrast, edge_density, whitespace = slide_quality(img)
+        
+        assert contrast == pytest.approx(0.0, abs=1e-6)
+        assert edge_density == 0.0
+        assert whitespace == 1.0
+    
+    def test_half_black_slide(self):
+        img = np.full((10, 10, 3), 255, dtype=np.uint8)
+        img[:, :5] = 0
+        
+        contrast, edge_density, whitespace = slide_quality(img)
+        
+        assert contrast == pytest.approx(127.5 / 128, abs=1e-4)
+        assert edge_density == pytest.approx(9 / 81)  # one edge column
+        assert whitespace == pytest.approx(0.5)
+    
+    def test_matches_numpy_reference(self):
+        rng = np.random.default_rng(0)
+        img = rng.integers(0, 256, size=(16, 24, 3), dtype=np.uint8)
+        
+        np.testing.assert_allclose(
+            slide_quality(img), kernels._slide_quality_numpy(img), rtol=1e-4, atol=1e-5
+        )
+    
+    def test_batch_shape(self):
+        images = np.zeros((3, 8, 8, 3), dtype=np.uint8)
+        
+        result = slide_quality_batch(images)
+        
+        assert result.shape == (3, len(METRIC_NAMES))
+        assert result.dtype == np.float32
+    
+    def test_rejects_non_rgb(self):
+        with pytest.raises(ValueError):
+            slide_quality(np.zeros((8, 8), dtype=np.uint8))
@@ -0,0 +1,43 @@
+import numpy as np
+
+from app.crew.qa.results import QAResultsSoA
+
+
+class TestQAResultsSoA:
+    """Test the column-wise QA result container."""
+    
+    def test_aggregates_and_failing_orders(self):
+        results = QAResultsSoA.from_scores(
+            slide_orders=np.array([1, 2, 3]),
+            scores=np.array([90.0, 60.0, 99.0]),
+            passed=np.array([True, False, True]),
+            iteration=2,
+        )
+        
+        assert results.average_score == 83.0
+        assert results.all_passed is False
+        assert results.failing_orders() == [2]
+    
+    def test_to_report_materializes_models(self):
+        results = QAResultsSoA.from_scores(
+            slide_orders=np.array([1, 2]),
+            scores=np.array([95.0, 96.0]),
+            passed=np.array([True, True]),
+            iteration=1,
+        )
+        results.issues[1].append("Title overflows")
+        
+        report = results.to_report(session_id="s1", total_iterations=1)
+        
+        assert report.all_passed is True
+        assert [r.slide_order for r in report.slides] == [1, 2]
+        assert report.slides[1].issues == ["Title overflows"]
+        assert isinstance(report.slides[0].score, float)
+    
+    def test_empty_deck(self):
+        empty = np.array([], dtype=np.int32)
+        results = QAResultsSoA.from_scores(empty, empty, empty.astype(bool), iteration=1)
+        
+        assert results.average_score == 0.0
+        assert results.all_passed is True
+        assert results.to_report("s1", 1).slides == []
@@ -0,0 +1,198 @@
+"""
+Tests for render request coalescing and caching in
+app.crew.tools.render_service_tool
+"""
+
+import asyncio
+
+import pytest
+
+from app.crew.tools import render_service_tool as render_module
+from app.crew.tools.render_service_tool import RenderServiceTool, _RenderBatcher
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Fresh memory cache and a throwaway disk cache for every test."""
+    render_module._SVG_CACHE.clear()
+    monkeypatch.setattr(render_module, "_CACHE_DIR", tmp_path / "render")
+    yield tmp_path / "render"
+    render_module._SVG_CACHE.clear()
+
+
+class FakeRenderClient:
+    """Records how the batcher talks to the render service."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def render_latex(self, latex, display=True):
+        self.calls.append(("latex", latex))
+        if latex == "bad":
+            return {"success": False, "error": "bad"}
+        return {"success": True, "svg": f"<svg>{latex}</svg>"}
+    
+    async def render_mermaid(self, diagram):
+        self.calls.append(("mermaid", diagram))
+        return {"success": True, "svg": f"<svg>{diagram}</svg>"}
+    
+    async def render_latex_batch(self, latex):
+        self.calls.append(("latex_batch", list(latex)))
+        return [
+            {"success": False, "error": "bad"} if tex == "bad" else {"success": True, "svg": f"<svg>{tex}</svg>"}
+            for tex in latex
+        ]
+    
+    async def format_citations(self, citations, style="apa"):
+        self.calls.append(("citations", style, len(citations)))
+        return {"success": True, "citations": [
+            {"formatted": f"{c['title']} [{style}]"} for c in citations
+        ]}
+
+
+def _tool_with(client):
+    tool = RenderServiceTool()
+    batcher = _RenderBatcher(client)
+    tool._get_batcher = lambda: batcher
+    return tool, batcher
+
+
+class TestRenderBatcher:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_latex_goes_out_in_one_request(self):
+        client = FakeRenderClient()
+        tool, _ = _tool_with(client)
+        
+        svgs = await asyncio.gather(*(tool._arun("latex", f"x_{i}") for i in range(3)))
+        
+        assert svgs == ["<svg>x_0</svg>", "<svg>x_1</svg>", "<svg>x_2</svg>"]
+        assert client.calls == [("latex_batch", ["x_0", "x_1", "x_2"])]
+    
+    @pytest.mark.asyncio
+    async def test_lone_request_uses_single_endpoint(self):
+        client = FakeRenderClient()
+        tool, _ = _tool_with(client)
+        
+        assert await tool._arun("latex", "E = mc^2") == "<svg>E = mc^2</svg>"
+        assert client.calls == [("latex", "E = mc^2")]
+    
+    @pytest.mark.asyncio
+    async def test_failures_stay_in_their_slot(self):
+        client = FakeRenderClient()
+        tool, _ = _tool_with(client)
+        
+        results = await tool.render_batch([
+            {"type": "latex", "content": "a"},
+            {"type": "latex", "content": "bad"},
+        ])
+        
+        assert results == ["<svg>a</svg>", "Error rendering LaTeX: bad"]
+    
+    @pytest.mark.asyncio
+    async def test_citations_coalesce_per_style(self):
+        client = FakeRenderClient()
+        tool, _ = _tool_with(client)
+        
+        results = await asyncio.gather(
+            tool._arun("citation", citation={"title": "A"}, style="apa"),
+            tool._arun("citation", citation={"title": "B"}, style="apa"),
+            tool._arun("citation", citation={"title": "C"}, style="ieee"),
+        )
+        
+        assert results == ["A [apa]", "B [apa]", "C [ieee]"]
+        assert sorted(client.calls) == [("citations", "apa", 2), ("citations", "ieee", 1)]
+    
+    @pytest.mark.asyncio
+    async def test_batch_size_adapts(self):
+        client = FakeRenderClient()
+        batcher = _RenderBatcher(client)
+        
+        # A full batch dispatches immediately and grows the next one
+        await asyncio.gather(*(batcher.submit("latex", str(i)) for i in range(batcher.MIN_BATCH)))
+        assert batcher.batch_size == batcher.MIN_BATCH * 2
+        assert len(client.calls) == 1
+        
+        # A mostly empty window shrinks it again
+        await batcher.submit("latex", "lonely")
+        assert batcher.batch_size == batcher.MIN_BATCH
+
+
+class TestRenderCache:
+    
+    @pytest.mark.asyncio
+    async def test_repeat_renders_skip_the_service(self):
+        client = FakeRenderClient()
+        tool, _ = _tool_with(client)
+        
+        first = await tool._arun("mermaid", "graph TD; A-->B")
+        second = await tool._arun("mermaid", "graph TD; A-->B")
+        
+        assert first == second == "<svg>graph TD; A-->B</svg>"
+        assert client.calls == [("mermaid", "graph TD; A-->B")]
+    
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_memory_eviction(self, isolated_cache):
+        client = FakeRenderClient()
+        tool, _ = _tool_with(client)
+        
+        await tool._arun("latex", "E = mc^2")
+        render_module._SVG_CACHE.clear()
+        
+        assert await tool._arun("latex", "E = mc^2") == "<svg>E = mc^2</svg>"
+        assert len(client.calls) == 1
+        assert len(list(isolated_cache.iterdir())) == 1  # no temp files left
+    
+    @pytest.mark.asyncio
+    async def test_failures_and_styles_are_not_conflated(self):
+        client = FakeRenderClient()
+        tool, _ = _tool_with(client)
+        
+        assert (await tool._arun("latex", "bad")).startswith("Error")
+        assert await tool._arun("citation", citation={"title": "A"}, style="apa") == "A [apa]"
+        assert await tool._arun("citation", citation={"title": "A"}, style="ieee") == "A [ieee]"
+        
+        assert render_module._SVG_CACHE.get(render_module._cache_key("latex", "bad")) is None
+        assert len(client.calls) == 3
+
+
+class TestRenderCachePruning:
+    
+    @staticmethod
+    def _entry(directory, name, size, age_s):
+        import os
+        import time
+        
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / name
+        path.write_text("x" * size)
+        mtime = time.time() - age_s
+        os.utime(path, (mtime, mtime))
+        return path
+    
+    def test_expired_entries_are_removed(self, isolated_cache):
+        old = self._entry(isolated_cache, "old", 10, age_s=3600)
+        fresh = self._entry(isolated_cache, "fresh", 10, age_s=0)
+        
+        assert render_module.prune_render_cache(max_bytes=1000, max_age_s=60) == 1
+        assert not old.exists() and fresh.exists()
+    
+    def test_oldest_entries_go_first_when_over_size(self, isolated_cache):
+        paths = [self._entry(isolated_cache, f"e{i}", 100, age_s=30 - i) for i in range(5)]
+        
+        assert render_module.prune_render_cache(max_bytes=250, max_age_s=3600) == 3
+        assert [p.exists() for p in paths] == [False, False, False, True, True]
+    
+    def test_missing_directory_is_a_no_op(self, isolated_cache):
+        assert render_module.prune_render_cache() == 0
+    
+    @pytest.mark.asyncio
+    async def test_writes_trigger_periodic_prune(self, isolated_cache, monkeypatch):
+        monkeypatch.setattr(render_module, "_PRUNE_EVERY_WRITES", 2)
+        monkeypatch.setattr(render_module, "_writes_since_prune", 0)
+        monkeypatch.setattr(render_module.settings, "render_cache_max_bytes", 15)
+        
+        await render_module._cache_put("a", "x" * 10)
+        await render_module._cache_put("b", "y" * 10)
+        
+        assert [p.name for p in isolated_cache.iterdir()] == ["b"]
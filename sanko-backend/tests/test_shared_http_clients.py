@@ -0,0 +1,79 @@
+"""
+Tests for the pooled httpx clients shared by the agent tools
+(app.crew.tools.{academic_search,image_search,vision}_tool)
+"""
+
+import httpx
+import pytest
+
+from app.crew.tools import academic_search_tool, image_search_tool, vision_tool
+
+
+TOOL_MODULES = [academic_search_tool, image_search_tool, vision_tool]
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch):
+    """Start every test without a shared client."""
+    for module in TOOL_MODULES:
+        monkeypatch.setattr(module, "_shared_client", None)
+    yield
+
+
+class TestSharedClientLifecycle:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("module", TOOL_MODULES, ids=lambda m: m.__name__.rsplit(".", 1)[-1])
+    async def test_reused_until_closed(self, module):
+        client = module._get_shared_client()
+        assert module._get_shared_client() is client
+        
+        await module.close_shared_client()
+        
+        assert client.is_closed
+        assert module._shared_client is None
+        replacement = module._get_shared_client()
+        assert replacement is not client and not replacement.is_closed
+        await module.close_shared_client()
+    
+    @pytest.mark.asyncio
+    async def test_close_without_client_is_a_no_op(self):
+        for module in TOOL_MODULES:
+            await module.close_shared_client()
+    
+    def test_tool_instances_share_one_client(self):
+        first = academic_search_tool.AcademicSearchTool()
+        second = academic_search_tool.AcademicSearchTool()
+        
+        assert first._client is second._client is academic_search_tool._shared_client
+
+
+class TestVisionDownloads:
+    """Image downloads go through the shared client."""
+    
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        def install(handler):
+            monkeypatch.setattr(
+                vision_tool, "_shared_client",
+                httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            )
+        return install
+    
+    @pytest.mark.asyncio
+    async def test_download_detects_mime_type(self, serve):
+        serve(lambda request: httpx.Response(200, content=b"\x89PNG\r\n\x1a\n" + b"0" * 16))
+        tool = vision_tool.VisionTool.__new__(vision_tool.VisionTool)
+        
+        data, mime_type = await tool._stream_image("https://example.com/a")
+        
+        assert mime_type == "image/png"
+        assert len(data) == 24
+    
+    @pytest.mark.asyncio
+    async def test_download_stops_at_size_limit(self, serve, monkeypatch):
+        monkeypatch.setattr(vision_tool.settings, "max_image_bytes", 8)
+        serve(lambda request: httpx.Response(200, content=b"0" * 64))
+        tool = vision_tool.VisionTool.__new__(vision_tool.VisionTool)
+        
+        assert await tool._stream_image("https://example.com/big.png") is None
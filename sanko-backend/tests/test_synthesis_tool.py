@@ -5,12 +5,23 @@ This test file uses a different approach - instead of trying to mock the module'
 imports before they happen, we call the tool._run method and mock the specific 
 objects it uses at runtime.
 """
+import asyncio
+import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from app.crew.tools.synthesis_tool import SynthesisTool, SynthesisToolInput
+from app.clients.gemini.helpers import get_shared_client
 from app.models.schemas import KnowledgeBase
 
 
+@pytest.fixture(autouse=True)
+def fresh_shared_client():
+    """Each test patches genai.Client, so don't reuse a cached client."""
+    get_shared_client.cache_clear()
+    yield
+    get_shared_client.cache_clear()
+
+
 def test_synthesis_tool_run():
     """Test the synthesis tool with mocked dependencies."""
     # Create the tool first
@@ -19,6 +30,8 @@ def test_synthesis_tool_run():
     # Mock the settings
     mock_settings = MagicMock()
     mock_settings.gemini_api_key = "fake-api-key"
+    mock_settings.gemini_concurrency = 4
+    mock_settings.synthesis_timeout_s = 30
     
     # Mock the Gemini API client
     mock_client = MagicMock()
@@ -34,7 +47,7 @@ def test_synthesis_tool_run():
             }
         ]
     }"""
-    mock_client.models.generate_content.return_value = mock_response
+    mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
     
     # Patch at the module level where the objects are USED
     with patch('app.crew.tools.synthesis_tool.settings', mock_settings):
@@ -55,3 +68,145 @@ def test_synthesis_tool_run():
 def test_synthesis_tool_input_schema():
     """Verify the input schema."""
     assert SynthesisToolInput.model_fields['file_path'].description == "The path to the PDF file to be synthesized."
+
+
+def test_synthesis_tool_merges_page_chunks_concurrently():
+    """Page chunks are synthesized in parallel and merged in page order."""
+    tool = SynthesisTool()
+    
+    mock_settings = MagicMock()
+    mock_settings.gemini_api_key = "fake-api-key"
+    mock_settings.gemini_concurrency = 4
+    mock_settings.synthesis_timeout_s = 30
+    
+    in_flight = {"now": 0, "max": 0}
+    
+    async def generate_content(model, contents, config):
+        if isinstance(contents, str):  # summary merge call
+            return MagicMock(text="Merged overview.")
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.05)
+        in_flight["now"] -= 1
+        pages = "1-5" if "pages 1-5" in contents[1] else "6-7"
+        return MagicMock(text=json.dumps({
+            "summary": f"Pages {pages}",
+            "sections": [{"title": f"Part {pages}", "content": "...", "page_range": pages}],
+        }))
+    
+    mock_client = MagicMock()
+    mock_client.aio.models.generate_content = generate_content
+    chunks = [(1, 5, b"first"), (6, 7, b"second")]
+    
+    with patch('app.crew.tools.synthesis_tool.settings', mock_settings), \
+            patch('app.crew.tools.synthesis_tool.genai.Client', return_value=mock_client), \
+            patch.object(SynthesisTool, '_load_chunks', return_value=chunks):
+        result = tool._run(file_path="dummy/path.pdf")
+    
+    assert isinstance(result, KnowledgeBase), result
+    assert in_flight["max"] == 2
+    assert [s.title for s in result.sections] == ["Part 1-5", "Part 6-7"]
+    assert result.summary == "Merged overview."
+
+
+def _chunk_settings():
+    mock_settings = MagicMock()
+    mock_settings.gemini_api_key = "fake-api-key"
+    mock_settings.gemini_concurrency = 4
+    mock_settings.synthesis_timeout_s = 30
+    return mock_settings
+
+
+def _chunk_response(pages):
+    return MagicMock(text=json.dumps({
+        "summary": f"Pages {pages}",
+        "sections": [{"title": f"Part {pages}", "content": "...", "page_range": pages}],
+    }))
+
+
+def test_failed_page_chunks_are_retried():
+    """A chunk that fails once is retried instead of being dropped."""
+    attempts = {"6-7": 0}
+    
+    async def generate_content(model, contents, config):
+        if isinstance(contents, str):
+            return MagicMock(text="Merged overview.")
+        if "pages 1-5" in contents[1]:
+            return _chunk_response("1-5")
+        attempts["6-7"] += 1
+        if attempts["6-7"] == 1:
+            raise RuntimeError("503 overloaded")
+        return _chunk_response("6-7")
+    
+    mock_client = MagicMock()
+    mock_client.aio.models.generate_content = generate_content
+    
+    with patch('app.crew.tools.synthesis_tool.settings', _chunk_settings()), \
+            patch('app.crew.tools.synthesis_tool.genai.Client', return_value=mock_client), \
+            patch.object(SynthesisTool, '_load_chunks', return_value=[(1, 5, b"a"), (6, 7, b"b")]):
+        result = SynthesisTool()._run(file_path="dummy/path.pdf")
+    
+    assert attempts["6-7"] == 2
+    assert [s.title for s in result.sections] == ["Part 1-5", "Part 6-7"]
+
+
+def test_persistently_failing_chunk_fails_the_file():
+    """A partial KnowledgeBase is never returned as a success."""
+    async def generate_content(model, contents, config):
+        if "pages 6-7" in contents[1]:
+            raise RuntimeError("503 overloaded")
+        return _chunk_response("1-5")
+    
+    mock_client = MagicMock()
+    mock_client.aio.models.generate_content = generate_content
+    
+    with patch('app.crew.tools.synthesis_tool.settings', _chunk_settings()), \
+            patch('app.crew.tools.synthesis_tool.genai.Client', return_value=mock_client), \
+            patch.object(SynthesisTool, '_load_chunks', return_value=[(1, 5, b"a"), (6, 7, b"b")]):
+        result = SynthesisTool()._run(file_path="dummy/path.pdf")
+    
+    assert result == "Error: Synthesis failed for pages 6-7 of dummy/path.pdf"
+
+
+def test_sync_run_times_out_with_error_message():
+    """The sync entry point reports a timeout instead of raising."""
+    mock_settings = _chunk_settings()
+    mock_settings.synthesis_timeout_s = 0.05
+    
+    async def slow(file_path):
+        await asyncio.sleep(1)
+    
+    with patch('app.crew.tools.synthesis_tool.settings', mock_settings), \
+            patch.object(SynthesisTool, '_run_async', side_effect=slow):
+        result = SynthesisTool()._run(file_path="big.pdf")
+    
+    assert result == "Error: Synthesis of big.pdf timed out after 0.05s"
+
+
+def _chunks_for(pages, handling):
+    mock_settings = MagicMock()
+    mock_settings.pdf_handling = handling
+    with patch('app.crew.tools.synthesis_tool.settings', mock_settings), \
+            patch('app.crew.tools.synthesis_tool.extract_pdf_text', return_value=pages), \
+            patch('app.crew.tools.synthesis_tool.split_pdf', return_value=[(None, None, b"%PDF")]), \
+            patch('builtins.open', new_callable=MagicMock) as mock_open:
+        mock_open.return_value.__enter__.return_value.read.return_value = b"%PDF"
+        return SynthesisTool._load_chunks("dummy/path.pdf")
+
+
+def test_auto_handling_uses_text_for_born_digital_pdfs():
+    pages = ["x" * 800] * 7
+    
+    chunks = _chunks_for(pages, "auto")
+    
+    assert [(first, last) for first, last, _ in chunks] == [(1, 5), (6, 7)]
+    assert all(isinstance(content, str) for _, _, content in chunks)
+    assert chunks[1][2].startswith("--- Page 6 ---\n")
+
+
+def test_auto_handling_uses_vision_for_scanned_pdfs():
+    assert _chunks_for(["", "p. 2"], "auto") == [(None, None, b"%PDF")]
+    assert _chunks_for(["x" * 800], "vision") == [(None, None, b"%PDF")]
+    # Forced text mode only falls back when there is no text layer at all
+    assert _chunks_for(["short"], "text") == [(None, None, "--- Page 1 ---\nshort")]
+    assert _chunks_for([], "text") == [(None, None, b"%PDF")]
@@ -1,6 +1,7 @@
 import pytest
 from app.templates.layouts import TitleTemplate, ContentTemplate, TwoColumnTemplate
 from app.themes import MODERN_THEME
+from app.models.schemas import SlideContentType
 from app.routers.generation.models import EnrichedSlide, CitationMetadata
 
 # Mock slide data
@@ -81,7 +82,7 @@ def test_diagram_template_render(slide_data):
     html = template.render(slide, MODERN_THEME)
     
     assert "class=\"slide slide-diagram\"" in html
-    assert "graph TD; A-->B" in html
+    assert "graph TD; A--&gt;B" in html
     assert "mermaid" in html
 
 def test_math_template_svg_precedence(slide_data):
@@ -126,3 +127,144 @@ def test_image_template_caption(slide_data):
     
     assert "image-caption" in html
     assert "My Caption" in html
+
+def test_slide_text_is_escaped(slide_data):
+    slide = slide_data.model_copy(update={
+        "title": "Q&A <script>alert(1)</script>",
+        "bullet_points": ["a < b", 'say "hi"'],
+    })
+    template = ContentTemplate()
+    html = template.render(slide, MODERN_THEME)
+    
+    assert "<script>" not in html
+    assert "Q&amp;A &lt;script&gt;" in html
+    assert "<li>a &lt; b</li>" in html
+    assert "<li>say &#34;hi&#34;</li>" in html
+
+def test_image_attributes_are_escaped(slide_data):
+    slide = slide_data.model_copy(update={
+        "image_url": 'http://img.com/1.jpg" onerror="alert(1)',
+        "image_alt": "<b>alt</b>",
+        "content_type": "two_col_image"
+    })
+    from app.templates.layouts import TwoColImageTemplate
+    template = TwoColImageTemplate()
+    html = template.render(slide, MODERN_THEME)
+    
+    assert 'onerror="alert(1)"' not in html
+    assert 'alt="&lt;b&gt;alt&lt;/b&gt;"' in html
+
+def test_latex_and_mermaid_sources_are_escaped(slide_data):
+    from app.templates.layouts import TwoColMathTemplate, DiagramTemplate
+    math = slide_data.model_copy(update={
+        "equation_latex": "x < y </div><script>alert(1)</script>",
+        "content_type": "two_col_math"
+    })
+    diagram = slide_data.model_copy(update={
+        "diagram_mermaid": "graph TD; A-->B[<img src=x onerror=alert(1)>]",
+        "content_type": "diagram"
+    })
+    
+    math_html = TwoColMathTemplate().render(math, MODERN_THEME)
+    diagram_html = DiagramTemplate().render(diagram, MODERN_THEME)
+    
+    assert "<script>" not in math_html
+    assert "$$x &lt; y &lt;/div&gt;&lt;script&gt;" in math_html
+    assert "<img" not in diagram_html
+    assert "A--&gt;B[&lt;img src=x onerror=alert(1)&gt;]" in diagram_html
+
+def test_layouts_are_imported_on_first_use():
+    import subprocess
+    import sys
+    from pathlib import Path
+    
+    code = (
+        "import sys, app.templates.layouts as layouts\n"
+        "loaded = lambda: sorted(m for m in sys.modules if m.startswith('app.templates.layouts.'))\n"
+        "assert loaded() == [], loaded()\n"
+        "layouts.QuoteTemplate\n"
+        "print(loaded())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True, text=True, check=True,
+    )
+    
+    assert result.stdout.strip().splitlines()[-1] == "['app.templates.layouts.quote']"
+
+def test_unknown_layout_raises_attribute_error():
+    import app.templates.layouts as layouts
+    
+    with pytest.raises(AttributeError):
+        layouts.NoSuchTemplate
+
+def test_template_instances_are_shared():
+    from app.templates import get_template_by_id
+    from app.templates.layouts import QuoteTemplate
+    
+    template = get_template_by_id("quote")
+    
+    assert isinstance(template, QuoteTemplate)
+    assert get_template_by_id("quote") is template
+    assert get_template_by_id("no_such_layout") is get_template_by_id("content")
+
+@pytest.mark.parametrize("content_type, expected", [
+    (SlideContentType.TITLE, "TitleTemplate"),
+    (SlideContentType.OVERVIEW, "ContentTemplate"),
+    (SlideContentType.CONTENT, "ContentTemplate"),
+    (SlideContentType.DIAGRAM, "DiagramTemplate"),
+    (SlideContentType.EQUATION, "ContentTemplate"),
+    (SlideContentType.IMAGE, "ContentTemplate"),
+    (SlideContentType.QUOTE, "QuoteTemplate"),
+    (SlideContentType.TWO_COLUMN, "TwoColumnTemplate"),
+    (SlideContentType.SECTION, "SectionTemplate"),
+    (SlideContentType.CONCLUSION, "ConclusionTemplate"),
+    ("quote", "QuoteTemplate"),
+    ("timeline", "TimelineTemplate"),
+    ("no_such_layout", "ContentTemplate"),
+])
+def test_template_selection_by_content_type(slide_data, content_type, expected):
+    from app.templates import select_template_for_slide
+    
+    # model_copy doesn't validate, so plain strings stand in for legacy slides
+    slide = slide_data.model_copy(update={"content_type": content_type})
+    
+    assert type(select_template_for_slide(slide)).__name__ == expected
+
+def test_special_content_takes_priority(slide_data):
+    from app.templates import select_template_for_slide
+    
+    slide = slide_data.model_copy(update={
+        "image_url": "http://img.com/1.jpg",
+        "diagram_mermaid": "graph TD",
+        "content_type": SlideContentType.QUOTE,
+    })
+    
+    assert type(select_template_for_slide(slide)).__name__ == "TwoColImageTemplate"
+
+def test_template_css_follows_theme_and_palette():
+    from app.themes import ColorPalette, create_custom_theme
+    
+    template = TitleTemplate()
+    
+    assert template.get_css(MODERN_THEME) == MODERN_THEME.to_css_variables()
+    assert "--color-primary: #123456" in template.get_css(MODERN_THEME, ColorPalette(primary="#123456"))
+    assert "--color-primary: #6366F1" in template.get_css(MODERN_THEME)
+    
+    # Custom themes share an id, so their palette must be part of the key
+    red = create_custom_theme("modern", ColorPalette(primary="#FF0000"))
+    blue = create_custom_theme("modern", ColorPalette(primary="#0000FF"))
+    assert "--color-primary: #FF0000" in template.get_css(red)
+    assert "--color-primary: #0000FF" in template.get_css(blue)
+
+def test_template_css_is_cached_per_theme_and_palette(monkeypatch):
+    from app.templates import base
+    
+    monkeypatch.setattr(base, "_THEME_CSS_CACHE", {})
+    first = ContentTemplate().get_css(MODERN_THEME)
+    second = TitleTemplate().get_css(MODERN_THEME.model_copy(deep=True))
+    TitleTemplate().get_css(MODERN_THEME, MODERN_THEME.colors.model_copy())
+    
+    assert second is first
+    assert len(base._THEME_CSS_CACHE) == 1